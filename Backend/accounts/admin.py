@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import User, Education, Certification, PredictionHistory, AdminLog
+from .models import User, Education, Certification, PredictionHistory, AdminLog, JobRole
 
 
 @admin.register(User)
@@ -13,3 +13,4 @@ admin.site.register(Education)
 admin.site.register(Certification)
 admin.site.register(PredictionHistory)
 admin.site.register(AdminLog)
+admin.site.register(JobRole)
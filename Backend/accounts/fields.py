@@ -0,0 +1,117 @@
+# accounts/fields.py
+from cryptography.fernet import InvalidToken
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+
+from .utils.encryption import encrypt_value, decrypt_value, decrypt_many, needs_rotation, rotate_value
+
+
+class Ciphertext(str):
+    """A token exactly as loaded from the database, not decrypted yet"""
+    __slots__ = ()
+
+
+class EncryptedAttribute(DeferredAttribute):
+    """
+    Decrypts on first attribute access and memoizes the plaintext on the
+    instance, so each value is decrypted at most once per instance and
+    rows whose field is never read pay nothing.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+
+        value = super().__get__(instance, cls)
+        if type(value) is Ciphertext:
+            plaintext = decrypt_value(value)
+            data = instance.__dict__
+            data[self.field.attname] = plaintext
+            data[self.field.token_cache_name] = (value, plaintext)
+            value = plaintext
+        return value
+
+    def __set__(self, instance, value):
+        # Being a data descriptor keeps __get__ in the loop after the
+        # value lands in the instance __dict__
+        instance.__dict__[self.field.attname] = value
+
+
+class EncryptedTextField(models.TextField):
+    """
+    TextField stored encrypted (Fernet or the compact "g1:" AES-GCM
+    format, see utils/encryption.py).
+
+    Assign and read plaintext; encryption happens on save. An unchanged
+    value is written back with its original token instead of being
+    re-encrypted, unless that token is in an old format or under a retired
+    key, in which case it is upgraded on this write.
+    values()/values_list() return the raw Ciphertext.
+    Ciphertext is randomized, so filter on the *_bidx blind index instead.
+    """
+    descriptor_class = EncryptedAttribute
+
+    @property
+    def token_cache_name(self):
+        return f"_{self.attname}_token"
+
+    def from_db_value(self, value, expression, connection):
+        if not value:
+            return value
+        return Ciphertext(value)
+
+    def pre_save(self, model_instance, add):
+        data = model_instance.__dict__
+        value = data.get(self.attname)
+        if not value:
+            return value
+        if type(value) is Ciphertext:
+            # Never read: upgrade straight from the token when it's stale
+            if needs_rotation(value):
+                try:
+                    value = data[self.attname] = Ciphertext(rotate_value(value))
+                except InvalidToken:
+                    # Legacy plaintext or a token no configured key reads:
+                    # write it back untouched rather than block the save
+                    pass
+            return value
+
+        cached = data.get(self.token_cache_name)
+        if cached is not None and cached[1] == value and not needs_rotation(cached[0]):
+            return cached[0]
+
+        token = Ciphertext(encrypt_value(value))
+        data[self.token_cache_name] = (token, value)
+        return token
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if not value:
+            return value
+        if type(value) is Ciphertext:
+            return str(value)
+        return encrypt_value(value)
+
+
+def decrypt_fields(instances, *field_names):
+    """
+    Batch-decrypt encrypted fields across many instances (e.g. an admin
+    list) with one decrypt_many call, memoizing plaintext on each instance
+    exactly like first attribute access would.
+    """
+    instances = list(instances)
+    for name in field_names:
+        field = instances[0]._meta.get_field(name) if instances else None
+        if field is None:
+            return instances
+
+        pending = [
+            obj for obj in instances
+            if type(obj.__dict__.get(field.attname)) is Ciphertext
+        ]
+        tokens = [obj.__dict__[field.attname] for obj in pending]
+        for obj, token, plaintext in zip(pending, tokens, decrypt_many(tokens)):
+            obj.__dict__[field.attname] = plaintext
+            obj.__dict__[field.token_cache_name] = (token, plaintext)
+
+    return instances
@@ -0,0 +1,116 @@
+import gzip
+import json
+import os
+import time
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import AdminLog, MaintenanceCheckpoint
+from accounts.services import adminlog_partitions
+
+CHECKPOINT_NAME = "archive_admin_logs"
+
+# Emails are copied in so archives stay readable after users are purged
+COLUMNS = [
+    "id", "timestamp", "action_type", "details", "is_flagged",
+    "admin_id", "admin__email", "target_user_id", "target_user__email",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Move AdminLog entries older than the retention period into gzipped "
+        "NDJSON archive files (one per month), oldest first and in batches. "
+        "Resumable: every batch is written and fsynced before it is deleted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.AUDIT_LOG_RETENTION_DAYS,
+                            help="Keep entries newer than this many days")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--output-dir", default=settings.AUDIT_LOG_ARCHIVE_DIR)
+        parser.add_argument("--rate", type=float, default=0,
+                            help="Max rows archived per second (0 = unthrottled)")
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Count the entries that would be archived")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        batch_size = options["batch_size"]
+        rate = options["rate"]
+        output_dir = options["output_dir"]
+
+        expired = AdminLog.objects.filter(timestamp__lt=cutoff)
+        total = expired.count()
+        if options["dry_run"]:
+            self.stdout.write(f"Dry run: {total} entries older than {cutoff:%Y-%m-%d} would be archived")
+            return
+
+        os.makedirs(output_dir, exist_ok=True)
+        checkpoint, _ = MaintenanceCheckpoint.objects.get_or_create(name=CHECKPOINT_NAME)
+        checkpoint.last_id = checkpoint.processed = checkpoint.changed = 0
+        checkpoint.finished_at = None
+        checkpoint.save()
+        self.stdout.write(f"{total} entries older than {cutoff:%Y-%m-%d} to archive into {output_dir}")
+        touched = set()
+
+        while True:
+            batch_started = time.monotonic()
+            rows = list(expired.order_by("timestamp", "id").values(*COLUMNS)[:batch_size])
+            if not rows:
+                break
+
+            # Written (and synced) before the delete: a crash in between
+            # means the next run archives the batch again, never that it's lost
+            files = self.write_batch(rows, output_dir)
+            touched.update(files)
+
+            with transaction.atomic():
+                batch = AdminLog.objects.filter(id__in=[r["id"] for r in rows], timestamp__lt=cutoff)
+                batch._raw_delete(batch.db)
+
+            checkpoint.last_id = rows[-1]["id"]
+            checkpoint.processed += len(rows)
+            checkpoint.changed = len(touched)
+            checkpoint.save()
+            self.stdout.write(
+                f"  {checkpoint.processed}/{total} archived "
+                f"(through {rows[-1]['timestamp']:%Y-%m-%d}, {', '.join(sorted(files))})"
+            )
+
+            if rate:
+                time.sleep(max(0.0, len(rows) / rate - (time.monotonic() - batch_started)))
+
+        if adminlog_partitions.is_partitioned():
+            for name in adminlog_partitions.drop_expired_partitions(cutoff):
+                self.stdout.write(f"  dropped empty partition {name}")
+
+        checkpoint.finished_at = timezone.now()
+        checkpoint.save()
+        self.stdout.write(self.style.SUCCESS(
+            f"Archived {checkpoint.processed} entries into {len(touched)} files."
+        ))
+
+    @staticmethod
+    def write_batch(rows, output_dir):
+        """Append rows to their month's archive file; returns the file names."""
+        by_month = defaultdict(list)
+        for row in rows:
+            by_month[row["timestamp"].strftime("%Y-%m")].append(row)
+
+        for month, month_rows in by_month.items():
+            path = os.path.join(output_dir, f"adminlog-{month}.ndjson.gz")
+            # Appending adds a gzip member; gzip readers treat the file as one stream
+            with open(path, "ab") as raw:
+                with gzip.GzipFile(fileobj=raw, mode="ab") as gz:
+                    for row in month_rows:
+                        gz.write((json.dumps(row, cls=DjangoJSONEncoder) + "\n").encode())
+                raw.flush()
+                os.fsync(raw.fileno())
+        return [f"adminlog-{month}.ndjson.gz" for month in by_month]
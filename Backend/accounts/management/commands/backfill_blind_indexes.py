@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from accounts.fields import decrypt_fields
+from accounts.models import Education
+
+
+class Command(BaseCommand):
+    help = "Populate Education blind-index columns in batches (keyset paginated by id)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--all", action="store_true",
+                            help="Recompute every row, e.g. after changing BLIND_INDEX_KEY")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        fields = [f"{f}_bidx" for f in Education.BLIND_INDEXED_FIELDS]
+
+        queryset = Education.objects.all()
+        if not options["all"]:
+            missing = Q()
+            for field in Education.BLIND_INDEXED_FIELDS:
+                missing |= Q(**{f"{field}_bidx": ""}) & ~Q(**{field: ""}) & Q(**{f"{field}__isnull": False})
+            queryset = queryset.filter(missing)
+
+        last_id = 0
+        updated = 0
+        while True:
+            batch = list(
+                queryset.filter(id__gt=last_id)
+                .order_by("id")
+                .only("id", *Education.BLIND_INDEXED_FIELDS, *fields)[:batch_size]
+            )
+            if not batch:
+                break
+
+            decrypt_fields(batch, *Education.BLIND_INDEXED_FIELDS)
+            for education in batch:
+                education.refresh_blind_indexes(force=True)
+
+            with transaction.atomic():
+                Education.objects.bulk_update(batch, fields)
+
+            last_id = batch[-1].id
+            updated += len(batch)
+            self.stdout.write(f"  {updated} rows updated (last id {last_id})")
+
+        self.stdout.write(self.style.SUCCESS(f"Blind indexes backfilled for {updated} education rows"))
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from accounts.models import PredictionHistory, PredictionRole
+
+
+class Command(BaseCommand):
+    help = "Create PredictionRole rows for history rows that have none (keyset paginated by id)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = PredictionHistory.objects.filter(
+            ~Exists(PredictionRole.objects.filter(prediction=OuterRef("pk")))
+        ).only("id", "predicted_roles", "confidence_scores", "missing_skills", "timestamp")
+
+        last_id = 0
+        predictions = roles = 0
+        while True:
+            batch = list(queryset.filter(id__gt=last_id).order_by("id")[:batch_size])
+            if not batch:
+                break
+
+            rows = [row for prediction in batch for row in prediction.role_rows()]
+            with transaction.atomic():
+                PredictionRole.objects.bulk_create(rows, ignore_conflicts=True)
+
+            last_id = batch[-1].id
+            predictions += len(batch)
+            roles += len(rows)
+            self.stdout.write(f"  {predictions} predictions backfilled (last id {last_id})")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {roles} role rows for {predictions} predictions"
+        ))
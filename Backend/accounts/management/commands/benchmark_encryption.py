@@ -0,0 +1,83 @@
+import random
+import sqlite3
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.utils.encryption import decrypt_token, encrypt_as
+
+DEGREES = ["B.Tech", "B.E", "BCA", "MCA", "M.Tech", "B.Sc", "M.Sc", "MBA"]
+SPECIALIZATIONS = [
+    "CS", "IT", "ECE", "Computer Science", "Data Science",
+    "Artificial Intelligence and Machine Learning", "Mechanical",
+]
+UNIVERSITIES = [
+    "Anna University", "VIT", "IIT Madras", "Delhi University",
+    "Savitribai Phule Pune University", "Jawaharlal Nehru Technological University Hyderabad",
+]
+
+FORMATS = ("fernet", "gcm")
+
+
+class Command(BaseCommand):
+    help = "Compare Fernet and compact AES-GCM tokens: throughput and storage on a synthetic Education table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        rows = [
+            (rng.choice(DEGREES), rng.choice(SPECIALIZATIONS), rng.choice(UNIVERSITIES))
+            for _ in range(options["rows"])
+        ]
+        values = [v for row in rows for v in row]
+        plain_bytes = sum(len(v.encode()) for v in values)
+
+        self.stdout.write(
+            f"{len(rows)} rows x 3 columns, {plain_bytes / len(values):.1f} plaintext bytes per value\n"
+        )
+        self.stdout.write(
+            f"{'format':<8} {'encrypt/s':>12} {'decrypt/s':>12} {'avg token':>10} {'table size':>12}"
+        )
+
+        baseline = None
+        for fmt in FORMATS:
+            started = time.perf_counter()
+            tokens = [encrypt_as(v, fmt) for v in values]
+            encrypt_rate = len(values) / (time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for token in tokens:
+                decrypt_token(token)
+            decrypt_rate = len(values) / (time.perf_counter() - started)
+
+            avg_token = sum(len(t) for t in tokens) / len(tokens)
+            table_bytes = self._table_size([tokens[i:i + 3] for i in range(0, len(tokens), 3)])
+            baseline = baseline or table_bytes
+
+            self.stdout.write(
+                f"{fmt:<8} {encrypt_rate:>12,.0f} {decrypt_rate:>12,.0f} "
+                f"{avg_token:>9.1f}B {table_bytes / 1024:>10,.0f}KB"
+                + (f"  ({table_bytes / baseline:.0%} of fernet)" if fmt != "fernet" else "")
+            )
+
+    @staticmethod
+    def _table_size(rows):
+        """On-disk size of the three encrypted TEXT columns in a scratch SQLite table"""
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.execute(
+                "CREATE TABLE education (id INTEGER PRIMARY KEY, degree TEXT, specialization TEXT, university TEXT)"
+            )
+            conn.executemany(
+                "INSERT INTO education (degree, specialization, university) VALUES (?, ?, ?)", rows
+            )
+            conn.commit()
+            conn.execute("VACUUM")
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            return page_count * page_size
+        finally:
+            conn.close()
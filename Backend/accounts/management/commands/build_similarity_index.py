@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.models import User, ProfileFeatureVector
+from accounts.services.ml_predictor import (
+    load_model,
+    build_feature_frame,
+    predict_jobs,
+    prediction_input_for_user,
+)
+from accounts.services.similar_students import build_index, store_feature_vector
+
+
+class Command(BaseCommand):
+    help = "Build (or incrementally refresh) the similar-students k-NN index."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true",
+                            help="Rebuild from scratch instead of applying changed profiles")
+        parser.add_argument("--materialize", action="store_true",
+                            help="First encode profiles that have no vector for the current model")
+
+    def handle(self, *args, **options):
+        if options["materialize"]:
+            self._materialize()
+
+        try:
+            index, mode = build_index(full=options["full"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{mode.capitalize()} build: {index.size} profiles indexed for model {index.model_version}"
+        ))
+
+    def _materialize(self):
+        models = load_model()
+        current = ProfileFeatureVector.objects.filter(model_version=models["version"])
+        users = (
+            User.objects.filter(educations__isnull=False)
+            .exclude(id__in=current.values("user_id"))
+            .distinct()
+        )
+
+        count = 0
+        for user in users.iterator(chunk_size=500):
+            data = prediction_input_for_user(user)
+            if data is None:
+                continue
+            features = build_feature_frame(data, models)
+            predictions = predict_jobs(data, features=features)
+            store_feature_vector(
+                user, features, models["version"],
+                predictions[0]["job_role"] if predictions else "",
+            )
+            count += 1
+            if count % 500 == 0:
+                self.stdout.write(f"  {count} profiles encoded...")
+
+        self.stdout.write(f"Encoded {count} profiles")
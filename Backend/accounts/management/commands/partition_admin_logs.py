@@ -0,0 +1,42 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from accounts.services import adminlog_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "PostgreSQL only: convert the AdminLog table to monthly range "
+        "partitions (--convert, once), or create the upcoming months' "
+        "partitions on an already partitioned table (run monthly)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--convert", action="store_true",
+                            help="Rebuild the table as a partitioned table (locks it during the copy)")
+        parser.add_argument("--months-ahead", type=int, default=3)
+        parser.add_argument("--keep-old", action="store_true",
+                            help="Keep the unpartitioned copy as <table>_old after --convert")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("AdminLog partitioning needs PostgreSQL")
+
+        months_ahead = options["months_ahead"]
+        if adminlog_partitions.is_partitioned():
+            created = adminlog_partitions.ensure_partitions(date.today(), months_ahead)
+            self.stdout.write(self.style.SUCCESS(
+                f"Created {len(created)} partitions" + (f": {', '.join(created)}" if created else "")
+            ))
+            return
+
+        if not options["convert"]:
+            raise CommandError("AdminLog is not partitioned yet; run with --convert first")
+
+        adminlog_partitions.convert_to_partitioned(months_ahead, keep_old=options["keep_old"])
+        months = adminlog_partitions.partitions()
+        self.stdout.write(self.style.SUCCESS(
+            f"AdminLog is now partitioned by month ({len(months)} partitions + default)"
+        ))
@@ -0,0 +1,75 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from accounts.models import PredictionHistory, PredictionExplanation
+from accounts.services.ml_predictor import (
+    load_model,
+    build_feature_frame,
+    feature_fingerprint,
+    prediction_input_for_user,
+)
+from accounts.services.ml_explainer import compute_explanation
+
+
+class Command(BaseCommand):
+    help = "Precompute SHAP explanations for recent predictions with the current model."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=7,
+                            help="Only predictions from the last N days (default 7)")
+        parser.add_argument("--limit", type=int, default=None,
+                            help="Stop after computing N explanations")
+
+    def handle(self, *args, **options):
+        models = load_model()
+        version = models["version"]
+        since = timezone.now() - timedelta(days=options["days"])
+
+        done = set(
+            PredictionExplanation.objects.filter(model_version=version)
+            .values_list("feature_fingerprint", flat=True)
+        )
+
+        # Newest prediction per user is the one worth explaining
+        predictions = (
+            PredictionHistory.objects.filter(timestamp__gte=since)
+            .exclude(feature_fingerprint="")
+            .select_related("user")
+            .order_by("user_id", "-timestamp")
+        )
+
+        computed = skipped = 0
+        seen_users = set()
+        for prediction in predictions.iterator(chunk_size=500):
+            if prediction.user_id in seen_users:
+                continue
+            seen_users.add(prediction.user_id)
+
+            if prediction.feature_fingerprint in done:
+                continue
+
+            data = prediction_input_for_user(prediction.user)
+            if data is None:
+                skipped += 1
+                continue
+
+            features = build_feature_frame(data, models)
+            fingerprint = feature_fingerprint(features)
+            if fingerprint != prediction.feature_fingerprint:
+                skipped += 1
+                continue
+
+            compute_explanation(features, fingerprint, version)
+            done.add(fingerprint)
+            computed += 1
+            if computed % 50 == 0:
+                self.stdout.write(f"  {computed} explanations computed...")
+
+            if options["limit"] and computed >= options["limit"]:
+                break
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Computed {computed} explanations for model {version} ({skipped} skipped)"
+        ))
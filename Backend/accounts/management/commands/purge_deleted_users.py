@@ -0,0 +1,75 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from accounts.models import MaintenanceCheckpoint, User
+from accounts.services.user_purge import purge_user
+
+CHECKPOINT_NAME = "purge_deleted_users"
+
+
+class Command(BaseCommand):
+    help = (
+        "Permanently remove soft-deleted users. Dependent rows are deleted in "
+        "bounded batches without loading them; resumable and rate-limited."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--rate", type=float, default=5000,
+                            help="Max rows deleted per second (0 = unthrottled)")
+        parser.add_argument("--grace-days", type=int, default=0,
+                            help="Only purge users deleted at least this many days ago")
+        parser.add_argument("--restart", action="store_true",
+                            help="Reset the saved counters and start from the first user")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        rate = options["rate"]
+        cutoff = timezone.now() - timedelta(days=options["grace_days"])
+
+        checkpoint, _ = MaintenanceCheckpoint.objects.get_or_create(name=CHECKPOINT_NAME)
+        if options["restart"] or checkpoint.finished_at:
+            checkpoint.last_id = checkpoint.processed = checkpoint.changed = 0
+            checkpoint.finished_at = None
+        elif checkpoint.last_id:
+            # The interrupted user is still pending and gets picked up first
+            self.stdout.write(f"Resuming at user {checkpoint.last_id}")
+
+        pending = User.objects.filter(deleted_at__isnull=False, deleted_at__lte=cutoff)
+        total = pending.count()
+        self.stdout.write(f"{total} soft-deleted users to purge")
+
+        batch_started = [time.monotonic()]
+        rows_before = [0]
+
+        def progress(model, deleted):
+            # Sleep off whatever time the batch was "ahead" of the rate limit
+            if rate:
+                batch_rows = deleted - rows_before[0]
+                time.sleep(max(0.0, batch_rows / rate - (time.monotonic() - batch_started[0])))
+            rows_before[0] = deleted
+            batch_started[0] = time.monotonic()
+            self.stdout.write(f"    {model.__name__}: {deleted} rows deleted so far")
+
+        user_ids = list(pending.order_by("id").values_list("id", flat=True))
+        for done, user_id in enumerate(user_ids, start=1):
+            checkpoint.last_id = user_id
+            checkpoint.save()
+
+            rows_before[0] = 0
+            batch_started[0] = time.monotonic()
+            deleted = purge_user(user_id, batch_size=batch_size, progress=progress)
+
+            checkpoint.processed += 1
+            checkpoint.changed += deleted
+            checkpoint.save()
+            self.stdout.write(f"  user {user_id} purged ({deleted} rows), {done}/{total}")
+
+        checkpoint.finished_at = timezone.now()
+        checkpoint.save()
+        self.stdout.write(self.style.SUCCESS(
+            f"Purge finished: {checkpoint.processed} users, {checkpoint.changed} dependent rows removed."
+        ))
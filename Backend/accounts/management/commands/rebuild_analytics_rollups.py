@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from accounts.services.analytics_rollup import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Recompute the analytics rollup tables from PredictionHistory and User."
+
+    def handle(self, *args, **options):
+        counts = rebuild_rollups()
+        self.stdout.write(self.style.SUCCESS(
+            "Rollups rebuilt: " + ", ".join(f"{n} {name}" for name, n in counts.items())
+        ))
@@ -0,0 +1,140 @@
+import logging
+import time
+
+from cryptography.fernet import InvalidToken
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.fields import Ciphertext, EncryptedTextField
+from accounts.models import Education, MaintenanceCheckpoint
+from accounts.utils import encryption
+from accounts.utils.encryption import needs_rotation, rotate_value
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_NAME = "rotate_encryption_keys:education"
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-encrypt Education fields under the primary key in FERNET_KEYS "
+        "and the current ENCRYPTION_FORMAT. "
+        "Keyset-paginated, rate-limited and resumable; safe to run on a live table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--rate", type=float, default=1000,
+                            help="Max rows scanned per second (0 = unthrottled)")
+        parser.add_argument("--restart", action="store_true",
+                            help="Ignore the saved checkpoint and start from the first row")
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Count rows that need rotation without writing")
+
+    def handle(self, *args, **options):
+        if len(encryption.FERNET_KEYS) < 2:
+            self.stdout.write(
+                f"One key configured; only converting tokens to the {encryption.ENCRYPTION_FORMAT} format."
+            )
+
+        batch_size = options["batch_size"]
+        rate = options["rate"]
+        dry_run = options["dry_run"]
+        fields = [
+            f.attname for f in Education._meta.concrete_fields
+            if isinstance(f, EncryptedTextField)
+        ]
+
+        checkpoint, _ = MaintenanceCheckpoint.objects.get_or_create(name=CHECKPOINT_NAME)
+        if options["restart"] or checkpoint.finished_at:
+            checkpoint.last_id = checkpoint.processed = checkpoint.changed = 0
+            checkpoint.finished_at = None
+        if dry_run:
+            checkpoint.last_id = checkpoint.processed = checkpoint.changed = 0
+        elif checkpoint.last_id:
+            self.stdout.write(f"Resuming after id {checkpoint.last_id}")
+
+        remaining = Education.objects.filter(id__gt=checkpoint.last_id).count()
+        verb = "need rotation" if dry_run else "re-encrypted"
+        started = time.monotonic()
+        scanned = 0
+        skipped = []
+
+        while True:
+            batch_started = time.monotonic()
+            rows = list(
+                Education.objects.filter(id__gt=checkpoint.last_id)
+                .order_by("id")
+                .values_list("id", *fields)[:batch_size]
+            )
+            if not rows:
+                break
+
+            updates = []
+            for row in rows:
+                changes = {}
+                unreadable = []
+                for field, token in zip(fields, row[1:]):
+                    if not token or not needs_rotation(token):
+                        continue
+                    try:
+                        changes[field] = (token, Ciphertext(rotate_value(token)))
+                    except InvalidToken:
+                        # Legacy plaintext or a token under a key we no longer have
+                        unreadable.append(field)
+                if unreadable:
+                    skipped.append(row[0])
+                    logger.warning("Education %s: cannot decrypt %s, left as-is", row[0], ", ".join(unreadable))
+                if changes:
+                    updates.append((row[0], changes))
+
+            if updates and not dry_run:
+                # Short per-batch transaction; each row is only rewritten if its
+                # tokens are still the ones we read, so concurrent edits win
+                with transaction.atomic():
+                    for pk, changes in updates:
+                        Education.objects.filter(
+                            pk=pk, **{f: old for f, (old, _) in changes.items()}
+                        ).update(**{f: new for f, (_, new) in changes.items()})
+
+            checkpoint.last_id = rows[-1][0]
+            checkpoint.processed += len(rows)
+            checkpoint.changed += len(updates)
+            if not dry_run:
+                checkpoint.save()
+
+            scanned += len(rows)
+            elapsed = time.monotonic() - started
+            speed = scanned / elapsed if elapsed else 0
+            eta = (remaining - scanned) / speed if speed else 0
+            self.stdout.write(
+                f"  {scanned}/{remaining} rows scanned, {checkpoint.changed} {verb} "
+                f"(last id {checkpoint.last_id}, {speed:.0f} rows/s, ~{max(eta, 0):.0f}s left)"
+            )
+
+            if rate:
+                # Sleep off whatever time the batch was "ahead" of the rate limit
+                time.sleep(max(0.0, len(rows) / rate - (time.monotonic() - batch_started)))
+
+        if skipped:
+            self.stdout.write(self.style.WARNING(
+                f"{len(skipped)} rows have values no configured key can decrypt and were left as-is "
+                f"(ids: {', '.join(map(str, skipped))})"
+            ))
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(
+                f"Dry run: {checkpoint.changed} of {checkpoint.processed} rows need rotation"
+            ))
+            return
+
+        checkpoint.finished_at = timezone.now()
+        checkpoint.save()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rotation finished: {checkpoint.changed} of {checkpoint.processed} rows re-encrypted."
+        ))
+        if len(encryption.FERNET_KEYS) > 1:
+            self.stdout.write(
+                "The old key can be dropped from FERNET_KEYS once every worker runs with the new list."
+            )
@@ -0,0 +1,47 @@
+# Generated by Django 6.0 on 2026-10-19 05:08
+
+from django.db import migrations, models
+
+
+def seed_catalog(apps, schema_editor):
+    from accounts.services.job_skill_map import JOB_REQUIRED_SKILLS
+
+    JobRole = apps.get_model("accounts", "JobRole")
+    SkillCatalogVersion = apps.get_model("accounts", "SkillCatalogVersion")
+
+    JobRole.objects.bulk_create(
+        [JobRole(name=name, required_skills=skills) for name, skills in JOB_REQUIRED_SKILLS.items()],
+        ignore_conflicts=True,
+    )
+    SkillCatalogVersion.objects.update_or_create(pk=1, defaults={"version": 1})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_prediction_explanation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobRole',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('required_skills', models.JSONField(blank=True, default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SkillCatalogVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(seed_catalog, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-19 05:09
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_job_role_skill_catalog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileFeatureVector',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_version', models.CharField(max_length=32)),
+                ('vector', models.BinaryField()),
+                ('top_role', models.CharField(blank=True, max_length=100)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='feature_vector', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-19 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_profile_feature_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='education',
+            name='degree_bidx',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='education',
+            name='specialization_bidx',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='education',
+            name='university_bidx',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64),
+        ),
+    ]
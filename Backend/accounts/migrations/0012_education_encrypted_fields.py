@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-19 05:12
+
+import accounts.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_education_blind_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='education',
+            name='degree',
+            field=accounts.fields.EncryptedTextField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='education',
+            name='specialization',
+            field=accounts.fields.EncryptedTextField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='education',
+            name='university',
+            field=accounts.fields.EncryptedTextField(blank=True, null=True),
+        ),
+    ]
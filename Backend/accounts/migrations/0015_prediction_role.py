@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-19 05:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0014_analytics_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PredictionRole',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('job_role', models.CharField(max_length=100)),
+                ('confidence', models.FloatField()),
+                ('missing_skill_count', models.PositiveSmallIntegerField(default=0)),
+                ('created', models.DateTimeField(db_index=True)),
+                ('prediction', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='roles', to='accounts.predictionhistory')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['job_role', 'created'], name='accounts_pr_job_rol_bc2c88_idx')],
+                'unique_together': {('prediction', 'rank')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-19 05:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0015_prediction_role'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='predictionhistory',
+            name='timestamp',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='date_joined',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
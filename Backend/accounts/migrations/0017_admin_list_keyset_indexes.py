@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-19 05:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0016_timeseries_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='adminlog',
+            index=models.Index(fields=['-timestamp', '-id'], name='adminlog_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='predictionfeedback',
+            index=models.Index(fields=['-created_at', '-id'], name='feedback_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supportticket',
+            index=models.Index(fields=['-created_at', '-id'], name='ticket_keyset_idx'),
+        ),
+    ]
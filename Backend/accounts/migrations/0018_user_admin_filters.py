@@ -0,0 +1,50 @@
+# Generated by Django 6.0 on 2026-10-19 05:24
+
+from django.db import migrations, models
+
+# Case-insensitive prefix search (istartswith) needs a vendor-specific index:
+# PostgreSQL compares UPPER(col::text) with LIKE, which needs text_pattern_ops;
+# SQLite's LIKE optimization needs a NOCASE index.
+PREFIX_INDEXES = (
+    ("user_email_prefix_idx", "email"),
+    ("user_name_prefix_idx", "name"),
+)
+
+
+def create_prefix_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for name, column in PREFIX_INDEXES:
+        if vendor == "postgresql":
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS {name} ON accounts_user (UPPER("{column}"::text) text_pattern_ops)'
+            )
+        elif vendor == "sqlite":
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS {name} ON accounts_user ("{column}" COLLATE NOCASE)'
+            )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor in ("postgresql", "sqlite"):
+        for name, _ in PREFIX_INDEXES:
+            schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0017_admin_list_keyset_indexes'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', '-id'], name='user_role_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_flagged', True)), fields=['is_flagged'], name='user_flagged_idx'),
+        ),
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-19 05:29
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0019_user_soft_delete'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='adminlog',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
@@ -0,0 +1,58 @@
+from django.db import migrations
+
+# Hand-written migration. Full-text search over support tickets, see
+# accounts/services/ticket_search.py. SQLite gets an FTS5 table (rowid =
+# ticket id) filled here and kept in sync by signals; PostgreSQL a generated
+# weighted tsvector column with a GIN index.
+
+FTS_TABLE = "accounts_supportticket_fts"
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(
+            "ALTER TABLE accounts_supportticket ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            "GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(subject, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(message, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(admin_reply, '')), 'C')"
+            ") STORED"
+        )
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS supportticket_search_idx "
+            "ON accounts_supportticket USING GIN (search_vector)"
+        )
+    elif vendor == "sqlite":
+        try:
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+                f"USING fts5(subject, message, admin_reply, tokenize='porter unicode61')"
+            )
+        except Exception:
+            # SQLite built without FTS5: search falls back to a plain scan
+            return
+        schema_editor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, subject, message, admin_reply) "
+            f"SELECT id, subject, message, coalesce(admin_reply, '') FROM accounts_supportticket"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS supportticket_search_idx")
+        schema_editor.execute("ALTER TABLE accounts_supportticket DROP COLUMN IF EXISTS search_vector")
+    elif vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0020_adminlog_timestamp_default'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-19 05:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0021_supportticket_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='supportticket',
+            index=models.Index(fields=['status', 'created_at'], name='ticket_status_created_idx'),
+        ),
+    ]
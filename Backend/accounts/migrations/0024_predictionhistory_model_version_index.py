@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 06:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0023_user_profile_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='predictionhistory',
+            name='model_version',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=32),
+        ),
+    ]
@@ -1,7 +1,11 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 import decimal
 
+from .fields import EncryptedTextField, Ciphertext
+
 
 class UserManager(BaseUserManager):
     def create_user(self, email, name="", password=None, role="student", **extra_fields):
@@ -26,24 +30,55 @@ class User(AbstractBaseUser, PermissionsMixin):
     role = models.CharField(max_length=10, default="student")
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
-    date_joined = models.DateTimeField(auto_now_add=True)  
+    date_joined = models.DateTimeField(auto_now_add=True, db_index=True)  
     skills = models.JSONField(default=list, blank=True)
     objects = UserManager()
     is_flagged = models.BooleanField(default=False)
     flag_reason = models.CharField(max_length=255, blank=True)
+    # Soft delete: the account is deactivated at once and its rows are
+    # removed later in batches by the purge_deleted_users command
+    deleted_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    # Bumped on every write to the user's profile (see signals.py);
+    # ProfileView derives its ETag/Last-Modified from these
+    profile_version = models.PositiveIntegerField(default=0)
+    profile_updated_at = models.DateTimeField(default=timezone.now)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["name"]
 
+    ROLES = ("student", "admin")
+
+    class Meta:
+        indexes = [
+            # Admin user list filters (role + newest first)
+            models.Index(fields=["role", "-id"], name="user_role_id_idx"),
+            models.Index(fields=["is_flagged"], condition=models.Q(is_flagged=True), name="user_flagged_idx"),
+        ]
+        # Case-insensitive prefix indexes on email/name are vendor specific,
+        # see migration 0018_user_admin_filters
+
+    @classmethod
+    def bump_profile_version(cls, *user_ids):
+        cls.objects.filter(pk__in=user_ids).update(
+            profile_version=F("profile_version") + 1,
+            profile_updated_at=timezone.now(),
+        )
+
     def __str__(self) -> str:
         return self.email
 
 
 class Education(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="educations")
-    degree = models.TextField(blank=True, null=True)
-    specialization = models.TextField(blank=True, null=True)
-    university = models.TextField(blank=True, null=True)
+    degree = EncryptedTextField(blank=True, null=True)
+    specialization = EncryptedTextField(blank=True, null=True)
+    university = EncryptedTextField(blank=True, null=True)
+
+    # HMAC blind indexes of the decrypted values, for SQL grouping/lookups
+    degree_bidx = models.CharField(max_length=64, blank=True, default="", db_index=True)
+    specialization_bidx = models.CharField(max_length=64, blank=True, default="", db_index=True)
+    university_bidx = models.CharField(max_length=64, blank=True, default="", db_index=True)
+
     cgpa = models.DecimalField(
         max_digits=4,
         decimal_places=2, 
@@ -68,8 +103,25 @@ class Education(models.Model):
                         self.cgpa = None
             except (ValueError, TypeError, decimal.InvalidOperation):
                 self.cgpa = None
+        self.refresh_blind_indexes()
         super().save(*args, **kwargs)
 
+    BLIND_INDEXED_FIELDS = ("degree", "specialization", "university")
+
+    def refresh_blind_indexes(self, force=False):
+        """
+        Recompute the *_bidx columns from the (decrypted) field values.
+        Fields still holding their untouched database token are skipped
+        unless forced, so a plain save() doesn't decrypt anything.
+        """
+        from .utils.encryption import blind_index
+
+        for field in self.BLIND_INDEXED_FIELDS:
+            bidx_field = f"{field}_bidx"
+            if not force and type(self.__dict__.get(field)) is Ciphertext and getattr(self, bidx_field):
+                continue
+            setattr(self, bidx_field, blind_index(getattr(self, field)))
+
     def __str__(self) -> str:
         return f"{self.user.email} - {self.degree if self.degree else 'No Degree'}"
 
@@ -89,12 +141,96 @@ class PredictionHistory(models.Model):
     predicted_roles = models.JSONField()
     confidence_scores = models.JSONField()
     missing_skills = models.JSONField(default=list)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    feature_fingerprint = models.CharField(max_length=64, blank=True, default="")
+    model_version = models.CharField(max_length=32, blank=True, default="", db_index=True)
+    timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def save(self, *args, **kwargs):
+        # The normalized PredictionRole rows commit or roll back with the history row
+        adding = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                PredictionRole.objects.bulk_create(self.role_rows())
+            else:
+                self.sync_roles()
+
+    def role_rows(self):
+        """Unsaved PredictionRole rows mirroring the parallel JSON lists"""
+        missing = self.missing_skills or []
+        return [
+            PredictionRole(
+                prediction=self,
+                rank=rank,
+                job_role=job,
+                confidence=float(conf),
+                missing_skill_count=len(missing[rank]) if rank < len(missing) else 0,
+                created=self.timestamp,
+            )
+            for rank, (job, conf) in enumerate(zip(self.predicted_roles or [], self.confidence_scores or []))
+        ]
+
+    def sync_roles(self):
+        self.roles.all().delete()
+        PredictionRole.objects.bulk_create(self.role_rows())
 
     def __str__(self) -> str:
         return f"{self.user.email} - {self.predicted_roles}"
 
 
+class PredictionRole(models.Model):
+    """
+    One ranked role of a prediction, normalized out of PredictionHistory's
+    parallel JSON lists so job/confidence stats run as SQL aggregates.
+    """
+    prediction = models.ForeignKey(PredictionHistory, on_delete=models.CASCADE, related_name="roles")
+    rank = models.PositiveSmallIntegerField()
+    job_role = models.CharField(max_length=100)
+    confidence = models.FloatField()
+    missing_skill_count = models.PositiveSmallIntegerField(default=0)
+    created = models.DateTimeField(db_index=True)  # copy of prediction.timestamp
+
+    class Meta:
+        unique_together = ("prediction", "rank")
+        indexes = [models.Index(fields=["job_role", "created"])]
+
+    def __str__(self):
+        return f"{self.prediction_id}#{self.rank} {self.job_role}"
+
+
+class PredictionExplanation(models.Model):
+    """
+    Cached TreeSHAP explanation for one encoded feature row.
+    Keyed by feature fingerprint + model version, so identical profiles
+    share one entry and a retrain naturally invalidates old ones.
+    """
+    feature_fingerprint = models.CharField(max_length=64)
+    model_version = models.CharField(max_length=32)
+    explanation = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("feature_fingerprint", "model_version")
+
+    def __str__(self) -> str:
+        return f"{self.model_version} - {self.feature_fingerprint[:12]}"
+
+
+class ProfileFeatureVector(models.Model):
+    """
+    Materialized encoded profile (float32 feature row) for one user,
+    used to build the similar-students index offline.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="feature_vector")
+    model_version = models.CharField(max_length=32)
+    vector = models.BinaryField()
+    top_role = models.CharField(max_length=100, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    def __str__(self) -> str:
+        return f"{self.user.email} - {self.model_version}"
+
+
 class AdminLog(models.Model):
     admin = models.ForeignKey(
         User,
@@ -126,12 +262,16 @@ class AdminLog(models.Model):
         help_text="Whether this log entry is flagged for review"
     )
 
+    # Set when the entry is built, not when a buffered write reaches the
+    # database (see services/audit_log.py)
     timestamp = models.DateTimeField(
-        auto_now_add=True
+        default=timezone.now,
+        editable=False
     )
 
     class Meta:
         ordering = ["-timestamp"]
+        indexes = [models.Index(fields=["-timestamp", "-id"], name="adminlog_keyset_idx")]
 
     def __str__(self):
         target = self.target_user.email if self.target_user else "System"
@@ -153,6 +293,9 @@ class PredictionFeedback(models.Model):
     comment = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["-created_at", "-id"], name="feedback_keyset_idx")]
+
     def __str__(self):
         return f"{self.user.email} - {self.rating}⭐"
 
@@ -171,6 +314,125 @@ class SupportTicket(models.Model):
     admin_reply = models.TextField(blank=True, null=True)
     replied_at = models.DateTimeField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="ticket_keyset_idx"),
+            # Support stats: backlog by status and age
+            models.Index(fields=["status", "created_at"], name="ticket_status_created_idx"),
+        ]
+
 
     def __str__(self):
         return self.subject
+
+
+class JobRole(models.Model):
+    """
+    Required skills per job role (replaces the hard-coded JOB_REQUIRED_SKILLS).
+    Every write bumps SkillCatalogVersion so workers recompile their index.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    required_skills = models.JSONField(default=list, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
+class SkillCatalogVersion(models.Model):
+    """Single-row counter, read on every index freshness check."""
+    version = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    SINGLETON_ID = 1
+
+    @classmethod
+    def current(cls):
+        return (
+            cls.objects.filter(pk=cls.SINGLETON_ID)
+            .values_list("version", flat=True)
+            .first()
+        ) or 0
+
+    @classmethod
+    def bump(cls):
+        updated = cls.objects.filter(pk=cls.SINGLETON_ID).update(version=F("version") + 1)
+        if not updated:
+            cls.objects.create(pk=cls.SINGLETON_ID, version=1)
+
+    def __str__(self):
+        return f"v{self.version}"
+
+
+class MaintenanceCheckpoint(models.Model):
+    """
+    Resume point of a long-running batched maintenance job
+    (keyset position plus running counters), one row per job name.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    last_id = models.BigIntegerField(default=0)
+    processed = models.BigIntegerField(default=0)
+    changed = models.BigIntegerField(default=0)
+    started_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        state = "done" if self.finished_at else f"at id {self.last_id}"
+        return f"{self.name} ({state})"
+
+
+# ---------------- ANALYTICS ROLLUPS ----------------
+# Maintained incrementally by accounts/services/analytics_rollup.py;
+# rebuild_analytics_rollups recomputes them from the source tables.
+
+class DailyPredictionStat(models.Model):
+    day = models.DateField(unique=True)
+    predictions = models.PositiveIntegerField(default=0)
+    confidence_sum = models.FloatField(default=0)
+    confidence_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["day"]
+
+    def __str__(self):
+        return f"{self.day}: {self.predictions}"
+
+
+class DailyRoleStat(models.Model):
+    """How often a job role appeared in predictions on one day"""
+    day = models.DateField()
+    job_role = models.CharField(max_length=100)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("day", "job_role")
+
+    def __str__(self):
+        return f"{self.day} {self.job_role}: {self.count}"
+
+
+class MonthlyActiveUser(models.Model):
+    """One row per user active (logged in or predicted) in a month"""
+    month = models.DateField()  # first day of the month
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="active_months")
+
+    class Meta:
+        unique_together = ("month", "user")
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} {self.user_id}"
+
+
+class MonthlyActivityStat(models.Model):
+    month = models.DateField(unique=True)  # first day of the month
+    active_users = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["month"]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m}: {self.active_users}"
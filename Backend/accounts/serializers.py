@@ -1,7 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
-from .models import User, Education, Certification, PredictionHistory, PredictionFeedback, SupportTicket
-from .utils.encryption import encrypt_value, decrypt_value
+from .models import User, Education, Certification, PredictionHistory, PredictionFeedback, SupportTicket, JobRole
 import decimal
 
 
@@ -98,32 +97,19 @@ class EducationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "degree", "specialization", "university", "cgpa"]
 
+    # Education's encrypted fields decrypt lazily (once per instance) on access
+
     def get_degree(self, obj):
         """Return decrypted degree value for display"""
-        if obj.degree:
-            try:
-                return decrypt_value(obj.degree)
-            except:
-                return obj.degree
-        return None
+        return obj.degree or None
 
     def get_specialization(self, obj):
         """Return decrypted specialization value for display"""
-        if obj.specialization:
-            try:
-                return decrypt_value(obj.specialization)
-            except:
-                return obj.specialization
-        return None
+        return obj.specialization or None
 
     def get_university(self, obj):
         """Return decrypted university value for display"""
-        if obj.university:
-            try:
-                return decrypt_value(obj.university)
-            except:
-                return obj.university
-        return None
+        return obj.university or None
 
     # ---------- Smart normalization helpers ----------
 
@@ -193,50 +179,30 @@ class EducationSerializer(serializers.ModelSerializer):
         if not normalized:  # If normalization returns empty (e.g., "Other" was selected)
             return ""
         
-        # Encrypt before saving
-        try:
-            return encrypt_value(normalized)
-        except Exception as e:
-            print(f"Degree encryption error: {e}")
-            return normalized
+        # Encrypted on save by EncryptedTextField
+        return normalized
 
     def validate_degree_other(self, value):
         """Validate custom degree when "Other" is selected"""
         if not value or not value.strip():
             return ""
         
-        normalized = value.strip().title()
-        
-        # Encrypt before saving
-        try:
-            return encrypt_value(normalized)
-        except Exception as e:
-            print(f"Degree (Other) encryption error: {e}")
-            return normalized
+        # Encrypted on save by EncryptedTextField
+        return value.strip().title()
 
     def validate_specialization_write(self, value):
-        """Validate and encrypt specialization input"""
+        """Validate and normalize specialization input"""
         if not value or not value.strip():
             return ""
-        normalized = self._normalize_text(value)
-        # Encrypt before saving
-        try:
-            return encrypt_value(normalized)
-        except Exception as e:
-            print(f"Specialization encryption error: {e}")
-            return normalized
+        # Encrypted on save by EncryptedTextField
+        return self._normalize_text(value)
 
     def validate_university_write(self, value):
-        """Validate and encrypt university input"""
+        """Validate and normalize university input"""
         if not value or not value.strip():
             return ""
-        normalized = self._normalize_text(value)
-        # Encrypt before saving
-        try:
-            return encrypt_value(normalized)
-        except Exception as e:
-            print(f"University encryption error: {e}")
-            return normalized
+        # Encrypted on save by EncryptedTextField
+        return self._normalize_text(value)
 
     def validate_cgpa_write(self, value):
         """
@@ -439,3 +405,30 @@ class SupportTicketSerializer(serializers.ModelSerializer):
         model = SupportTicket
         fields = "__all__"
         read_only_fields = ["user", "created_at"]
+
+
+class JobRoleSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = JobRole
+        fields = ["id", "name", "required_skills", "updated_at"]
+        read_only_fields = ["updated_at"]
+
+    def validate_name(self, value):
+        value = " ".join(value.split())
+        if not value:
+            raise serializers.ValidationError("Role name is required.")
+        return value
+
+    def validate_required_skills(self, value):
+        if not isinstance(value, list) or not all(isinstance(s, str) for s in value):
+            raise serializers.ValidationError("required_skills must be a list of strings.")
+
+        # Drop blanks and case-insensitive duplicates, keep first spelling
+        seen = set()
+        skills = []
+        for skill in value:
+            skill = " ".join(skill.split())
+            if skill and skill.lower() not in seen:
+                seen.add(skill.lower())
+                skills.append(skill)
+        return skills
@@ -0,0 +1,152 @@
+# accounts/services/adminlog_partitions.py
+"""
+Optional monthly range partitioning of the AdminLog table on PostgreSQL.
+
+Partitions are named <table>_pYYYYMM plus a <table>_pdefault catch-all.
+Nothing here runs on other databases; is_partitioned() is simply False.
+"""
+import re
+from datetime import date
+
+from django.db import connection, transaction
+
+PARTITION_RE = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+def _table():
+    from accounts.models import AdminLog
+
+    return AdminLog._meta.db_table
+
+
+def _next_month(month):
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def is_partitioned():
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE relname = %s", [_table()])
+        row = cursor.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+def partitions():
+    """{month (first day): partition name} of the monthly partitions."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent WHERE p.relname = %s",
+            [_table()],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    result = {}
+    for name in names:
+        match = PARTITION_RE.search(name)
+        if match:
+            result[date(int(match[1]), int(match[2]), 1)] = name
+    return result
+
+
+def ensure_partitions(start, months_ahead=3):
+    """Create missing monthly partitions from `start` through months_ahead past today."""
+    table = _table()
+    qn = connection.ops.quote_name
+    existing = partitions()
+
+    month = start.replace(day=1)
+    last = date.today().replace(day=1)
+    for _ in range(months_ahead):
+        last = _next_month(last)
+
+    created = []
+    with connection.cursor() as cursor:
+        while month <= last:
+            if month not in existing:
+                name = f"{table}_p{month:%Y%m}"
+                cursor.execute(
+                    f"CREATE TABLE {qn(name)} PARTITION OF {qn(table)} "
+                    f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') TO ('{_next_month(month).isoformat()} 00:00+00')"
+                )
+                created.append(name)
+            month = _next_month(month)
+    return created
+
+
+def drop_expired_partitions(cutoff):
+    """
+    Drop monthly partitions that end at or before `cutoff` and are empty
+    (i.e. already archived). Returns the dropped partition names.
+    """
+    qn = connection.ops.quote_name
+    dropped = []
+    with connection.cursor() as cursor:
+        for month, name in sorted(partitions().items()):
+            if _next_month(month) > cutoff.date():
+                continue
+            cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {qn(name)})")
+            if not cursor.fetchone()[0]:
+                cursor.execute(f"DROP TABLE {qn(name)}")
+                dropped.append(name)
+    return dropped
+
+
+def convert_to_partitioned(months_ahead=3, keep_old=False):
+    """
+    Rebuild the AdminLog table as a table partitioned by month on
+    "timestamp", copying the existing rows. Runs in one transaction under
+    an exclusive lock, so writers wait for the copy.
+
+    The primary key becomes (id, timestamp), as PostgreSQL requires the
+    partition key in unique constraints; ids still come from one sequence.
+    Nothing references AdminLog by foreign key, so Django is unaffected.
+    """
+    from accounts.models import AdminLog, User
+
+    table = _table()
+    qn = connection.ops.quote_name
+    new, old, seq = f"{table}_new", f"{table}_old", f"{table}_part_id_seq"
+    user_table = User._meta.db_table
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {qn(table)} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(f"SELECT MIN(\"timestamp\"), COALESCE(MAX(id), 0) FROM {qn(table)}")
+        oldest, max_id = cursor.fetchone()
+
+        cursor.execute(f"CREATE SEQUENCE {qn(seq)}")
+        cursor.execute(
+            f"CREATE TABLE {qn(new)} (LIKE {qn(table)} INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE (\"timestamp\")"
+        )
+        cursor.execute(f"ALTER TABLE {qn(new)} ALTER COLUMN id SET DEFAULT nextval('{seq}')")
+        cursor.execute(f"ALTER SEQUENCE {qn(seq)} OWNED BY {qn(new)}.id")
+        cursor.execute(f"ALTER TABLE {qn(new)} ADD PRIMARY KEY (id, \"timestamp\")")
+        for column in ("admin_id", "target_user_id"):
+            cursor.execute(
+                f"ALTER TABLE {qn(new)} ADD CONSTRAINT {qn(f'{table}_{column}_part_fk')} "
+                f"FOREIGN KEY ({qn(column)}) REFERENCES {qn(user_table)} (id) "
+                f"DEFERRABLE INITIALLY DEFERRED"
+            )
+        cursor.execute(f"CREATE TABLE {qn(f'{table}_pdefault')} PARTITION OF {qn(new)} DEFAULT")
+
+        # Swap names before creating partitions and indexes so they get their final names
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(old)}")
+        cursor.execute(f"ALTER TABLE {qn(new)} RENAME TO {qn(table)}")
+        for index in AdminLog._meta.indexes:
+            cursor.execute(f"ALTER INDEX IF EXISTS {qn(index.name)} RENAME TO {qn(index.name + '_old')}")
+        ensure_partitions(oldest.date() if oldest else date.today(), months_ahead)
+
+        cursor.execute(f"INSERT INTO {qn(table)} SELECT * FROM {qn(old)}")
+        cursor.execute(f"SELECT setval('{seq}', %s, %s)", [max(max_id, 1), max_id > 0])
+
+        for column in ("admin_id", "target_user_id"):
+            cursor.execute(f"CREATE INDEX {qn(f'{table}_{column}_part_idx')} ON {qn(table)} ({qn(column)})")
+        with connection.schema_editor(atomic=False) as schema_editor:
+            for index in AdminLog._meta.indexes:
+                schema_editor.add_index(AdminLog, index)
+
+        if not keep_old:
+            cursor.execute(f"DROP TABLE {qn(old)}")
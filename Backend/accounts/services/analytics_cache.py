@@ -0,0 +1,75 @@
+# accounts/services/analytics_cache.py
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+SECTIONS = ("users", "predictions", "universities", "growth", "support", "feedback")
+
+_counters = {section: {"hits": 0, "misses": 0} for section in SECTIONS}
+_counters_lock = threading.Lock()
+
+
+def _version_key(section):
+    return f"analytics:{section}:version"
+
+
+def _count(section, outcome):
+    with _counters_lock:
+        _counters[section][outcome] += 1
+
+
+def cached_section(section, compute, *key_parts):
+    """
+    Cached result of compute() for one analytics section.
+
+    Entries are keyed by the section's version, which write signals bump,
+    so a write makes the old entry unreachable instead of deleting it.
+    ANALYTICS_CACHE_TTL bounds staleness for writes no signal sees.
+    """
+    version = cache.get(_version_key(section), 0)
+    key = ":".join(["analytics", section, f"v{version}", *map(str, key_parts)])
+
+    value = cache.get(key)
+    if value is not None:
+        _count(section, "hits")
+        return value
+
+    _count(section, "misses")
+    value = compute()
+    cache.set(key, value, getattr(settings, "ANALYTICS_CACHE_TTL", 60))
+    return value
+
+
+def invalidate(*sections):
+    """
+    Make the cached sections stale once the current transaction commits
+    (right away outside one). Bumping earlier would let a concurrent request
+    re-cache the pre-commit data under the new version.
+    """
+    transaction.on_commit(lambda: _bump_versions(sections))
+
+
+def _bump_versions(sections):
+    for section in sections:
+        key = _version_key(section)
+        # add() is a no-op if the key exists; incr() is atomic on shared backends
+        cache.add(key, 0, None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Evicted between add() and incr()
+            cache.set(key, 1, None)
+
+
+def cache_stats():
+    with _counters_lock:
+        stats = {}
+        for section, counts in _counters.items():
+            lookups = counts["hits"] + counts["misses"]
+            stats[section] = {
+                **counts,
+                "hit_rate": round(counts["hits"] / lookups, 4) if lookups else 0.0,
+            }
+    return {"ttl": getattr(settings, "ANALYTICS_CACHE_TTL", 60), "sections": stats}
@@ -0,0 +1,150 @@
+# accounts/services/analytics_rollup.py
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate, TruncMonth
+from django.utils import timezone
+
+
+def _bump(model, lookup, create=True, **deltas):
+    """Add `deltas` to the row matching `lookup` (created on first write)."""
+    updates = {field: F(field) + delta for field, delta in deltas.items()}
+    if model.objects.filter(**lookup).update(**updates) or not create:
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**lookup, **deltas)
+    except IntegrityError:
+        # Another worker created it first
+        model.objects.filter(**lookup).update(**updates)
+
+
+def _month_of(when):
+    return timezone.localdate(when).replace(day=1)
+
+
+# ---------------- INCREMENTAL UPDATES ----------------
+
+def record_prediction(prediction, sign=1):
+    """Fold one PredictionHistory row into the daily rollups (sign=-1 removes it)."""
+    from accounts.models import DailyPredictionStat, DailyRoleStat
+
+    day = timezone.localdate(prediction.timestamp)
+    scores = [float(c) for c in prediction.confidence_scores or []]
+    adding = sign > 0
+
+    _bump(
+        DailyPredictionStat, {"day": day}, create=adding,
+        predictions=sign,
+        confidence_sum=sign * sum(scores),
+        confidence_count=sign * len(scores),
+    )
+    for role, count in Counter(prediction.predicted_roles or []).items():
+        _bump(DailyRoleStat, {"day": day, "job_role": role}, create=adding, count=sign * count)
+
+    if adding:
+        record_activity(prediction.user_id, prediction.timestamp)
+
+
+def record_activity(user_id, when=None):
+    """Mark a user active in the month of `when` (login or prediction)."""
+    from accounts.models import MonthlyActiveUser, MonthlyActivityStat
+
+    month = _month_of(when or timezone.now())
+    _, created = MonthlyActiveUser.objects.get_or_create(month=month, user_id=user_id)
+    if created:
+        _bump(MonthlyActivityStat, {"month": month}, active_users=1)
+
+
+def forget_activity(months):
+    """Take removed MonthlyActiveUser rows (their months) out of the monthly counts."""
+    from accounts.models import MonthlyActivityStat
+
+    for month, count in Counter(months).items():
+        _bump(MonthlyActivityStat, {"month": month}, create=False, active_users=-count)
+
+
+# ---------------- FULL REBUILD ----------------
+
+def rebuild_rollups(chunk_size=2000):
+    """
+    Recompute every rollup from the source tables with grouped queries
+    (role stats come from PredictionRole). Logins before the rollups
+    existed are only known through User.last_login.
+    Returns the number of rows written per table.
+    """
+    from accounts.models import (
+        User,
+        PredictionHistory,
+        PredictionRole,
+        DailyPredictionStat,
+        DailyRoleStat,
+        MonthlyActiveUser,
+        MonthlyActivityStat,
+    )
+
+    days = {
+        row["day"]: [row["predictions"], 0.0, 0]
+        for row in PredictionHistory.objects.annotate(day=TruncDate("timestamp"))
+        .values("day").annotate(predictions=Count("id"))
+    }
+    roles = {}
+    for row in (
+        PredictionRole.objects.annotate(day=TruncDate("created"))
+        .values("day", "job_role")
+        .annotate(count=Count("id"), confidence_sum=Sum("confidence"))
+    ):
+        roles[row["day"], row["job_role"]] = row["count"]
+        stat = days.setdefault(row["day"], [0, 0.0, 0])
+        stat[1] += row["confidence_sum"] or 0.0
+        stat[2] += row["count"]
+
+    active = {
+        (row["month"], row["user_id"])
+        for row in PredictionHistory.objects.annotate(month=TruncMonth("timestamp"))
+        .values("month", "user_id").distinct()
+    }
+    active |= {
+        (row["month"], row["id"])
+        for row in User.objects.filter(last_login__isnull=False)
+        .annotate(month=TruncMonth("last_login")).values("month", "id")
+    }
+
+    with transaction.atomic():
+        DailyPredictionStat.objects.all().delete()
+        DailyRoleStat.objects.all().delete()
+        MonthlyActivityStat.objects.all().delete()
+
+        DailyPredictionStat.objects.bulk_create(
+            [
+                DailyPredictionStat(day=day, predictions=p, confidence_sum=s, confidence_count=c)
+                for day, (p, s, c) in days.items()
+            ],
+            batch_size=chunk_size,
+        )
+        DailyRoleStat.objects.bulk_create(
+            [
+                DailyRoleStat(day=day, job_role=role, count=count)
+                for (day, role), count in roles.items()
+            ],
+            batch_size=chunk_size,
+        )
+        MonthlyActiveUser.objects.bulk_create(
+            [
+                MonthlyActiveUser(month=_month_of(month), user_id=user_id)
+                for month, user_id in active
+            ],
+            batch_size=chunk_size,
+            ignore_conflicts=True,
+        )
+        MonthlyActivityStat.objects.bulk_create([
+            MonthlyActivityStat(month=row["month"], active_users=row["users"])
+            for row in MonthlyActiveUser.objects.values("month").annotate(users=Count("id"))
+        ])
+
+    return {
+        "daily_predictions": len(days),
+        "daily_roles": len(roles),
+        "monthly_activity": MonthlyActivityStat.objects.count(),
+    }
@@ -0,0 +1,130 @@
+# accounts/services/audit_log.py
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+# Entries kept for a retry when the database is unavailable, per buffer size
+MAX_BACKLOG_FACTOR = 10
+
+
+class AuditBuffer:
+    """
+    Per-process write-behind buffer of unsaved AdminLog rows.
+
+    Entries carry their own timestamp, so the flush time doesn't matter;
+    a flush bulk-inserts everything collected so far.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._entries = []
+        self._first_at = None
+        self._flush_scheduled = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, entries):
+        with self._lock:
+            if not self._entries:
+                self._first_at = time.monotonic()
+            self._entries.extend(entries)
+            due = (
+                len(self._entries) >= settings.AUDIT_LOG_BUFFER_SIZE
+                or time.monotonic() - self._first_at >= settings.AUDIT_LOG_FLUSH_SECONDS
+            )
+        if due:
+            self.flush_async()
+
+    def flush(self):
+        """Write everything buffered; returns the number of rows inserted."""
+        from accounts.models import AdminLog
+
+        with self._flush_lock:
+            with self._lock:
+                entries, self._entries = self._entries, []
+                self._first_at = None
+            if not entries:
+                return 0
+
+            try:
+                AdminLog.objects.bulk_create(entries, batch_size=500)
+                return len(entries)
+            except IntegrityError:
+                # e.g. a target user purged in between: keep the rest
+                return self._insert_each(entries)
+            except DatabaseError:
+                logger.exception("Audit log flush failed, keeping %d entries for a retry", len(entries))
+                self._requeue(entries)
+                return 0
+
+    def _insert_each(self, entries):
+        inserted = 0
+        for entry in entries:
+            try:
+                with transaction.atomic():
+                    entry.save(force_insert=True)
+                inserted += 1
+            except IntegrityError:
+                logger.warning("Dropped audit entry %s (%s)", entry.action_type, entry.details)
+        return inserted
+
+    def _requeue(self, entries):
+        limit = settings.AUDIT_LOG_BUFFER_SIZE * MAX_BACKLOG_FACTOR
+        with self._lock:
+            entries = entries + self._entries
+            if len(entries) > limit:
+                logger.error("Audit log backlog full, dropping %d oldest entries", len(entries) - limit)
+                entries = entries[-limit:]
+            self._entries = entries
+            self._first_at = time.monotonic()
+
+    def flush_async(self):
+        """Flush on a background thread (at most one scheduled at a time)."""
+        with self._lock:
+            if self._flush_scheduled or not self._entries:
+                return
+            self._flush_scheduled = True
+        threading.Thread(target=self._flush_in_thread, name="audit-log-flush", daemon=True).start()
+
+    def _flush_in_thread(self):
+        try:
+            with self._lock:
+                self._flush_scheduled = False
+            self.flush()
+        finally:
+            # This thread's connections would otherwise stay open
+            connections.close_all()
+
+
+audit_buffer = AuditBuffer()
+atexit.register(audit_buffer.flush)
+
+
+def log_admin_actions(entries):
+    """Record unsaved AdminLog rows according to AUDIT_LOG_MODE."""
+    from accounts.models import AdminLog
+
+    entries = list(entries)
+    if not entries:
+        return
+    if settings.AUDIT_LOG_MODE == "buffered":
+        # Buffered entries live outside the transaction: only hand them
+        # over once it commits, so a rolled-back action is never logged
+        transaction.on_commit(lambda: audit_buffer.add(entries))
+    else:
+        AdminLog.objects.bulk_create(entries, batch_size=500)
+
+
+def log_admin_action(**fields):
+    """Record one admin action; takes the AdminLog field values."""
+    from accounts.models import AdminLog
+
+    log_admin_actions([AdminLog(**fields)])
@@ -0,0 +1,82 @@
+# accounts/services/feedback_stats.py
+from datetime import datetime, time, timedelta
+
+from django.db.models import Avg, Count, F, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+RATINGS = range(1, 6)
+TREND_DAYS = 30
+
+
+def _rating_aggregates():
+    return {
+        "count": Count("id"),
+        "mean": Avg("rating"),
+        **{f"r{r}": Count("id", filter=Q(rating=r)) for r in RATINGS},
+    }
+
+
+def _summary(row):
+    return {
+        "count": row["count"],
+        "mean_rating": round(row["mean"], 2) if row["mean"] is not None else None,
+        "distribution": {str(r): row[f"r{r}"] for r in RATINGS},
+    }
+
+
+def feedback_stats(today=None):
+    """
+    Rating distribution, mean and count overall, per predicted (top) role
+    and per model version, plus daily count/mean over the last 30 days.
+    Every figure is a grouped SQL aggregate; rows are never loaded.
+    """
+    from accounts.models import PredictionFeedback
+
+    today = today or timezone.localdate()
+    feedback = PredictionFeedback.objects.order_by()
+    aggregates = _rating_aggregates()
+
+    overall = feedback.aggregate(**aggregates)
+
+    # The top role is the rank-0 PredictionRole row of the rated prediction
+    by_role = (
+        feedback.filter(prediction__roles__rank=0)
+        .values(job_role=F("prediction__roles__job_role"))
+        .annotate(**aggregates)
+        .order_by("-count", "job_role")
+    )
+    by_version = (
+        feedback.values(model_version=F("prediction__model_version"))
+        .annotate(**aggregates)
+        .order_by("-model_version")
+    )
+
+    start = today - timedelta(days=TREND_DAYS - 1)
+    # A plain range on created_at (not __date) so the keyset index is used
+    since = timezone.make_aware(datetime.combine(start, time.min))
+    daily = {
+        row["day"]: row
+        for row in feedback.filter(created_at__gte=since)
+        .values(day=TruncDate("created_at"))
+        .annotate(count=Count("id"), mean=Avg("rating"))
+    }
+    trend = []
+    for offset in range(TREND_DAYS):
+        day = start + timedelta(days=offset)
+        row = daily.get(day)
+        trend.append({
+            "day": day.isoformat(),
+            "count": row["count"] if row else 0,
+            "mean_rating": round(row["mean"], 2) if row and row["mean"] is not None else None,
+        })
+
+    return {
+        **_summary(overall),
+        "by_role": [{"job_role": row["job_role"], **_summary(row)} for row in by_role],
+        # Predictions made before versions were recorded have ""
+        "by_model_version": [
+            {"model_version": row["model_version"] or None, **_summary(row)} for row in by_version
+        ],
+        "trend": trend,
+    }
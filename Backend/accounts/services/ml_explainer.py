@@ -0,0 +1,229 @@
+# accounts/services/ml_explainer.py
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from django.db import connection
+
+from .ml_predictor import (
+    load_model,
+    build_feature_frame,
+    feature_fingerprint,
+    prediction_input_for_user,
+    NUMERIC_FEATURES,
+    CATEGORICAL_FEATURES,
+    SKILL_PREFIX,
+    CERT_PREFIX,
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of human features returned per role
+TOP_CONTRIBUTIONS = 10
+
+_explainers = {}
+_explainer_lock = threading.Lock()
+
+# One worker is enough: SHAP is CPU bound and we only want it off the request path
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shap-precompute")
+_pending = set()
+_pending_lock = threading.Lock()
+
+
+# ---------------- EXPLAINER ----------------
+
+def _get_explainer(models):
+    """One TreeExplainer per model version (building it walks all trees)."""
+    import shap
+
+    version = models["version"]
+    with _explainer_lock:
+        explainer = _explainers.get(version)
+        if explainer is None:
+            _explainers.clear()
+            explainer = shap.TreeExplainer(models["model"])
+            _explainers[version] = explainer
+    return explainer
+
+
+def _human_features(columns, row):
+    """
+    Map encoded columns back to human features.
+    One-hot categoricals collapse into a single feature (degree, college, ...),
+    each skill / certification stays its own feature.
+    Returns (group index per column, list of group descriptors).
+    """
+    groups = []
+    lookup = {}
+    index = np.empty(len(columns), dtype=np.intp)
+
+    for i, col in enumerate(columns):
+        value = row[i]
+        if col in NUMERIC_FEATURES:
+            key = (col, None)
+            descriptor = {"feature": col, "value": float(value)}
+        elif col.startswith(SKILL_PREFIX):
+            name = col[len(SKILL_PREFIX):]
+            key = ("skill", name)
+            descriptor = {"feature": "skill", "value": name, "present": bool(value)}
+        elif col.startswith(CERT_PREFIX):
+            name = col[len(CERT_PREFIX):]
+            key = ("certification", name)
+            descriptor = {"feature": "certification", "value": name, "present": bool(value)}
+        else:
+            feature = next(
+                (f for f in CATEGORICAL_FEATURES if col.startswith(f"{f}_")),
+                col,
+            )
+            key = (feature, None)
+            descriptor = {"feature": feature, "value": None}
+
+        if key not in lookup:
+            lookup[key] = len(groups)
+            groups.append(descriptor)
+        index[i] = lookup[key]
+
+        # Active one-hot column names the category the user actually has
+        if descriptor["feature"] in CATEGORICAL_FEATURES and value:
+            groups[lookup[key]]["value"] = col[len(descriptor["feature"]) + 1:]
+
+    return index, groups
+
+
+def _shap_matrix(explainer, features):
+    """SHAP values for a single row as an (n_features, n_classes) array."""
+    values = explainer.shap_values(features, check_additivity=False)
+    if isinstance(values, list):  # older shap: one array per class
+        return np.stack([v[0] for v in values], axis=1)
+    values = np.asarray(values)
+    return values[0] if values.ndim == 3 else values[0][:, None]
+
+
+def explain_features(features, models):
+    """
+    Compute TreeSHAP contributions for every role and aggregate them
+    to human features. Contributions are in probability points (0-100).
+    """
+    explainer = _get_explainer(models)
+    matrix = _shap_matrix(explainer, features) * 100
+
+    row = np.asarray(features, dtype=np.float64)[0]
+    index, groups = _human_features(list(features.columns), row)
+
+    aggregated = np.zeros((len(groups), matrix.shape[1]))
+    np.add.at(aggregated, index, matrix)
+
+    base_values = np.atleast_1d(explainer.expected_value) * 100
+    roles = models["label_encoder"].classes_
+
+    explanations = []
+    for class_idx, job in enumerate(roles):
+        contributions = aggregated[:, class_idx]
+        order = np.argsort(-np.abs(contributions))[:TOP_CONTRIBUTIONS]
+        explanations.append({
+            "job_role": job,
+            "base_value": round(float(base_values[class_idx]), 2),
+            "contributions": [
+                {**groups[i], "contribution": round(float(contributions[i]), 2)}
+                for i in order
+                if contributions[i] != 0
+            ],
+        })
+
+    return explanations
+
+
+# ---------------- CACHE ----------------
+
+def get_cached_explanation(fingerprint, version):
+    from accounts.models import PredictionExplanation
+
+    entry = PredictionExplanation.objects.filter(
+        feature_fingerprint=fingerprint,
+        model_version=version,
+    ).only("explanation").first()
+    return entry.explanation if entry else None
+
+
+def compute_explanation(features, fingerprint, version):
+    """Compute and store an explanation unless the model changed meanwhile."""
+    from accounts.models import PredictionExplanation
+
+    models = load_model()
+    if models["version"] != version:
+        return None
+
+    explanations = explain_features(features, models)
+    entry, _ = PredictionExplanation.objects.get_or_create(
+        feature_fingerprint=fingerprint,
+        model_version=version,
+        defaults={"explanation": explanations},
+    )
+    return entry.explanation
+
+
+def _precompute(features, fingerprint, version):
+    try:
+        compute_explanation(features, fingerprint, version)
+    except Exception:
+        logger.exception("SHAP precompute failed for %s", fingerprint[:12])
+    finally:
+        with _pending_lock:
+            _pending.discard((fingerprint, version))
+        connection.close()
+
+
+def schedule_explanation(features, fingerprint, version):
+    """
+    Queue a background explanation for an encoded row.
+    Returns False when the same row is already queued.
+    """
+    key = (fingerprint, version)
+    with _pending_lock:
+        if key in _pending:
+            return False
+        _pending.add(key)
+
+    _executor.submit(_precompute, features.copy(), fingerprint, version)
+    return True
+
+
+# ---------------- PREDICTION LOOKUP ----------------
+
+def explanation_for_prediction(prediction):
+    """
+    Resolve the explanation for a saved prediction.
+    Returns (status, explanations) where status is one of
+    "ready", "pending", "stale" or "unavailable".
+    """
+    models = load_model()
+    version = models["version"]
+    roles = prediction.predicted_roles or []
+
+    def for_roles(explanations):
+        by_role = {e["job_role"]: e for e in explanations}
+        return [by_role[r] for r in roles if r in by_role]
+
+    if prediction.feature_fingerprint:
+        cached = get_cached_explanation(prediction.feature_fingerprint, version)
+        if cached is not None:
+            return "ready", for_roles(cached)
+
+    data = prediction_input_for_user(prediction.user)
+    if data is None:
+        return "unavailable", None
+
+    features = build_feature_frame(data, models)
+    fingerprint = feature_fingerprint(features)
+
+    # Profile edited after this prediction: the saved roles no longer match
+    if prediction.feature_fingerprint and fingerprint != prediction.feature_fingerprint:
+        return "stale", None
+
+    cached = get_cached_explanation(fingerprint, version)
+    if cached is not None:
+        return "ready", for_roles(cached)
+
+    schedule_explanation(features, fingerprint, version)
+    return "pending", None
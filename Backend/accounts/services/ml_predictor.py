@@ -1,43 +1,111 @@
 import os
+import hashlib
+import threading
 import joblib
 import pandas as pd
 import numpy as np
 from django.conf import settings
-from .job_skill_map import JOB_REQUIRED_SKILLS
+from .skill_index import get_skill_index
 
 BASE_DIR = settings.BASE_DIR
 MODEL_DIR = os.path.join(BASE_DIR, "accounts", "ml")
 
+MODEL_FILES = {
+    "model": "rf_classifier.joblib",
+    "ohe": "ohe.joblib",
+    "mlb_skills": "mlb_skills.joblib",
+    "mlb_certifications": "mlb_certifications.joblib",
+    "label_encoder": "le.joblib",
+    "feature_columns": "feature_columns.joblib",
+}
+
+CATEGORICAL_FEATURES = ["degree", "specialization", "course", "college"]
+NUMERIC_FEATURES = ["year_of_completion", "cgpa"]
+
+# Column prefixes used by retrain_model_from_csv for multi-hot features
+SKILL_PREFIX = "skill_"
+CERT_PREFIX = "cert_"
+
+_model_cache = {"version": None, "models": None}
+_model_lock = threading.Lock()
+
+
+# MODEL VERSION
+def get_model_version():
+    """
+    Short fingerprint of the artifacts on disk (mtime + size).
+    Changes whenever the model is retrained, so it can key caches.
+    """
+    digest = hashlib.sha1()
+    for name in sorted(MODEL_FILES.values()):
+        stat = os.stat(os.path.join(MODEL_DIR, name))
+        digest.update(f"{name}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+    return digest.hexdigest()[:16]
+
+
 # DYNAMIC MODEL LOADER
 def load_model():
     """
-    Always load latest .joblib files from disk.
-    This ensures retrained model is used immediately.
+    Load the latest .joblib files from disk.
+    Artifacts are kept in memory per model version, so a retrained
+    model is still picked up immediately without re-reading every call.
     """
-    return {
-        "model": joblib.load(os.path.join(MODEL_DIR, "rf_classifier.joblib")),
-        "ohe": joblib.load(os.path.join(MODEL_DIR, "ohe.joblib")),
-        "mlb_skills": joblib.load(os.path.join(MODEL_DIR, "mlb_skills.joblib")),
-        "mlb_certifications": joblib.load(os.path.join(MODEL_DIR, "mlb_certifications.joblib")),
-        "label_encoder": joblib.load(os.path.join(MODEL_DIR, "le.joblib")),
-        "feature_columns": joblib.load(os.path.join(MODEL_DIR, "feature_columns.joblib")),
-    }
+    version = get_model_version()
+    if _model_cache["version"] == version:
+        return _model_cache["models"]
 
+    with _model_lock:
+        if _model_cache["version"] != version:
+            models = {
+                key: joblib.load(os.path.join(MODEL_DIR, filename))
+                for key, filename in MODEL_FILES.items()
+            }
+            models["version"] = version
+            _model_cache["models"] = models
+            _model_cache["version"] = version
 
-#  PREDICTION FUNCTION 
-def predict_jobs(data: dict):
+    return _model_cache["models"]
 
-    # LOAD LATEST MODEL (DYNAMIC RELOAD)
-    models = load_model()
 
-    model = models["model"]
+#  PREDICTION INPUT 
+def prediction_input_for_user(user):
+    """
+    Build the predict_jobs() input dict from a user's saved profile.
+    Returns None when the user has no education details yet.
+    """
+    from accounts.models import Education, Certification
+
+    education = Education.objects.filter(user=user).first()
+    if not education:
+        return None
+
+    return {
+        "degree": education.degree,
+        "specialization": education.specialization,
+        "course": education.specialization,
+        "college": education.university,
+        "year_of_completion": education.year_of_completion,
+        "cgpa": float(education.cgpa),
+        "skills": user.skills or [],
+
+        "certifications": list(
+            Certification.objects.filter(user=user)
+            .values_list("cert_name", flat=True)
+        ),
+    }
+
+
+#  FEATURE ENCODING 
+def build_feature_frame(data: dict, models: dict):
+    """
+    Encode one input dict into a single-row DataFrame laid out exactly
+    like the training matrix (feature_columns order, prefixed multi-hot
+    skill/cert columns).
+    """
     ohe = models["ohe"]
     mlb_skills = models["mlb_skills"]
     mlb_certifications = models["mlb_certifications"]
-    label_encoder = models["label_encoder"]
-    feature_columns = models["feature_columns"]
 
-    # ---------------- INPUT DATAFRAME ----------------
     df = pd.DataFrame([{
         "degree": data["degree"],
         "specialization": data["specialization"],
@@ -47,10 +115,7 @@ def predict_jobs(data: dict):
         "cgpa": data["cgpa"]
     }])
 
-    # ---------------- ENCODING ----------------
-    cat_features = ohe.transform(
-        df[["degree", "specialization", "course", "college"]]
-    )
+    cat_features = ohe.transform(df[CATEGORICAL_FEATURES])
     cat_df = pd.DataFrame(
         cat_features.toarray(),
         columns=ohe.get_feature_names_out()
@@ -59,7 +124,7 @@ def predict_jobs(data: dict):
     skills_encoded = mlb_skills.transform([data.get("skills", [])])
     skills_df = pd.DataFrame(
         skills_encoded,
-        columns=mlb_skills.classes_
+        columns=[f"{SKILL_PREFIX}{s}" for s in mlb_skills.classes_]
     )
 
     cert_encoded = mlb_certifications.transform(
@@ -67,61 +132,61 @@ def predict_jobs(data: dict):
     )
     cert_df = pd.DataFrame(
         cert_encoded,
-        columns=mlb_certifications.classes_
+        columns=[f"{CERT_PREFIX}{c}" for c in mlb_certifications.classes_]
     )
 
-    # ---------------- FINAL FEATURE VECTOR ----------------
     final_df = pd.concat(
-        [df[["year_of_completion", "cgpa"]], skills_df, cert_df, cat_df],
+        [df[NUMERIC_FEATURES], skills_df, cert_df, cat_df],
         axis=1
     )
 
-    final_df = final_df.reindex(
-        columns=feature_columns,
+    return final_df.reindex(
+        columns=models["feature_columns"],
         fill_value=0
     )
 
-    # ---------------- ML PROBABILITIES ----------------
-    probs = model.predict_proba(final_df)[0]
 
-    results = []
-    user_skills = set(s.lower() for s in data.get("skills", []))
+def feature_fingerprint(features) -> str:
+    """Stable hash of an encoded feature row (DataFrame or array)."""
+    values = np.ascontiguousarray(np.asarray(features, dtype=np.float64))
+    return hashlib.sha256(values.tobytes()).hexdigest()
 
-    # ---------------- CONFIDENCE CALCULATION (FIXED) ----------------
-    for idx, prob in enumerate(probs):
-        job = label_encoder.inverse_transform([idx])[0]
 
-        base_confidence = float(prob) * 100
-        required = JOB_REQUIRED_SKILLS.get(job, [])
+#  PREDICTION FUNCTION 
+def predict_jobs(data: dict, features=None):
+    """
+    Score every job role for one profile and return the top 3.
+    `features` may be passed in when the caller already encoded the row.
+    """
+
+    # LOAD LATEST MODEL (DYNAMIC RELOAD)
+    models = load_model()
+
+    model = models["model"]
+    label_encoder = models["label_encoder"]
 
-        missing = [
-            skill for skill in required
-            if skill.lower() not in user_skills
-        ]
+    # ---------------- FINAL FEATURE VECTOR ----------------
+    final_df = features if features is not None else build_feature_frame(data, models)
 
-        # 🔥 SKILL-DRIVEN CONFIDENCE (CORRECT LOGIC)
-        if not required:
-            confidence = round(base_confidence, 2)
-        else:
-            skill_match_ratio = (
-                (len(required) - len(missing)) / len(required)
-            )
+    # ---------------- ML PROBABILITIES ----------------
+    probs = model.predict_proba(final_df)[0]
 
-            confidence = (
-                skill_match_ratio * 80       # skills dominate
-                + (base_confidence * 0.2)    # ML fine-tunes
-            )
+    results = []
+    skill_index = get_skill_index()
+    user_mask = skill_index.mask_for(data.get("skills", []))
 
-            confidence = round(min(confidence, 100), 2)
+    # ---------------- CONFIDENCE CALCULATION (FIXED) ----------------
+    jobs = label_encoder.classes_
+    missing = [skill_index.missing(job, user_mask) for job in jobs]
 
-        # FULL MATCH → 100%
-        if required and not missing:
-            confidence = 100.0
+    required_counts, matched_counts = skill_index.match_counts(jobs, user_mask)
+    confidences = blend_confidence(probs, required_counts, matched_counts)
 
+    for job, confidence, missing_skills in zip(jobs, confidences, missing):
         results.append({
             "job_role": job,
-            "confidence": confidence,
-            "missing_skills": missing
+            "confidence": round(float(confidence), 2),
+            "missing_skills": missing_skills
         })
 
     # ---------------- SORT & TOP 3 ----------------
@@ -129,6 +194,39 @@ def predict_jobs(data: dict):
     return results[:3]
 
 
+#  CONFIDENCE BLEND 
+def blend_confidence(probs, required_counts, matched_counts):
+    """
+    Skill-driven confidence: skill match ratio dominates (80 points),
+    ML probability fine-tunes (20%). Roles without required skills use
+    the raw ML probability, a full skill match is always 100.
+
+    Works on any broadcastable shapes, e.g. probs (n_rows, n_roles)
+    against counts (n_roles,) or (n_rows, n_roles). Returns unrounded
+    percentages.
+    """
+    base_confidence = np.asarray(probs, dtype=np.float64) * 100
+    required_counts = np.asarray(required_counts)
+    matched_counts = np.asarray(matched_counts)
+
+    has_required = required_counts > 0
+    skill_match_ratio = np.divide(
+        matched_counts,
+        np.maximum(required_counts, 1),
+        dtype=np.float64,
+    )
+
+    blended = np.minimum(
+        skill_match_ratio * 80          # skills dominate
+        + base_confidence * 0.2,        # ML fine-tunes
+        100,
+    )
+    confidence = np.where(has_required, blended, base_confidence)
+
+    # FULL MATCH → 100%
+    return np.where(has_required & (matched_counts >= required_counts), 100.0, confidence)
+
+
 #  ADMIN RETRAIN FUNCTION
 def retrain_model_from_csv(csv_file):
     """
@@ -193,12 +291,12 @@ def retrain_model_from_csv(csv_file):
 
     skills_df = pd.DataFrame(
         skills_features,
-        columns=[f"skill_{s}" for s in mlb_skills.classes_]
+        columns=[f"{SKILL_PREFIX}{s}" for s in mlb_skills.classes_]
     )
 
     cert_df = pd.DataFrame(
         cert_features,
-        columns=[f"cert_{c}" for c in mlb_certifications.classes_]
+        columns=[f"{CERT_PREFIX}{c}" for c in mlb_certifications.classes_]
     )
 
     cat_df = pd.DataFrame(
@@ -0,0 +1,115 @@
+# accounts/services/ml_whatif.py
+import numpy as np
+import pandas as pd
+
+from .ml_predictor import (
+    load_model,
+    build_feature_frame,
+    blend_confidence,
+    SKILL_PREFIX,
+)
+from .skill_index import get_skill_index, canonical_skill
+
+
+def _candidate_skills(models, skill_index, user_skills):
+    """
+    Every skill the user could still learn: the model's skill vocabulary
+    plus every required skill in the catalog, de-duplicated case-insensitively.
+    Returns {canonical skill: display name}.
+    """
+    candidates = {}
+    for skill in models["mlb_skills"].classes_:
+        candidates.setdefault(canonical_skill(skill), str(skill))
+    for key, skill_id in skill_index.skill_ids.items():
+        candidates.setdefault(key, skill_index.skill_names[skill_id])
+
+    return {k: v for k, v in candidates.items() if k not in user_skills}
+
+
+def rank_skills_by_gain(data: dict, target_role=None, limit=None):
+    """
+    Score "what if I learned skill X" for every missing skill at once.
+
+    Row 0 of the matrix is the user's current feature vector, row j adds
+    candidate skill j. All rows go through a single predict_proba call and
+    the skill-match blend is recomputed for all of them in one shot.
+    """
+    models = load_model()
+    model = models["model"]
+    roles = list(models["label_encoder"].classes_)
+    feature_columns = list(models["feature_columns"])
+
+    if target_role is not None and target_role not in roles:
+        raise ValueError(f"Unknown job role: {target_role}")
+
+    skill_index = get_skill_index()
+    user_skills = {canonical_skill(s) for s in data.get("skills", [])}
+    candidates = _candidate_skills(models, skill_index, user_skills)
+    keys = list(candidates)
+
+    # ---------------- PERTURBED FEATURE MATRIX ----------------
+    base_row = build_feature_frame(data, models).to_numpy(dtype=np.float64)
+    matrix = np.repeat(base_row, len(keys) + 1, axis=0)
+
+    column_index = {col: i for i, col in enumerate(feature_columns)}
+    rows, cols = [], []
+    for j, key in enumerate(keys, start=1):
+        col = column_index.get(f"{SKILL_PREFIX}{candidates[key]}")
+        if col is not None:
+            rows.append(j)
+            cols.append(col)
+    matrix[rows, cols] = 1
+
+    probs = model.predict_proba(pd.DataFrame(matrix, columns=feature_columns))
+
+    # ---------------- VECTORIZED SKILL MATCH ----------------
+    # Rows of the compiled catalog matrix in model class order; roles the
+    # catalog doesn't know get an all-zero row (no required skills)
+    n_skills = len(skill_index.skill_names)
+    required = np.zeros((len(roles), n_skills + 1), dtype=np.int32)
+    for r, job in enumerate(roles):
+        idx = skill_index.role_index.get(job)
+        if idx is not None:
+            required[r, :n_skills] = skill_index.required_matrix[idx]
+
+    user_vector = np.zeros(n_skills + 1, dtype=np.int32)
+    for skill in user_skills:
+        skill_id = skill_index.skill_ids.get(skill)
+        if skill_id is not None:
+            user_vector[skill_id] = 1
+
+    required_counts = required.sum(axis=1)
+    base_matched = required @ user_vector
+
+    # Last slot is an all-zero column for skills no role requires
+    candidate_slots = np.array(
+        [skill_index.skill_ids.get(k, n_skills) for k in keys], dtype=np.intp
+    )
+    matched = np.vstack([
+        base_matched,
+        base_matched + required[:, candidate_slots].T,
+    ])
+
+    confidences = blend_confidence(probs, required_counts, matched)
+
+    # ---------------- RANK BY GAIN ----------------
+    role_idx = roles.index(target_role) if target_role else int(np.argmax(confidences[0]))
+    baseline = confidences[0, role_idx]
+    gains = confidences[1:, role_idx] - baseline
+
+    order = np.argsort(-gains, kind="stable")
+    if limit:
+        order = order[:limit]
+
+    return {
+        "job_role": roles[role_idx],
+        "confidence": round(float(baseline), 2),
+        "skills": [
+            {
+                "skill": candidates[keys[i]],
+                "confidence": round(float(confidences[i + 1, role_idx]), 2),
+                "gain": round(float(gains[i]), 2),
+            }
+            for i in order
+        ],
+    }
@@ -0,0 +1,246 @@
+# accounts/services/similar_students.py
+import os
+import threading
+
+import joblib
+import numpy as np
+from django.utils import timezone
+
+from .ml_predictor import MODEL_DIR, load_model
+
+INDEX_PATH = os.path.join(MODEL_DIR, "similar_students.joblib")
+
+# Profiles are projected onto this many principal components before indexing
+REDUCED_DIMS = 16
+LEAF_SIZE = 40
+
+# Incremental updates keep the tree and brute-force the changed profiles;
+# past this many changes a full rebuild is cheaper
+MIN_DELTA_ROWS = 1000
+MAX_DELTA_RATIO = 0.05
+
+_cache = {"mtime": None, "index": None}
+_cache_lock = threading.Lock()
+
+
+# ---------------- FEATURE VECTORS ----------------
+
+def encode_vector(features) -> bytes:
+    return np.asarray(features, dtype=np.float32).reshape(-1).tobytes()
+
+
+def decode_vectors(blobs, width) -> np.ndarray:
+    if not blobs:
+        return np.empty((0, width), dtype=np.float32)
+    return np.frombuffer(b"".join(bytes(b) for b in blobs), dtype=np.float32).reshape(-1, width)
+
+
+def store_feature_vector(user, features, version, top_role):
+    """Materialize a user's encoded profile for the next index build."""
+    from accounts.models import ProfileFeatureVector
+
+    ProfileFeatureVector.objects.update_or_create(
+        user=user,
+        defaults={
+            "model_version": version,
+            "vector": encode_vector(features),
+            "top_role": top_role or "",
+        },
+    )
+
+
+# ---------------- INDEX ----------------
+
+class SimilarityIndex:
+    """
+    BallTree over standardized, PCA-reduced profile vectors for one model
+    version, plus a small brute-forced delta of profiles changed since the
+    tree was built (their old tree entries are tombstoned).
+    """
+
+    def __init__(self, model_version, mean, scale, components, user_ids, roles, tree, built_through):
+        self.model_version = model_version
+        self.mean = mean
+        self.scale = scale
+        self.components = components
+        self.user_ids = user_ids
+        self.roles = roles
+        self.tree = tree
+        self.built_through = built_through
+
+        self.tombstones = frozenset()
+        self.delta_ids = np.empty(0, dtype=np.int64)
+        self.delta_points = np.empty((0, components.shape[0]))
+        self.delta_roles = np.empty(0, dtype=object)
+
+    @property
+    def size(self):
+        return len(self.user_ids) - len(self.tombstones) + len(self.delta_ids)
+
+    def project(self, vectors):
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float64))
+        return ((vectors - self.mean) / self.scale) @ self.components.T
+
+    def apply_delta(self, user_ids, vectors, roles, removed_ids, built_through):
+        """Fold changed/removed profiles in without rebuilding the tree."""
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        keep = ~np.isin(self.delta_ids, user_ids) & ~np.isin(self.delta_ids, list(removed_ids))
+
+        self.delta_ids = np.concatenate([self.delta_ids[keep], user_ids])
+        self.delta_points = np.vstack([self.delta_points[keep], self.project(vectors)]) \
+            if len(user_ids) else self.delta_points[keep]
+        self.delta_roles = np.concatenate([self.delta_roles[keep], np.asarray(roles, dtype=object)])
+
+        self.tombstones = self.tombstones | set(user_ids.tolist()) | set(removed_ids)
+        self.built_through = built_through
+
+    def query(self, vector, k, exclude_user=None):
+        """k nearest profiles as a list of (user_id, distance, top_role)."""
+        point = self.project(vector)
+
+        candidates = []
+        fetch = min(len(self.user_ids), k + len(self.tombstones) + 1)
+        if fetch:
+            distances, indices = self.tree.query(point, k=fetch)
+            for dist, idx in zip(distances[0], indices[0]):
+                user_id = int(self.user_ids[idx])
+                if user_id in self.tombstones:
+                    continue
+                candidates.append((user_id, float(dist), self.roles[idx]))
+
+        if len(self.delta_ids):
+            dists = np.linalg.norm(self.delta_points - point, axis=1)
+            for i in np.argsort(dists)[:k + 1]:
+                candidates.append((int(self.delta_ids[i]), float(dists[i]), self.delta_roles[i]))
+
+        candidates = [c for c in candidates if c[0] != exclude_user]
+        candidates.sort(key=lambda c: c[1])
+        return candidates[:k]
+
+
+def _load_rows(queryset, width):
+    user_ids, blobs, roles = [], [], []
+    for user_id, blob, role in queryset.values_list("user_id", "vector", "top_role").iterator(chunk_size=2000):
+        user_ids.append(user_id)
+        blobs.append(blob)
+        roles.append(role)
+    return user_ids, decode_vectors(blobs, width), roles
+
+
+def _full_build(version, width, built_through):
+    from sklearn.decomposition import PCA
+    from sklearn.neighbors import BallTree
+    from accounts.models import ProfileFeatureVector
+
+    user_ids, vectors, roles = _load_rows(
+        ProfileFeatureVector.objects.filter(model_version=version), width
+    )
+    if not user_ids:
+        raise ValueError("No feature vectors for the current model version")
+
+    X = vectors.astype(np.float64)
+    mean = X.mean(axis=0)
+    scale = X.std(axis=0)
+    scale[scale == 0] = 1.0
+    standardized = (X - mean) / scale
+
+    dims = min(REDUCED_DIMS, standardized.shape[1], len(user_ids))
+    if dims < 2:
+        components = np.eye(standardized.shape[1])
+    else:
+        components = PCA(n_components=dims, random_state=42).fit(standardized).components_
+
+    reduced = standardized @ components.T
+    tree = BallTree(reduced, leaf_size=LEAF_SIZE)
+
+    return SimilarityIndex(
+        version, mean, scale, components,
+        np.asarray(user_ids, dtype=np.int64),
+        np.asarray(roles, dtype=object),
+        tree, built_through,
+    )
+
+
+def build_index(full=False):
+    """
+    Build or incrementally refresh the index for the current model version
+    and persist it next to the model artifacts. Returns (index, mode).
+    """
+    from accounts.models import ProfileFeatureVector
+
+    models = load_model()
+    version = models["version"]
+    width = len(models["feature_columns"])
+    started = timezone.now()
+
+    index = None if full else load_index()
+    if index is not None and index.model_version == version:
+        changed = ProfileFeatureVector.objects.filter(
+            model_version=version, updated_at__gt=index.built_through
+        )
+        live_ids = set(
+            ProfileFeatureVector.objects.filter(model_version=version)
+            .values_list("user_id", flat=True)
+        )
+        indexed_ids = set(index.user_ids.tolist()) | set(index.delta_ids.tolist())
+        removed = indexed_ids - live_ids
+
+        budget = max(MIN_DELTA_ROWS, MAX_DELTA_RATIO * len(index.user_ids))
+        pending = changed.count() + len(removed) + len(index.tombstones)
+        if pending <= budget:
+            user_ids, vectors, roles = _load_rows(changed, width)
+            index.apply_delta(user_ids, vectors, roles, removed, started)
+            save_index(index)
+            return index, "incremental"
+
+    index = _full_build(version, width, started)
+    save_index(index)
+    return index, "full"
+
+
+# ---------------- PERSISTENCE ----------------
+
+def save_index(index):
+    tmp_path = f"{INDEX_PATH}.tmp"
+    joblib.dump(index, tmp_path)
+    os.replace(tmp_path, INDEX_PATH)
+
+
+def load_index():
+    """Persisted index, reloaded only when the file on disk changed."""
+    try:
+        mtime = os.stat(INDEX_PATH).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if _cache["mtime"] != mtime:
+        with _cache_lock:
+            if _cache["mtime"] != mtime:
+                _cache["index"] = joblib.load(INDEX_PATH)
+                _cache["mtime"] = mtime
+    return _cache["index"]
+
+
+def similar_students(vector, k, exclude_user=None):
+    """
+    Role distribution among the k most similar profiles.
+    Returns None when no index exists for the current model version.
+    """
+    index = load_index()
+    if index is None or index.model_version != load_model()["version"]:
+        return None
+
+    neighbours = index.query(vector, k, exclude_user=exclude_user)
+    counts = {}
+    for _, _, role in neighbours:
+        if role:
+            counts[role] = counts.get(role, 0) + 1
+
+    total = len(neighbours)
+    return {
+        "neighbours": total,
+        "roles": [
+            {"job_role": role, "count": count, "share": round(count / total, 4)}
+            for role, count in sorted(counts.items(), key=lambda x: -x[1])
+        ],
+    }
@@ -0,0 +1,220 @@
+# accounts/services/skill_index.py
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from django.db import DatabaseError
+
+from .job_skill_map import JOB_REQUIRED_SKILLS
+
+
+def canonical_skill(skill) -> str:
+    """Case/whitespace-insensitive skill key."""
+    return " ".join(str(skill).split()).lower()
+
+
+class SkillIndex:
+    """
+    Immutable compiled form of a {job role: [required skills]} catalog.
+
+    Skills get integer ids in a canonical (lower-cased) id space, each role
+    keeps a bitset of its required skill ids, and an inverted index maps
+    every skill id to the roles that require it. Built once, then shared
+    read-only by all requests.
+    """
+
+    def __init__(self, catalog: dict, version=0):
+        self.version = version
+
+        skill_ids = {}
+        skill_names = []
+        roles = []
+        role_required = []
+        role_masks = []
+        postings = {}
+
+        for role, skills in catalog.items():
+            role_idx = len(roles)
+            roles.append(role)
+
+            mask = 0
+            names = []
+            for skill in skills:
+                key = canonical_skill(skill)
+                if not key:
+                    continue
+                skill_id = skill_ids.get(key)
+                if skill_id is None:
+                    skill_id = skill_ids[key] = len(skill_names)
+                    skill_names.append(skill)
+                if mask >> skill_id & 1:
+                    continue
+                mask |= 1 << skill_id
+                names.append((skill_id, skill))
+                postings.setdefault(skill_id, []).append(role_idx)
+
+            role_masks.append(mask)
+            role_required.append(tuple(names))
+
+        self.skill_ids = skill_ids
+        self.skill_names = tuple(skill_names)
+        self.roles = tuple(roles)
+        self.role_index = {role: i for i, role in enumerate(roles)}
+        self.role_masks = tuple(role_masks)
+        self.role_required = tuple(role_required)
+        self.postings = {k: tuple(v) for k, v in postings.items()}
+        self.required_counts = np.array(
+            [len(r) for r in role_required], dtype=np.int32
+        )
+
+        # Dense (roles x skills) view for vectorized callers
+        matrix = np.zeros((len(roles), len(skill_names)), dtype=np.int32)
+        for role_idx, names in enumerate(role_required):
+            for skill_id, _ in names:
+                matrix[role_idx, skill_id] = 1
+        matrix.setflags(write=False)
+        self.required_matrix = matrix
+
+    # ---------------- LOOKUPS ----------------
+
+    def skill_id(self, skill):
+        return self.skill_ids.get(canonical_skill(skill))
+
+    def mask_for(self, skills) -> int:
+        """Bitset of the known skills in `skills` (unknown ones are ignored)."""
+        mask = 0
+        for skill in skills:
+            skill_id = self.skill_ids.get(canonical_skill(skill))
+            if skill_id is not None:
+                mask |= 1 << skill_id
+        return mask
+
+    def required(self, role):
+        """Required skills of a role in catalog order ([] for unknown roles)."""
+        idx = self.role_index.get(role)
+        if idx is None:
+            return []
+        return [name for _, name in self.role_required[idx]]
+
+    def missing(self, role, user_mask):
+        idx = self.role_index.get(role)
+        if idx is None:
+            return []
+        return [
+            name for skill_id, name in self.role_required[idx]
+            if not user_mask >> skill_id & 1
+        ]
+
+    def match_counts(self, roles, user_mask):
+        """(required, matched) counts for each role in `roles`."""
+        required = np.zeros(len(roles), dtype=np.int32)
+        matched = np.zeros(len(roles), dtype=np.int32)
+        for i, role in enumerate(roles):
+            idx = self.role_index.get(role)
+            if idx is None:
+                continue
+            required[i] = self.required_counts[idx]
+            matched[i] = (self.role_masks[idx] & user_mask).bit_count()
+        return required, matched
+
+    # ---------------- RANKING ----------------
+
+    def candidate_roles(self, user_mask):
+        """
+        Overlap counts for roles sharing at least one skill with the user,
+        gathered from the inverted index (roles with no overlap are never touched).
+        """
+        counts = {}
+        remaining = user_mask
+        while remaining:
+            low = remaining & -remaining
+            for role_idx in self.postings.get(low.bit_length() - 1, ()):
+                counts[role_idx] = counts.get(role_idx, 0) + 1
+            remaining ^= low
+        return counts
+
+    def rank_roles(self, skills, limit=None, min_overlap=0):
+        """
+        Rank roles by Jaccard similarity between the user's skills and the
+        role's required skills. With min_overlap >= 1 only roles reached
+        through the inverted index are considered, which makes this usable
+        as a cheap pre-filter.
+        """
+        user_keys = {canonical_skill(s) for s in skills if canonical_skill(s)}
+        user_mask = self.mask_for(user_keys)
+        counts = self.candidate_roles(user_mask)
+
+        if min_overlap <= 0:
+            role_ids = range(len(self.roles))
+        else:
+            role_ids = [i for i, c in counts.items() if c >= min_overlap]
+
+        ranked = []
+        for role_idx in role_ids:
+            overlap = counts.get(role_idx, 0)
+            required = int(self.required_counts[role_idx])
+            union = required + len(user_keys) - overlap
+            ranked.append({
+                "job_role": self.roles[role_idx],
+                "matched": overlap,
+                "required": required,
+                "coverage": round(overlap / required, 4) if required else 0.0,
+                "jaccard": round(overlap / union, 4) if union else 0.0,
+                "missing_skills": [
+                    name for skill_id, name in self.role_required[role_idx]
+                    if not user_mask >> skill_id & 1
+                ],
+            })
+
+        ranked.sort(key=lambda r: (-r["jaccard"], -r["coverage"], r["job_role"]))
+        return ranked[:limit] if limit else ranked
+
+
+# ---------------- VERSIONED LOADER ----------------
+
+# Seed catalog until the first successful version check
+_state = {"index": SkillIndex(JOB_REQUIRED_SKILLS, version=0), "checked_at": None}
+_lock = threading.Lock()
+
+
+def _load_catalog():
+    from accounts.models import JobRole
+
+    return dict(JobRole.objects.values_list("name", "required_skills"))
+
+
+def get_skill_index() -> SkillIndex:
+    """
+    Current compiled index for this worker.
+
+    Freshness is a single-row version lookup (throttled by
+    SKILL_CATALOG_CHECK_SECONDS); the JobRole table is only read
+    again when an admin edit bumped the version.
+    """
+    from accounts.models import SkillCatalogVersion
+
+    index = _state["index"]
+    interval = getattr(settings, "SKILL_CATALOG_CHECK_SECONDS", 0)
+    now = time.monotonic()
+    checked_at = _state["checked_at"]
+    if checked_at is not None and now - checked_at < interval:
+        return index
+
+    try:
+        version = SkillCatalogVersion.current()
+    except DatabaseError:
+        # Catalog tables not migrated yet: keep serving the seed map
+        return index
+    _state["checked_at"] = now
+
+    if version == index.version or version == 0:
+        return index
+
+    with _lock:
+        index = _state["index"]
+        if index.version != version:
+            index = SkillIndex(_load_catalog(), version=version)
+            _state["index"] = index
+
+    return index
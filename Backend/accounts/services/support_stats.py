@@ -0,0 +1,102 @@
+# accounts/services/support_stats.py
+import math
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models import Aggregate, Count, DurationField, ExpressionWrapper, F, Q
+from django.utils import timezone
+
+# Backlog age buckets: (label, lower bound, upper bound) in days
+BACKLOG_BUCKETS = (
+    ("under_1d", None, 1),
+    ("1d_to_3d", 1, 3),
+    ("3d_to_7d", 3, 7),
+    ("over_7d", 7, None),
+)
+RESOLVED = "resolved"
+PERCENTILES = (("median", 0.5), ("p90", 0.9))
+
+
+class PercentileCont(Aggregate):
+    """PostgreSQL percentile_cont(fraction) WITHIN GROUP (ORDER BY expression)"""
+    function = "percentile_cont"
+    template = "%(function)s(%(fraction)s) WITHIN GROUP (ORDER BY %(expressions)s)"
+
+    def __init__(self, expression, fraction, **extra):
+        super().__init__(expression, fraction=float(fraction), **extra)
+
+
+def _reply_time():
+    return ExpressionWrapper(F("replied_at") - F("created_at"), output_field=DurationField())
+
+
+def _reply_percentiles(replied):
+    from accounts.models import SupportTicket
+
+    tickets = SupportTicket.objects.filter(replied_at__isnull=False)
+    if connection.vendor == "postgresql":
+        return tickets.aggregate(**{
+            name: PercentileCont(_reply_time(), fraction, output_field=DurationField())
+            for name, fraction in PERCENTILES
+        })
+
+    # No percentile aggregate elsewhere: nearest-rank lookup per percentile
+    ordered = tickets.annotate(reply_time=_reply_time()).order_by("reply_time")
+    result = {}
+    for name, fraction in PERCENTILES:
+        rank = max(0, math.ceil(fraction * replied) - 1)
+        result[name] = ordered.values_list("reply_time", flat=True)[rank] if replied else None
+    return result
+
+
+def _seconds(value):
+    return round(value.total_seconds()) if value is not None else None
+
+
+def support_stats(now=None):
+    """
+    Ticket counts by status/type, backlog age buckets (one grouped query)
+    and median/p90 time to first reply (one more query on PostgreSQL,
+    one per percentile elsewhere).
+    """
+    from accounts.models import SupportTicket
+
+    now = now or timezone.now()
+    backlog = ~Q(status=RESOLVED)
+    buckets = {}
+    for label, low, high in BACKLOG_BUCKETS:
+        condition = backlog
+        if low is not None:
+            condition &= Q(created_at__lte=now - timedelta(days=low))
+        if high is not None:
+            condition &= Q(created_at__gt=now - timedelta(days=high))
+        buckets[label] = Count("id", filter=condition)
+
+    groups = (
+        SupportTicket.objects.order_by()
+        .values("status", "type")
+        .annotate(count=Count("id"), replied=Count("replied_at"), **buckets)
+    )
+
+    by_status, by_type = {}, {}
+    age = dict.fromkeys(buckets, 0)
+    total = replied = 0
+    for row in groups:
+        by_status[row["status"]] = by_status.get(row["status"], 0) + row["count"]
+        by_type[row["type"]] = by_type.get(row["type"], 0) + row["count"]
+        total += row["count"]
+        replied += row["replied"]
+        for label in age:
+            age[label] += row[label]
+
+    percentiles = _reply_percentiles(replied)
+    return {
+        "total": total,
+        "by_status": by_status,
+        "by_type": by_type,
+        "backlog": {"total": sum(age.values()), "age": age},
+        "time_to_reply_seconds": {
+            "replied": replied,
+            **{name: _seconds(percentiles[name]) for name, _ in PERCENTILES},
+        },
+    }
@@ -0,0 +1,120 @@
+# accounts/services/ticket_search.py
+"""
+Ranked full-text search over SupportTicket subject/message/admin_reply.
+
+SQLite: an FTS5 table keyed by ticket id, kept in sync by the signals in
+accounts/signals.py. PostgreSQL: a generated, weighted tsvector column with
+a GIN index, maintained by the database itself. Both are created by
+migration 0021_supportticket_search; anywhere else (or without FTS5) the
+search degrades to an unranked icontains scan.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+FTS_TABLE = "accounts_supportticket_fts"
+SEARCH_COLUMN = "search_vector"
+
+# Subject matches count more than message or reply matches
+FTS_WEIGHTS = (3.0, 1.0, 1.0)
+
+_state = {"fts": None}
+
+
+def search_terms(query):
+    """Words of the query; everything else (operators, quotes) is dropped."""
+    return re.findall(r"\w+", query.lower())[:16]
+
+
+def _fts_available():
+    if _state["fts"] is None:
+        with connection.cursor() as cursor:
+            _state["fts"] = FTS_TABLE in connection.introspection.table_names(cursor)
+    return _state["fts"]
+
+
+def backend():
+    if connection.vendor == "postgresql":
+        return "postgresql"
+    if connection.vendor == "sqlite" and _fts_available():
+        return "fts5"
+    return "scan"
+
+
+# ---------------- SQLITE INDEX SYNC ----------------
+
+def index_ticket(ticket):
+    if backend() != "fts5":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [ticket.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, subject, message, admin_reply) VALUES (%s, %s, %s, %s)",
+            [ticket.pk, ticket.subject or "", ticket.message or "", ticket.admin_reply or ""],
+        )
+
+
+def unindex_ticket(ticket_id):
+    if backend() != "fts5":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [ticket_id])
+
+
+# ---------------- SEARCH ----------------
+
+def _ranked_ids(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def search_tickets(query, filters=None, limit=20, offset=0):
+    """
+    Ids of the tickets matching every word of `query` (as a prefix), best
+    match first, for one page. `filters` narrows on exact column values
+    (status/type). Returns (ids, has_more).
+    """
+    from accounts.models import SupportTicket
+
+    terms = search_terms(query)
+    if not terms:
+        return [], False
+    filters = filters or {}
+    table = SupportTicket._meta.db_table
+
+    qn = connection.ops.quote_name
+    where = "".join(f" AND t.{qn(column)} = %s" for column in filters)
+    params = list(filters.values())
+    engine = backend()
+
+    if engine == "fts5":
+        match = " ".join(f'"{term}"*' for term in terms)
+        ids = _ranked_ids(
+            f"SELECT t.id FROM {FTS_TABLE} f JOIN {table} t ON t.id = f.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s{where} "
+            f"ORDER BY bm25({FTS_TABLE}, {', '.join(map(str, FTS_WEIGHTS))}), t.id DESC "
+            f"LIMIT %s OFFSET %s",
+            [match, *params, limit + 1, offset],
+        )
+    elif engine == "postgresql":
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        ids = _ranked_ids(
+            f"SELECT t.id FROM {table} t, to_tsquery('english', %s) q "
+            f"WHERE t.{SEARCH_COLUMN} @@ q{where} "
+            f"ORDER BY ts_rank_cd(t.{SEARCH_COLUMN}, q) DESC, t.id DESC "
+            f"LIMIT %s OFFSET %s",
+            [tsquery, *params, limit + 1, offset],
+        )
+    else:
+        condition = Q()
+        for term in terms:
+            condition &= Q(subject__icontains=term) | Q(message__icontains=term) | Q(admin_reply__icontains=term)
+        ids = list(
+            SupportTicket.objects.filter(condition, **filters)
+            .order_by("-created_at", "-id")
+            .values_list("id", flat=True)[offset:offset + limit + 1]
+        )
+
+    return ids[:limit], len(ids) > limit
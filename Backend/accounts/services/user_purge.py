@@ -0,0 +1,108 @@
+# accounts/services/user_purge.py
+from django.db import transaction
+from django.utils import timezone
+
+from .analytics_cache import invalidate
+from .analytics_rollup import forget_activity, record_prediction
+
+
+def soft_delete_users(users):
+    """
+    Deactivate `users` (unsaved changes are written with one bulk_update)
+    and mark them for the purge job. Returns the users that changed.
+    """
+    from accounts.models import User
+
+    now = timezone.now()
+    changed = [u for u in users if u.deleted_at is None]
+    for user in changed:
+        user.is_active = False
+        user.deleted_at = now
+    User.objects.bulk_update(changed, ["is_active", "deleted_at"], batch_size=500)
+    invalidate("users", "growth")
+    return changed
+
+
+def purge_plan():
+    """
+    (model, lookup, detach) for the rows hanging off a user, children
+    before parents. Together they cover every CASCADE relation that reaches
+    User, so the final user.delete() has nothing heavy left to collect.
+    Detached rows are kept with the foreign key nulled: audit entries about
+    the user outlive the account (their details carry the email).
+    """
+    from accounts.models import (
+        AdminLog,
+        Certification,
+        Education,
+        MonthlyActiveUser,
+        PredictionFeedback,
+        PredictionHistory,
+        PredictionRole,
+        ProfileFeatureVector,
+    )
+
+    return [
+        (PredictionFeedback, "user", False),
+        (PredictionFeedback, "prediction__user", False),
+        (PredictionRole, "prediction__user", False),
+        (PredictionHistory, "user", False),
+        (Education, "user", False),
+        (Certification, "user", False),
+        (ProfileFeatureVector, "user", False),
+        (MonthlyActiveUser, "user", False),
+        (AdminLog, "target_user", True),
+        (AdminLog, "admin", False),
+    ]
+
+
+def _purge_batch(model, lookup, user_id, batch_size, detach=False):
+    """Delete (or detach) up to batch_size matching rows without the cascade collector."""
+    from accounts.models import MonthlyActiveUser, PredictionHistory
+
+    ids = list(
+        model.objects.filter(**{lookup: user_id})
+        .order_by("pk")
+        .values_list("pk", flat=True)[:batch_size]
+    )
+    if not ids:
+        return 0
+
+    with transaction.atomic():
+        batch = model.objects.filter(pk__in=ids)
+        if detach:
+            return batch.update(**{lookup: None})
+        # _raw_delete sends no post_delete, so take the rows out of the
+        # analytics rollups here
+        if model is PredictionHistory:
+            for prediction in batch.only("user_id", "timestamp", "predicted_roles", "confidence_scores"):
+                record_prediction(prediction, sign=-1)
+        elif model is MonthlyActiveUser:
+            forget_activity(batch.values_list("month", flat=True))
+        return batch._raw_delete(batch.db)
+
+
+def purge_user(user_id, batch_size=1000, progress=None):
+    """
+    Remove a soft-deleted user and everything hanging off it in bounded
+    batches, each in its own short transaction. Safe to re-run after an
+    interruption: whatever is left is picked up again.
+    Calls progress(model, rows_so_far) after every batch and returns the
+    number of dependent rows deleted or detached.
+    """
+    from accounts.models import User
+
+    deleted = 0
+    for model, lookup, detach in purge_plan():
+        while True:
+            count = _purge_batch(model, lookup, user_id, batch_size, detach)
+            if not count:
+                break
+            deleted += count
+            if progress:
+                progress(model, deleted)
+
+    # Only SET_NULL updates and M2M links are left for the collector
+    User.objects.filter(pk=user_id, deleted_at__isnull=False).delete()
+    invalidate("users", "predictions", "universities", "growth", "feedback")
+    return deleted
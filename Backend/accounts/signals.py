@@ -0,0 +1,109 @@
+# accounts/signals.py
+from django.contrib.auth.signals import user_logged_in
+from django.core.signals import request_finished
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import JobRole, SkillCatalogVersion, PredictionHistory, PredictionFeedback, User, Education, Certification, SupportTicket
+from .services.analytics_rollup import record_prediction, record_activity
+from .services.analytics_cache import invalidate
+from .services.audit_log import audit_buffer
+from .services.ticket_search import index_ticket, unindex_ticket
+
+
+# ---------------- SKILL CATALOG ----------------
+
+@receiver(post_save, sender=JobRole)
+@receiver(post_delete, sender=JobRole)
+def bump_skill_catalog_version(sender, **kwargs):
+    SkillCatalogVersion.bump()
+
+
+# ---------------- ANALYTICS ROLLUPS ----------------
+
+@receiver(post_save, sender=PredictionHistory)
+def rollup_prediction_created(sender, instance, created, **kwargs):
+    if created:
+        record_prediction(instance)
+
+
+@receiver(post_delete, sender=PredictionHistory)
+def rollup_prediction_deleted(sender, instance, **kwargs):
+    record_prediction(instance, sign=-1)
+
+
+@receiver(user_logged_in)
+def rollup_login(sender, user, **kwargs):
+    record_activity(user.pk)
+    invalidate("growth")
+
+
+# ---------------- ANALYTICS CACHE ----------------
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_analytics(sender, **kwargs):
+    # Covers logins too: update_last_login saves the user
+    invalidate("users", "growth")
+
+
+@receiver(post_save, sender=PredictionHistory)
+@receiver(post_delete, sender=PredictionHistory)
+def invalidate_prediction_analytics(sender, **kwargs):
+    invalidate("predictions", "growth")
+
+
+@receiver(post_save, sender=Education)
+@receiver(post_delete, sender=Education)
+def invalidate_education_analytics(sender, **kwargs):
+    invalidate("universities")
+
+
+@receiver(post_save, sender=SupportTicket)
+@receiver(post_delete, sender=SupportTicket)
+def invalidate_support_stats(sender, **kwargs):
+    invalidate("support")
+
+
+@receiver(post_save, sender=PredictionFeedback)
+@receiver(post_delete, sender=PredictionFeedback)
+def invalidate_feedback_stats(sender, **kwargs):
+    invalidate("feedback")
+
+
+# ---------------- PROFILE VERSION ----------------
+
+@receiver(post_save, sender=User)
+def bump_user_profile_version(sender, instance, created, update_fields=None, **kwargs):
+    # Logins only touch last_login, which the profile doesn't show
+    if created or (update_fields is not None and set(update_fields) <= {"last_login"}):
+        return
+    User.bump_profile_version(instance.pk)
+
+
+@receiver(post_save, sender=Education)
+@receiver(post_delete, sender=Education)
+@receiver(post_save, sender=Certification)
+@receiver(post_delete, sender=Certification)
+def bump_related_profile_version(sender, instance, **kwargs):
+    User.bump_profile_version(instance.user_id)
+
+
+# ---------------- TICKET SEARCH ----------------
+
+@receiver(post_save, sender=SupportTicket)
+def index_support_ticket(sender, instance, **kwargs):
+    index_ticket(instance)
+
+
+@receiver(post_delete, sender=SupportTicket)
+def unindex_support_ticket(sender, instance, **kwargs):
+    unindex_ticket(instance.pk)
+
+
+# ---------------- AUDIT LOG ----------------
+
+@receiver(request_finished)
+def flush_audit_log(sender, **kwargs):
+    # Off the request path; the response has already been sent
+    audit_buffer.flush_async()
@@ -0,0 +1,26 @@
+from contextlib import contextmanager
+from unittest import mock
+
+from cryptography.fernet import Fernet, MultiFernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from accounts.utils import encryption
+
+
+@contextmanager
+def use_keys(keys, fmt="fernet"):
+    """Run with another FERNET_KEYS list (first key encrypts) and ENCRYPTION_FORMAT"""
+    fernets = [Fernet(key) for key in keys]
+    with mock.patch.multiple(
+        encryption,
+        FERNET_KEYS=list(keys),
+        ENCRYPTION_FORMAT=fmt,
+        primary_fernet=fernets[0],
+        fernet=MultiFernet(fernets),
+        _gcm_ciphers=[AESGCM(encryption._gcm_key(key)) for key in keys],
+    ):
+        encryption.plaintext_cache.clear()
+        try:
+            yield
+        finally:
+            encryption.plaintext_cache.clear()
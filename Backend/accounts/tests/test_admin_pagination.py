@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User, AdminLog, PredictionHistory
+
+
+class AdminKeysetPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+        student = User.objects.create_user(email="student@example.com", password="pass12345")
+
+        # Several logs share a timestamp, so the id tie-breaker matters
+        now = timezone.now()
+        for i in range(23):
+            log = AdminLog.objects.create(admin=cls.admin, target_user=student, action_type=f"A{i}")
+            AdminLog.objects.filter(pk=log.pk).update(timestamp=now - timedelta(minutes=i // 4))
+
+        for _ in range(4):
+            PredictionHistory.objects.create(
+                user=student,
+                predicted_roles=["Data Scientist", "ML Engineer", "Data Analyst"],
+                confidence_scores=[80.0, 60.0, 40.0],
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def walk(self, url, limit):
+        rows, cursor, pages = [], None, 0
+        while True:
+            params = {"limit": limit}
+            if cursor:
+                params["cursor"] = cursor
+            body = self.client.get(url, params).json()
+            rows.extend(body["results"])
+            pages += 1
+            cursor = body["next"]
+            if not cursor:
+                return rows, pages
+
+    def test_pages_cover_every_row_once_in_order(self):
+        rows, pages = self.walk("/api/admin/logs/", limit=5)
+
+        expected = list(AdminLog.objects.order_by("-timestamp", "-id").values_list("id", flat=True))
+        self.assertEqual([r["id"] for r in rows], expected)
+        self.assertEqual(pages, 5)
+
+    def test_mixed_direction_ordering(self):
+        rows, _ = self.walk("/api/admin/predictions/", limit=5)
+
+        self.assertEqual(len(rows), 12)
+        self.assertEqual(
+            [r["predicted_job"] for r in rows[:3]],
+            ["Data Scientist", "ML Engineer", "Data Analyst"],
+        )
+
+    def test_query_count_does_not_grow_with_depth(self):
+        first = self.client.get("/api/admin/logs/", {"limit": 5}).json()
+        with CaptureQueriesContext(connection) as first_page:
+            self.client.get("/api/admin/logs/", {"limit": 5})
+        with CaptureQueriesContext(connection) as deeper_page:
+            self.client.get("/api/admin/logs/", {"limit": 5, "cursor": first["next"]})
+
+        self.assertEqual(len(first_page), len(deeper_page))
+        self.assertNotIn("OFFSET", deeper_page.captured_queries[-1]["sql"].upper())
+
+    def test_invalid_cursor_is_rejected(self):
+        for url in ("/api/admin/users/", "/api/admin/logs/", "/api/admin/support/",
+                    "/api/admin/feedback/", "/api/admin/predictions/"):
+            self.assertEqual(self.client.get(url, {"cursor": "not-a-cursor"}).status_code, 400, url)
+
+    def test_limit_is_capped(self):
+        body = self.client.get("/api/admin/users/", {"limit": 100000}).json()
+        self.assertEqual(len(body["results"]), 2)
+        self.assertIsNone(body["next"])
@@ -0,0 +1,80 @@
+from datetime import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+
+
+class AdminUserFilterTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        tz = timezone.get_current_timezone()
+
+        def user(email, name, joined, role="student", is_flagged=False, deleted=False):
+            u = User.objects.create_user(email=email, name=name, role=role)
+            User.objects.filter(pk=u.pk).update(
+                date_joined=datetime(2026, 5, joined, 12, tzinfo=tz),
+                is_flagged=is_flagged,
+                deleted_at=timezone.now() if deleted else None,
+            )
+            return u
+
+        cls.admin = user("admin@example.com", "Root", 1, role="admin")
+        cls.alice = user("alice@example.com", "Alice Kumar", 2)
+        cls.alan = user("alan@example.com", "Alan Rao", 3, is_flagged=True)
+        cls.bob = user("bob@example.com", "Bob Alvarez", 4)
+        cls.gone = user("ally@example.com", "Ally", 5, deleted=True)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def list(self, **params):
+        response = self.client.get("/api/admin/users/", params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def emails(self, body):
+        return [row["email"] for row in body["results"]]
+
+    def test_prefix_search_on_email_or_name(self):
+        self.assertEqual(self.emails(self.list(q="AL")), ["alan@example.com", "alice@example.com"])
+        # A prefix, not a substring: "Bob Alvarez" doesn't match "alv"
+        self.assertEqual(self.emails(self.list(q="alv")), [])
+        self.assertEqual(self.emails(self.list(q="bob")), ["bob@example.com"])
+
+    def test_soft_deleted_users_never_show(self):
+        body = self.list()
+
+        self.assertNotIn("ally@example.com", self.emails(body))
+        self.assertEqual(body["count"], 4)
+
+    def test_facets_ignore_their_own_filter(self):
+        body = self.list(q="a", role="student", is_flagged="false")
+
+        self.assertEqual(self.emails(body), ["alice@example.com"])
+        self.assertEqual(body["count"], 1)
+        # Counts under the search only, so the UI can show what each facet would give
+        self.assertEqual(body["facets"], {
+            "role": {"student": 2, "admin": 1},
+            "is_flagged": {"true": 1, "false": 2},
+        })
+
+    def test_joined_range_and_paging(self):
+        first = self.list(joined_from="2026-05-02", joined_to="2026-05-03", limit=1)
+        self.assertEqual(self.emails(first), ["alan@example.com"])
+        self.assertEqual(first["count"], 2)
+
+        second = self.client.get("/api/admin/users/", {
+            "joined_from": "2026-05-02", "joined_to": "2026-05-03", "limit": 1, "cursor": first["next"],
+        }).data
+        self.assertEqual(self.emails(second), ["alice@example.com"])
+        self.assertNotIn("facets", second)
+        self.assertIsNone(second["next"])
+
+    def test_bad_filters(self):
+        for params in ({"is_flagged": "maybe"}, {"joined_from": "May"}, {"cursor": "nope"}):
+            self.assertEqual(self.client.get("/api/admin/users/", params).status_code, 400, params)
@@ -0,0 +1,85 @@
+import gzip
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import User, AdminLog, MaintenanceCheckpoint
+
+
+class ArchiveAdminLogsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+        cls.student = User.objects.create_user(email="student@example.com", password="pass12345")
+
+        now = timezone.now()
+        cls.old = [
+            AdminLog.objects.create(admin=cls.admin, target_user=cls.student, action_type="USER_FLAGGED",
+                                    details=f"old {i}", timestamp=now - timedelta(days=400 + 40 * i))
+            for i in range(3)
+        ]
+        cls.recent = AdminLog.objects.create(admin=cls.admin, action_type="TRAINING_STARTED",
+                                             timestamp=now - timedelta(days=5))
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+
+    def archive(self, *args, **options):
+        out = StringIO()
+        call_command("archive_admin_logs", *args, days=365, batch_size=2, output_dir=self.dir, stdout=out, **options)
+        return out.getvalue()
+
+    def read_archives(self):
+        rows = []
+        for name in sorted(os.listdir(self.dir)):
+            with gzip.open(os.path.join(self.dir, name), "rt") as f:
+                rows.extend(json.loads(line) for line in f)
+        return rows
+
+    def test_dry_run_changes_nothing(self):
+        out = self.archive("--dry-run")
+
+        self.assertIn("Dry run: 3 entries", out)
+        self.assertEqual(AdminLog.objects.count(), 4)
+        self.assertEqual(os.listdir(self.dir), [])
+
+    def test_moves_expired_entries_into_monthly_files(self):
+        out = self.archive()
+
+        self.assertIn("Archived 3 entries into 3 files", out)
+        self.assertEqual(list(AdminLog.objects.values_list("id", flat=True)), [self.recent.pk])
+        self.assertEqual(len(os.listdir(self.dir)), 3)
+        for name in os.listdir(self.dir):
+            self.assertRegex(name, r"^adminlog-\d{4}-\d{2}\.ndjson\.gz$")
+
+        rows = self.read_archives()
+        self.assertEqual(sorted(r["details"] for r in rows), ["old 0", "old 1", "old 2"])
+        self.assertEqual({r["target_user__email"] for r in rows}, {"student@example.com"})
+
+        checkpoint = MaintenanceCheckpoint.objects.get(name="archive_admin_logs")
+        self.assertEqual(checkpoint.processed, 3)
+        self.assertIsNotNone(checkpoint.finished_at)
+
+    def test_rerun_appends_to_existing_month_files(self):
+        self.archive()
+        month_of_first = self.old[0].timestamp
+        AdminLog.objects.create(admin=self.admin, action_type="USER_FLAGGED", details="late", timestamp=month_of_first)
+
+        self.archive()
+
+        self.assertEqual(len(os.listdir(self.dir)), 3)
+        self.assertEqual(sorted(r["details"] for r in self.read_archives()), ["late", "old 0", "old 1", "old 2"])
+
+    def test_partitioning_requires_postgres(self):
+        with self.assertRaisesMessage(CommandError, "PostgreSQL"):
+            call_command("partition_admin_logs", stdout=StringIO())
@@ -0,0 +1,37 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+
+
+class AnalyticsCacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def total_users(self):
+        return self.client.get("/api/admin/analytics/").data["total_users"]
+
+    def test_warm_dashboard_runs_no_queries(self):
+        self.total_users()
+        with self.assertNumQueries(0):
+            self.total_users()
+
+    def test_invalidated_only_when_the_write_commits(self):
+        self.assertEqual(self.total_users(), 1)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            User.objects.create_user(email="student@example.com", password="pass12345")
+            # Not committed yet: a concurrent read must not re-cache under a new version
+            self.assertEqual(self.total_users(), 1)
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.total_users(), 2)
@@ -0,0 +1,84 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import (
+    User, PredictionHistory, DailyPredictionStat, DailyRoleStat, MonthlyActiveUser, MonthlyActivityStat,
+)
+
+
+def rollup_state():
+    return {
+        "days": sorted(
+            DailyPredictionStat.objects.filter(predictions__gt=0)
+            .values_list("day", "predictions", "confidence_sum", "confidence_count")
+        ),
+        "roles": sorted(DailyRoleStat.objects.filter(count__gt=0).values_list("day", "job_role", "count")),
+        "active": sorted(MonthlyActivityStat.objects.filter(active_users__gt=0).values_list("month", "active_users")),
+    }
+
+
+class AnalyticsRollupTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+        cls.student = User.objects.create_user(email="student@example.com", password="pass12345")
+        cls.now = timezone.now()
+
+    def predict(self, roles, scores, days_ago=0, user=None):
+        when = self.now - timedelta(days=days_ago)
+        with mock.patch("django.utils.timezone.now", return_value=when):
+            return PredictionHistory.objects.create(
+                user=user or self.student, predicted_roles=roles, confidence_scores=scores)
+
+    def rebuild(self):
+        call_command("rebuild_analytics_rollups", stdout=StringIO())
+
+    def test_incremental_updates_match_a_full_rebuild(self):
+        self.predict(["Data Analyst", "Data Scientist"], [62.5, 37.5])
+        self.predict(["Data Analyst"], [80.0], days_ago=1)
+        self.predict(["Backend Developer", "Data Analyst"], [50.0, 25.0], days_ago=40, user=self.admin)
+        self.predict(["Designer"], [10.0], days_ago=1).delete()
+
+        today = timezone.localdate(self.now)
+        day = DailyPredictionStat.objects.get(day=today)
+        self.assertEqual((day.predictions, day.confidence_sum, day.confidence_count), (1, 100.0, 2))
+        self.assertEqual(DailyRoleStat.objects.get(day=today - timedelta(days=1), job_role="Designer").count, 0)
+
+        incremental = rollup_state()
+        self.rebuild()
+        self.assertEqual(rollup_state(), incremental)
+
+    def test_activity_counts_each_user_once_per_month(self):
+        self.predict(["Data Analyst"], [80.0])
+        self.predict(["Data Analyst"], [70.0])
+        APIClient().post("/api/auth/login/", {"email": "student@example.com", "password": "pass12345"})
+
+        month = timezone.localdate().replace(day=1)
+        self.assertEqual(MonthlyActiveUser.objects.filter(month=month).count(), 1)
+        self.assertEqual(MonthlyActivityStat.objects.get(month=month).active_users, 1)
+
+        incremental = rollup_state()
+        self.rebuild()
+        self.assertEqual(rollup_state(), incremental)
+
+    def test_dashboard_reads_the_rollups(self):
+        self.predict(["Data Analyst", "Data Scientist"], [62.5, 37.5])
+        self.predict(["Data Analyst"], [80.0], days_ago=1)
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        cache.clear()
+
+        response = client.get("/api/admin/analytics/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["total_predictions"], 2)
+        self.assertEqual(response.data["avg_confidence"], 60.0)
+        self.assertEqual(response.data["top_jobs"][0], {"job": "Data Analyst", "count": 2})
@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User, PredictionHistory
+
+
+class AnalyticsTimeSeriesTests(TestCase):
+    url = "/api/admin/analytics/timeseries/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+        student = User.objects.create_user(email="student@example.com", password="pass12345")
+
+        now = timezone.now()
+        for days_ago in (0, 1, 1, 8, 40, 400):
+            prediction = PredictionHistory.objects.create(
+                user=student, predicted_roles=["Data Scientist"], confidence_scores=[80.0]
+            )
+            PredictionHistory.objects.filter(pk=prediction.pk).update(
+                timestamp=now - timedelta(days=days_ago)
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def get_series(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_query_count_is_constant_across_range_lengths(self):
+        today = timezone.localdate()
+        counts = []
+        for days, bucket in ((7, "day"), (90, "day"), (730, "day"), (730, "week"), (3650, "month")):
+            params = {
+                "start": (today - timedelta(days=days)).isoformat(),
+                "end": today.isoformat(),
+                "bucket": bucket,
+            }
+            with CaptureQueriesContext(connection) as queries:
+                self.get_series(**params)
+            counts.append(len(queries))
+
+        self.assertEqual(len(set(counts)), 1, counts)
+
+    def test_buckets_count_rows_and_fill_gaps(self):
+        today = timezone.localdate()
+        data = self.get_series(
+            start=(today - timedelta(days=9)).isoformat(),
+            end=today.isoformat(),
+            bucket="day",
+            series="predictions",
+        )
+
+        points = data["series"]["predictions"]
+        self.assertEqual(len(points), 10)
+        self.assertEqual(points[-1], {"period": today.isoformat(), "count": 1})
+        self.assertEqual(points[-2]["count"], 2)
+        self.assertEqual(sum(p["count"] for p in points), 4)
+
+    def test_month_buckets_start_on_first_day(self):
+        data = self.get_series(start="2025-01-15", end="2025-03-02", bucket="month", series="signups")
+        self.assertEqual(
+            [p["period"] for p in data["series"]["signups"]],
+            ["2025-01-01", "2025-02-01", "2025-03-01"],
+        )
+
+    def test_rejects_bad_parameters(self):
+        for params in ({"bucket": "hour"}, {"start": "yesterday"}, {"series": "logins"},
+                       {"start": "2025-02-01", "end": "2025-01-01"}):
+            self.assertEqual(self.client.get(self.url, params).status_code, 400, params)
+
+    def test_admin_only(self):
+        self.client.force_authenticate(User.objects.get(email="student@example.com"))
+        self.assertEqual(self.client.get(self.url).status_code, 403)
@@ -0,0 +1,78 @@
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.db import DatabaseError, transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import User, AdminLog
+from accounts.services.audit_log import audit_buffer, log_admin_action
+from rest_framework.test import APIClient
+
+
+class AuditLogBufferTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+
+    def tearDown(self):
+        audit_buffer.flush()
+
+    @override_settings(AUDIT_LOG_MODE="sync")
+    def test_sync_mode_writes_immediately(self):
+        log_admin_action(admin=self.admin, action_type="TRAINING_STARTED")
+        self.assertEqual(AdminLog.objects.count(), 1)
+
+    @override_settings(AUDIT_LOG_MODE="buffered", AUDIT_LOG_BUFFER_SIZE=100, AUDIT_LOG_FLUSH_SECONDS=3600)
+    def test_buffered_entries_keep_their_timestamp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(3):
+                log_admin_action(admin=self.admin, action_type=f"A{i}")
+        self.assertEqual(AdminLog.objects.count(), 0)
+
+        flushed_at = timezone.now()
+        with self.assertNumQueries(1):
+            self.assertEqual(audit_buffer.flush(), 3)
+        self.assertLess(max(AdminLog.objects.values_list("timestamp", flat=True)), flushed_at)
+
+    @override_settings(AUDIT_LOG_MODE="buffered", AUDIT_LOG_BUFFER_SIZE=2, AUDIT_LOG_FLUSH_SECONDS=3600)
+    def test_size_threshold_schedules_a_flush(self):
+        with mock.patch.object(audit_buffer, "flush_async") as flush_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                log_admin_action(admin=self.admin, action_type="A")
+            flush_async.assert_not_called()
+            with self.captureOnCommitCallbacks(execute=True):
+                log_admin_action(admin=self.admin, action_type="B")
+            flush_async.assert_called_once()
+
+    @override_settings(AUDIT_LOG_MODE="buffered", AUDIT_LOG_BUFFER_SIZE=100, AUDIT_LOG_FLUSH_SECONDS=3600)
+    def test_buffered_entries_wait_for_the_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    log_admin_action(admin=self.admin, action_type="ROLLED_BACK")
+                    raise DatabaseError
+            except DatabaseError:
+                pass
+            log_admin_action(admin=self.admin, action_type="COMMITTED")
+            self.assertEqual(len(audit_buffer), 0)
+
+        self.assertEqual(len(audit_buffer), 1)
+        audit_buffer.flush()
+        self.assertEqual(list(AdminLog.objects.values_list("action_type", flat=True)), ["COMMITTED"])
+
+    def test_export_follows_action_time_not_flush_order(self):
+        # A buffered entry flushed late gets a higher id than newer actions
+        now = timezone.now()
+        late = AdminLog.objects.create(admin=self.admin, action_type="NEWER")
+        early = AdminLog.objects.create(admin=self.admin, action_type="OLDER")
+        AdminLog.objects.filter(pk=early.pk).update(timestamp=now - timedelta(minutes=5))
+        AdminLog.objects.filter(pk=late.pk).update(timestamp=now)
+
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        response = client.get("/api/admin/logs/export/", {"output": "ndjson"})
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual([row["action"] for row in rows], ["OLDER", "NEWER"])
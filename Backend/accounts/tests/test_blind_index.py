@@ -0,0 +1,97 @@
+from io import StringIO
+
+from cryptography.fernet import Fernet
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from accounts.models import User, Education
+from accounts.utils.encryption import blind_index, _blind_index_key_for
+from accounts.views import AdminAnalyticsView
+
+
+class BlindIndexKeyTests(SimpleTestCase):
+
+    def test_rotation_requires_a_dedicated_key(self):
+        old, new = Fernet.generate_key().decode(), Fernet.generate_key().decode()
+
+        with self.assertRaisesMessage(ImproperlyConfigured, "BLIND_INDEX_KEY"):
+            _blind_index_key_for([new, old], "")
+        self.assertEqual(_blind_index_key_for([new, old], "pinned"), b"pinned")
+
+    def test_single_key_fallback_is_derived_not_the_key(self):
+        key = Fernet.generate_key().decode()
+
+        derived = _blind_index_key_for([key], "")
+        self.assertEqual(derived, _blind_index_key_for([key], ""))
+        self.assertNotIn(key.encode(), derived)
+        self.assertNotEqual(derived, _blind_index_key_for([Fernet.generate_key().decode()], ""))
+
+
+class BlindIndexTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [User.objects.create_user(email=f"s{i}@example.com") for i in range(3)]
+
+    def add(self, user, university, degree="B.Tech"):
+        return Education.objects.create(user=user, degree=degree, university=university)
+
+    def test_save_indexes_normalized_plaintext(self):
+        first = self.add(self.users[0], "Anna University")
+        second = self.add(self.users[1], "  anna   UNIVERSITY ")
+
+        self.assertEqual(first.university_bidx, blind_index("anna university"))
+        self.assertEqual(first.university_bidx, second.university_bidx)
+        self.assertEqual(len(first.university_bidx), 64)
+        self.assertEqual(
+            list(Education.objects.filter(university_bidx=blind_index("Anna University")).order_by("id")),
+            [first, second],
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT university, university_bidx FROM accounts_education WHERE id = %s", [first.pk])
+            stored, bidx = cursor.fetchone()
+        self.assertNotIn("Anna", stored)
+        self.assertNotIn("Anna", bidx)
+
+    def test_blank_values_have_no_index(self):
+        education = self.add(self.users[0], "")
+        self.assertEqual(education.university_bidx, "")
+        self.assertEqual(blind_index("   "), "")
+
+    def test_changed_value_is_reindexed(self):
+        education = self.add(self.users[0], "DTU Delhi")
+        education = Education.objects.get(pk=education.pk)
+        education.university = "IIT Delhi"
+        education.save()
+
+        self.assertEqual(Education.objects.get(pk=education.pk).university_bidx, blind_index("IIT Delhi"))
+
+    def test_university_analytics_group_on_the_index(self):
+        self.add(self.users[0], "Anna University")
+        self.add(self.users[1], "anna university")
+        self.add(self.users[2], None)
+
+        section = AdminAnalyticsView.universities_section()
+
+        self.assertEqual(len(section), 2)
+        self.assertEqual(section[0]["count"], 2)
+        self.assertEqual(section[0]["name"].lower(), "anna university")
+        self.assertEqual(section[1], {"name": "Unknown", "count": 1})
+
+    def test_backfill_fills_missing_indexes(self):
+        for user, university in zip(self.users, ["Anna University", "DTU Delhi", "IIT Delhi"]):
+            self.add(user, university)
+        Education.objects.update(university_bidx="", degree_bidx="")
+
+        out = StringIO()
+        call_command("backfill_blind_indexes", batch_size=2, stdout=out)
+
+        self.assertIn("backfilled for 3", out.getvalue())
+        self.assertEqual(
+            sorted(Education.objects.values_list("university_bidx", flat=True)),
+            sorted(blind_index(u) for u in ["Anna University", "DTU Delhi", "IIT Delhi"]),
+        )
+        self.assertFalse(Education.objects.filter(degree_bidx="").exists())
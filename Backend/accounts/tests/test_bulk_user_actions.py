@@ -0,0 +1,79 @@
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import User, AdminLog
+
+
+@override_settings(AUDIT_LOG_MODE="sync")
+class BulkUserActionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+        cls.students = [User.objects.create_user(email=f"s{i}@example.com") for i in range(3)]
+        cls.ids = [s.pk for s in cls.students]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def bulk(self, **payload):
+        return self.client.post("/api/admin/users/bulk/", payload, format="json")
+
+    def statuses(self, response):
+        return {r["id"]: r["status"] for r in response.data["results"]}
+
+    def test_flag_reports_every_id(self):
+        User.objects.filter(pk=self.ids[0]).update(is_flagged=True, flag_reason="spam")
+
+        response = self.bulk(action="flag", ids=[*self.ids, self.admin.pk, 999999], reason="spam")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["updated"], 2)
+        self.assertEqual(self.statuses(response), {
+            self.ids[0]: "unchanged",
+            self.ids[1]: "updated",
+            self.ids[2]: "updated",
+            self.admin.pk: "skipped",
+            999999: "not_found",
+        })
+        self.assertEqual(User.objects.filter(is_flagged=True, flag_reason="spam").count(), 3)
+        self.assertFalse(User.objects.get(pk=self.admin.pk).is_flagged)
+        self.assertEqual(AdminLog.objects.filter(action_type="USER_FLAGGED").count(), 2)
+
+    def test_set_role_by_filter(self):
+        response = self.bulk(action="set_role", role="admin", filter={"q": "s"})
+
+        self.assertEqual(response.data["updated"], 3)
+        self.assertEqual(User.objects.filter(role="admin").count(), 4)
+        details = set(AdminLog.objects.filter(action_type="ROLE_UPDATED").values_list("details", flat=True))
+        self.assertEqual(details, {"Role changed from student to admin"})
+
+    def test_delete_is_soft_and_idempotent(self):
+        first = self.bulk(action="delete", ids=self.ids[:2])
+        second = self.bulk(action="delete", ids=self.ids[:2])
+
+        self.assertEqual(first.data["updated"], 2)
+        self.assertEqual(set(self.statuses(second).values()), {"not_found"})
+        deleted = User.objects.filter(pk__in=self.ids[:2])
+        self.assertEqual(deleted.count(), 2)
+        self.assertFalse(deleted.filter(deleted_at__isnull=True).exists())
+        self.assertFalse(deleted.filter(is_active=True).exists())
+        self.assertEqual(AdminLog.objects.filter(action_type="USER_DELETED").count(), 2)
+
+    def test_soft_deleted_users_are_not_found(self):
+        self.bulk(action="delete", ids=[self.ids[0]])
+
+        for action, extra in (("flag", {"reason": "spam"}), ("set_role", {"role": "admin"})):
+            response = self.bulk(action=action, ids=self.ids[:2], **extra)
+            self.assertEqual(self.statuses(response), {self.ids[0]: "not_found", self.ids[1]: "updated"})
+
+        deleted = User.objects.get(pk=self.ids[0])
+        self.assertEqual((deleted.role, deleted.is_flagged), ("student", False))
+
+    def test_rejects_bad_requests(self):
+        self.assertEqual(self.bulk(action="ban", ids=self.ids).status_code, 400)
+        self.assertEqual(self.bulk(action="set_role", role="owner", ids=self.ids).status_code, 400)
+        self.assertEqual(self.bulk(action="flag", ids="1,2").status_code, 400)
+        self.assertEqual(self.bulk(action="flag").status_code, 400)
+        self.assertFalse(AdminLog.objects.exists())
@@ -0,0 +1,77 @@
+from cryptography.fernet import Fernet
+from django.db import connection
+from django.test import TestCase
+
+from accounts.models import User, Education
+from accounts.tests.keys import use_keys
+from accounts.utils import encryption
+
+
+def raw_column(education, column):
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {column} FROM accounts_education WHERE id = %s", [education.pk])
+        return cursor.fetchone()[0]
+
+
+class CompactFormatTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.key = encryption.FERNET_KEYS[0]
+        cls.user = User.objects.create_user(email="student@example.com", password="pass12345")
+
+    def test_gcm_round_trip_and_fernet_still_readable(self):
+        with use_keys([self.key], fmt="gcm"):
+            token = encryption.encrypt_value("Computer Science")
+            self.assertTrue(token.startswith(encryption.GCM_PREFIX))
+            self.assertEqual(encryption.decrypt_token(token), "Computer Science")
+
+            legacy = encryption.encrypt_as("Physics", "fernet")
+            self.assertEqual(encryption.decrypt_token(legacy), "Physics")
+            self.assertTrue(encryption.needs_rotation(legacy))
+            self.assertFalse(encryption.needs_rotation(token))
+
+    def test_unread_fernet_token_is_upgraded_on_save(self):
+        with use_keys([self.key]):
+            education = Education.objects.create(user=self.user, degree="B.Tech")
+
+        with use_keys([self.key], fmt="gcm"):
+            education = Education.objects.get(pk=education.pk)
+            education.cgpa = "8.5"
+            education.save()
+
+            self.assertTrue(raw_column(education, "degree").startswith(encryption.GCM_PREFIX))
+            self.assertEqual(Education.objects.get(pk=education.pk).degree, "B.Tech")
+
+
+class LegacyPlaintextUpgradeTests(TestCase):
+    """Rows written before encryption must stay savable when the format or keys change"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.key = encryption.FERNET_KEYS[0]
+        user = User.objects.create_user(email="student@example.com", password="pass12345")
+        cls.education = Education.objects.create(user=user, degree="B.Tech", specialization="CSE")
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE accounts_education SET specialization = %s WHERE id = %s", ["CSE", cls.education.pk]
+            )
+
+    def save_untouched(self):
+        education = Education.objects.get(pk=self.education.pk)
+        education.cgpa = "7.9"
+        education.save()
+        return Education.objects.get(pk=self.education.pk)
+
+    def test_save_under_gcm_keeps_legacy_plaintext(self):
+        with use_keys([self.key], fmt="gcm"):
+            education = self.save_untouched()
+            self.assertEqual(raw_column(education, "specialization"), "CSE")
+            self.assertEqual(education.specialization, "CSE")
+            self.assertEqual(str(education.cgpa), "7.90")
+
+    def test_save_with_two_keys_keeps_legacy_plaintext(self):
+        with use_keys([Fernet.generate_key().decode(), self.key]):
+            education = self.save_untouched()
+            self.assertEqual(raw_column(education, "specialization"), "CSE")
+            self.assertEqual(education.degree, "B.Tech")
@@ -0,0 +1,79 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from accounts.utils import encryption
+from accounts.utils.encryption import PlaintextCache
+
+
+class PlaintextCacheTests(SimpleTestCase):
+
+    def test_evicts_least_recently_used_past_the_byte_budget(self):
+        entry = PlaintextCache._entry_size("token-0", "value-0")
+        cache = PlaintextCache(max_bytes=entry * 2)
+
+        cache.put("token-0", "value-0")
+        cache.put("token-1", "value-1")
+        cache.get("token-0")
+        cache.put("token-2", "value-2")
+
+        self.assertEqual(cache.get("token-0"), "value-0")
+        self.assertIsNone(cache.get("token-1"))
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["evictions"]), (2, 1))
+        self.assertLessEqual(stats["bytes"], stats["max_bytes"])
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+
+    def test_oversized_values_are_not_cached(self):
+        cache = PlaintextCache(max_bytes=10)
+        cache.put("token", "value")
+        self.assertEqual(cache.stats()["entries"], 0)
+
+
+class DecryptManyTests(SimpleTestCase):
+
+    def setUp(self):
+        encryption.plaintext_cache.clear()
+        self.addCleanup(encryption.plaintext_cache.clear)
+
+    def test_keeps_input_order_and_decrypts_duplicates_once(self):
+        a, b = encryption.encrypt_value("alpha"), encryption.encrypt_value("beta")
+
+        with mock.patch.object(encryption, "decrypt_token", wraps=encryption.decrypt_token) as decrypt_token:
+            result = encryption.decrypt_many([b, a, "", None, b, a])
+
+        self.assertEqual(result, ["beta", "alpha", "", "", "beta", "alpha"])
+        self.assertEqual(decrypt_token.call_count, 2)
+
+        # Second pass is served from the cache
+        with mock.patch.object(encryption, "decrypt_token") as decrypt_token:
+            self.assertEqual(encryption.decrypt_many([a, b]), ["alpha", "beta"])
+        decrypt_token.assert_not_called()
+
+    def test_large_batches_go_through_the_pool(self):
+        values = [f"value {i}" for i in range(encryption.DECRYPT_PARALLEL_THRESHOLD + 8)]
+        tokens = [encryption.encrypt_value(v) for v in values]
+
+        self.assertEqual(encryption.decrypt_many(tokens), values)
+
+    def test_unreadable_tokens_come_back_as_stored(self):
+        with self.assertLogs("accounts.utils.encryption", "WARNING"):
+            self.assertEqual(encryption.decrypt_many(["not a token"]), ["not a token"])
+
+
+class EncryptionCacheViewTests(TestCase):
+
+    def test_admin_sees_cache_stats(self):
+        admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        response = client.get("/api/admin/encryption/cache/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.data),
+            {"entries", "bytes", "max_bytes", "hits", "misses", "evictions", "hit_rate"},
+        )
@@ -0,0 +1,79 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+
+from accounts import fields
+from accounts.fields import Ciphertext, decrypt_fields
+from accounts.models import User, Education
+
+
+def raw_degree(education):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT degree FROM accounts_education WHERE id = %s", [education.pk])
+        return cursor.fetchone()[0]
+
+
+class EncryptedTextFieldTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="student@example.com", password="pass12345")
+        cls.education = Education.objects.create(
+            user=cls.user, degree="B.Tech", specialization="Computer Science", university="DTU Delhi")
+
+    def setUp(self):
+        patcher = mock.patch.object(fields, "decrypt_value", wraps=fields.decrypt_value)
+        self.decrypt = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_values_are_stored_encrypted(self):
+        token = raw_degree(self.education)
+
+        self.assertNotEqual(token, "B.Tech")
+        self.assertEqual(Education.objects.values_list("degree", flat=True).get(), token)
+        self.assertIs(type(Education.objects.values_list("degree", flat=True).get()), Ciphertext)
+
+    def test_decrypts_lazily_and_once_per_instance(self):
+        education = Education.objects.get(pk=self.education.pk)
+        self.decrypt.assert_not_called()
+
+        self.assertEqual(education.degree, "B.Tech")
+        self.assertEqual(education.degree, "B.Tech")
+        self.assertEqual(self.decrypt.call_count, 1)
+
+    def test_unchanged_values_keep_their_token(self):
+        token = raw_degree(self.education)
+
+        education = Education.objects.get(pk=self.education.pk)
+        education.cgpa = "7.9"
+        education.save()
+        self.assertEqual(raw_degree(education), token)
+        self.decrypt.assert_not_called()
+
+        # Read, then assigned the same plaintext: still no re-encryption
+        education.degree = education.degree
+        education.save()
+        self.assertEqual(raw_degree(education), token)
+
+    def test_changed_values_are_reencrypted(self):
+        token = raw_degree(self.education)
+
+        education = Education.objects.get(pk=self.education.pk)
+        education.degree = "M.Tech"
+        education.save()
+
+        self.assertNotEqual(raw_degree(education), token)
+        self.assertEqual(Education.objects.get(pk=education.pk).degree, "M.Tech")
+
+    def test_decrypt_fields_memoizes_a_whole_batch(self):
+        other = User.objects.create_user(email="other@example.com", password="pass12345")
+        Education.objects.create(user=other, degree="MBA")
+
+        with mock.patch.object(fields, "decrypt_many", wraps=fields.decrypt_many) as decrypt_many:
+            rows = decrypt_fields(Education.objects.order_by("id"), "degree", "university")
+
+        self.assertEqual(decrypt_many.call_count, 2)
+        self.assertEqual([row.degree for row in rows], ["B.Tech", "MBA"])
+        self.assertEqual([row.university for row in rows], ["DTU Delhi", None])
+        self.decrypt.assert_not_called()
@@ -0,0 +1,74 @@
+import csv
+import io
+import json
+from datetime import datetime
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User, PredictionHistory, AdminLog
+
+
+def body(response):
+    return b"".join(response.streaming_content).decode()
+
+
+class ExportTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+        cls.student = User.objects.create_user(email="student@example.com", password="pass12345")
+
+        tz = timezone.get_current_timezone()
+        for day, roles in ((1, ["Data Analyst", "Data Scientist"]), (2, ["Backend Developer"]), (3, ["Designer"])):
+            when = datetime(2026, 3, day, 23, 30, tzinfo=tz)
+            with mock.patch("django.utils.timezone.now", return_value=when):
+                PredictionHistory.objects.create(
+                    user=cls.student, predicted_roles=roles, confidence_scores=[70.0] * len(roles))
+            AdminLog.objects.create(admin=cls.admin, action_type="USER_FLAGGED", target_user=cls.student,
+                                    details=f"day {day}", timestamp=when)
+        AdminLog.objects.create(admin=cls.admin, action_type="TRAINING_STARTED", details="no target",
+                                timestamp=datetime(2026, 3, 2, 8, 0, tzinfo=tz))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_prediction_csv_streams_one_line_per_role(self):
+        response = self.client.get("/api/admin/predictions/export/")
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn('filename="prediction_logs.csv"', response["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(body(response))))
+        self.assertEqual(
+            [(r["predicted_job"], r["rank"]) for r in rows],
+            [("Data Analyst", "0"), ("Data Scientist", "1"), ("Backend Developer", "0"), ("Designer", "0")],
+        )
+        self.assertEqual(rows[0]["user"], "student@example.com")
+
+    def test_date_range_is_inclusive_in_local_time(self):
+        response = self.client.get("/api/admin/predictions/export/", {"output": "ndjson", "start": "2026-03-02", "end": "2026-03-02"})
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in body(response).splitlines()]
+        self.assertEqual([line["predicted_job"] for line in lines], ["Backend Developer"])
+
+    def test_admin_log_export(self):
+        response = self.client.get("/api/admin/logs/export/", {"output": "ndjson", "start": "2026-03-02"})
+
+        lines = [json.loads(line) for line in body(response).splitlines()]
+        self.assertEqual([line["details"] for line in lines], ["no target", "day 2", "day 3"])
+        self.assertEqual(lines[0]["target"], "System")
+        self.assertEqual(lines[0]["admin"], "admin@example.com")
+        self.assertEqual(list(lines[0]), ["id", "time", "admin", "action", "target", "details", "is_flagged"])
+
+    def test_bad_parameters(self):
+        self.assertEqual(self.client.get("/api/admin/predictions/export/", {"output": "xml"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/admin/logs/export/", {"start": "March"}).status_code, 400)
+
+        self.client.force_authenticate(self.student)
+        self.assertEqual(self.client.get("/api/admin/logs/export/").status_code, 403)
@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User, PredictionHistory, PredictionFeedback
+
+
+class FeedbackStatsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+        student = User.objects.create_user(email="student@example.com", password="pass12345")
+
+        def rate(top_role, version, rating, days_ago=0):
+            prediction = PredictionHistory.objects.create(
+                user=student,
+                predicted_roles=[top_role, "Data Analyst"],
+                confidence_scores=[70.0, 30.0],
+                model_version=version,
+            )
+            feedback = PredictionFeedback.objects.create(user=student, prediction=prediction, rating=rating)
+            PredictionFeedback.objects.filter(pk=feedback.pk).update(
+                created_at=timezone.now() - timedelta(days=days_ago))
+
+        rate("Data Scientist", "v2", 5)
+        rate("Data Scientist", "v2", 4, days_ago=1)
+        rate("ML Engineer", "v1", 2, days_ago=1)
+        rate("ML Engineer", "v1", 1, days_ago=45)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_aggregates(self):
+        with self.assertNumQueries(4):
+            data = self.client.get("/api/admin/feedback/stats/").data
+
+        self.assertEqual(data["count"], 4)
+        self.assertEqual(data["mean_rating"], 3.0)
+        self.assertEqual(data["distribution"], {"1": 1, "2": 1, "3": 0, "4": 1, "5": 1})
+
+        roles = {row["job_role"]: row for row in data["by_role"]}
+        self.assertEqual(set(roles), {"Data Scientist", "ML Engineer"})
+        self.assertEqual(roles["Data Scientist"]["mean_rating"], 4.5)
+        self.assertEqual(roles["ML Engineer"]["distribution"]["1"], 1)
+
+        self.assertEqual([(row["model_version"], row["count"]) for row in data["by_model_version"]], [("v2", 2), ("v1", 2)])
+
+        self.assertEqual(len(data["trend"]), 30)
+        self.assertEqual(sum(day["count"] for day in data["trend"]), 3)
+        self.assertEqual(data["trend"][-1]["mean_rating"], 5.0)
+
+    def test_new_feedback_invalidates(self):
+        self.client.get("/api/admin/feedback/stats/")
+        with self.captureOnCommitCallbacks(execute=True):
+            PredictionFeedback.objects.create(
+                user=self.admin, prediction=PredictionHistory.objects.first(), rating=3)
+        self.assertEqual(self.client.get("/api/admin/feedback/stats/").data["count"], 5)
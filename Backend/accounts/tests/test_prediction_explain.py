@@ -0,0 +1,83 @@
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User, Education, PredictionHistory, PredictionExplanation
+from accounts.services import ml_explainer
+
+
+class PredictionExplanationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="student@example.com", password="pass12345", skills=["Python", "SQL", "Excel"])
+        Education.objects.create(
+            user=cls.user, degree="B.Tech", specialization="Computer Science",
+            university="DTU Delhi", cgpa="8.10", year_of_completion=2024)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        # Keep the precompute off the executor; tests run it inline
+        self.schedule = mock.Mock(return_value=True)
+        for target in ("accounts.views.schedule_explanation", "accounts.services.ml_explainer.schedule_explanation"):
+            patcher = mock.patch(target, self.schedule)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def predict(self):
+        response = self.client.post("/api/predictions/predict/")
+        self.assertEqual(response.status_code, 200)
+        return PredictionHistory.objects.filter(user=self.user).latest("id")
+
+    def explain(self, prediction):
+        return self.client.get(f"/api/predictions/history/{prediction.pk}/explanation/")
+
+    def test_pending_until_computed_then_served_from_cache(self):
+        prediction = self.predict()
+        self.assertTrue(prediction.feature_fingerprint)
+        self.schedule.assert_called_once()
+
+        self.assertEqual(self.explain(prediction).status_code, 202)
+
+        features, fingerprint, version = self.schedule.call_args.args
+        ml_explainer.compute_explanation(features, fingerprint, version)
+        self.assertEqual(PredictionExplanation.objects.count(), 1)
+
+        with self.assertNumQueries(2):
+            response = self.explain(prediction)
+        self.assertEqual(response.status_code, 200)
+        explanations = response.data["explanations"]
+        self.assertEqual([e["job_role"] for e in explanations], prediction.predicted_roles)
+        contributions = explanations[0]["contributions"]
+        self.assertTrue(contributions)
+        self.assertLessEqual(len(contributions), ml_explainer.TOP_CONTRIBUTIONS)
+        # One-hot columns are folded back into the feature they encode
+        features_seen = {c["feature"] for c in contributions}
+        self.assertFalse(any(f.startswith("degree_") for f in features_seen))
+
+    def test_identical_profiles_share_one_explanation(self):
+        first = self.predict()
+        features, fingerprint, version = self.schedule.call_args.args
+        ml_explainer.compute_explanation(features, fingerprint, version)
+
+        second = self.predict()
+
+        self.assertEqual(first.feature_fingerprint, second.feature_fingerprint)
+        self.assertEqual(self.explain(second).status_code, 200)
+        self.assertEqual(PredictionExplanation.objects.count(), 1)
+
+    def test_profile_edit_makes_old_prediction_stale(self):
+        prediction = self.predict()
+        Education.objects.filter(user=self.user).update(cgpa="6.50")
+
+        self.assertEqual(self.explain(prediction).status_code, 409)
+
+    def test_other_users_predictions_are_hidden(self):
+        prediction = self.predict()
+        other = User.objects.create_user(email="other@example.com", password="pass12345")
+        self.client.force_authenticate(other)
+
+        self.assertEqual(self.explain(prediction).status_code, 404)
@@ -0,0 +1,78 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User, PredictionHistory, PredictionRole
+
+
+class PredictionRoleTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="student@example.com", password="pass12345")
+
+    def create(self, **kwargs):
+        return PredictionHistory.objects.create(
+            user=self.user,
+            predicted_roles=["Data Analyst", "Data Scientist", "ML Engineer"],
+            confidence_scores=[80.0, 55.5, 20.0],
+            missing_skills=[["Excel"], ["Statistics", "R"]],
+            **kwargs,
+        )
+
+    def roles_of(self, prediction):
+        return list(
+            prediction.roles.order_by("rank")
+            .values_list("rank", "job_role", "confidence", "missing_skill_count")
+        )
+
+    def test_rows_mirror_the_json_lists(self):
+        prediction = self.create()
+
+        self.assertEqual(self.roles_of(prediction), [
+            (0, "Data Analyst", 80.0, 1),
+            (1, "Data Scientist", 55.5, 2),
+            (2, "ML Engineer", 20.0, 0),
+        ])
+        self.assertEqual(set(prediction.roles.values_list("created", flat=True)), {prediction.timestamp})
+
+    def test_edits_resync_and_deletes_cascade(self):
+        prediction = self.create()
+        prediction.predicted_roles = ["Backend Developer"]
+        prediction.confidence_scores = [64.0]
+        prediction.missing_skills = []
+        prediction.save()
+
+        self.assertEqual(self.roles_of(prediction), [(0, "Backend Developer", 64.0, 0)])
+
+        prediction.delete()
+        self.assertFalse(PredictionRole.objects.exists())
+
+    def test_backfill_creates_missing_rows_only(self):
+        first, second = self.create(), self.create()
+        first.roles.all().delete()
+        untouched = list(second.roles.values_list("id", flat=True))
+
+        out = StringIO()
+        call_command("backfill_prediction_roles", batch_size=1, stdout=out)
+
+        self.assertIn("Created 3 role rows for 1 predictions", out.getvalue())
+        self.assertEqual(len(self.roles_of(first)), 3)
+        self.assertEqual(PredictionRole.objects.count(), 6)
+        self.assertEqual(list(second.roles.values_list("id", flat=True)), untouched)
+
+    def test_admin_logs_list_one_row_per_role(self):
+        self.create()
+        admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        response = client.get("/api/admin/predictions/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(r["predicted_job"], r["confidence"]) for r in response.data["results"]],
+            [("Data Analyst", 80.0), ("Data Scientist", 55.5), ("ML Engineer", 20.0)],
+        )
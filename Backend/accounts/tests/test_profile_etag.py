@@ -0,0 +1,62 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User, Education, Certification
+
+
+class ProfileConditionalGetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="student@example.com", password="pass12345")
+        Education.objects.create(user=cls.user, degree="B.Tech", university="Anna University")
+        Certification.objects.create(user=cls.user, cert_name="AWS", issuing_organization="Amazon", issue_date="2024-01-01")
+
+    def get(self, **headers):
+        # Authenticate with a fresh row, like the JWT backend does per request
+        client = APIClient()
+        client.force_authenticate(User.objects.get(pk=self.user.pk))
+        return client.get("/api/profile/", **headers)
+
+    def test_full_response_uses_fixed_queries(self):
+        user = User.objects.get(pk=self.user.pk)
+        client = APIClient()
+        client.force_authenticate(user)
+        with self.assertNumQueries(2):
+            response = client.get("/api/profile/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["education"]["degree"], "B.Tech")
+        self.assertEqual([c["cert_name"] for c in response.data["certifications"]], ["AWS"])
+        self.assertTrue(response["ETag"])
+        self.assertTrue(response["Last-Modified"])
+
+    def test_if_none_match_answers_304_without_queries(self):
+        etag = self.get()["ETag"]
+
+        user = User.objects.get(pk=self.user.pk)
+        client = APIClient()
+        client.force_authenticate(user)
+        with self.assertNumQueries(0):
+            response = client.get("/api/profile/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_writes_change_the_etag(self):
+        etags = {self.get()["ETag"]}
+
+        Certification.objects.create(user=self.user, cert_name="GCP", issuing_organization="Google", issue_date="2024-06-01")
+        etags.add(self.get()["ETag"])
+
+        education = Education.objects.get(user=self.user)
+        education.degree = "M.Tech"
+        education.save()
+        etags.add(self.get()["ETag"])
+
+        user = User.objects.get(pk=self.user.pk)
+        user.skills = ["Python"]
+        user.save()
+        response = self.get(HTTP_IF_NONE_MATCH=self.get()["ETag"] + ', "stale"')
+        self.assertEqual(response.status_code, 304)
+        etags.add(self.get()["ETag"])
+
+        self.assertEqual(len(etags), 4)
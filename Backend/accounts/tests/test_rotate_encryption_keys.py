@@ -0,0 +1,81 @@
+from io import StringIO
+
+from cryptography.fernet import Fernet
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from accounts.models import User, Education, MaintenanceCheckpoint
+from accounts.tests.keys import use_keys
+from accounts.utils import encryption
+
+CHECKPOINT_NAME = "rotate_encryption_keys:education"
+
+
+class RotateEncryptionKeysTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.old_key = encryption.FERNET_KEYS[0]
+        cls.new_key = Fernet.generate_key().decode()
+        user = User.objects.create_user(email="student@example.com", password="pass12345")
+        with use_keys([cls.old_key]):
+            cls.ids = [
+                Education.objects.create(user=user, degree=f"Degree {i}", university=f"University {i}").pk
+                for i in range(5)
+            ]
+
+    def rotate(self, **options):
+        out = StringIO()
+        with use_keys([self.new_key, self.old_key]):
+            call_command("rotate_encryption_keys", batch_size=2, rate=0, stdout=out, **options)
+        return out.getvalue()
+
+    def raw_tokens(self, pk):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT degree, university FROM accounts_education WHERE id = %s", [pk])
+            return cursor.fetchone()
+
+    def readable_with_new_key_only(self, pk):
+        with use_keys([self.new_key]):
+            try:
+                return [encryption.decrypt_token(t) for t in self.raw_tokens(pk)]
+            except encryption.InvalidToken:
+                return None
+
+    def test_reencrypts_under_the_new_primary_key(self):
+        self.rotate()
+
+        for i, pk in enumerate(self.ids):
+            self.assertEqual(self.readable_with_new_key_only(pk), [f"Degree {i}", f"University {i}"])
+        checkpoint = MaintenanceCheckpoint.objects.get(name=CHECKPOINT_NAME)
+        self.assertIsNotNone(checkpoint.finished_at)
+        self.assertEqual((checkpoint.processed, checkpoint.changed), (5, 5))
+
+    def test_resumes_after_the_checkpoint(self):
+        MaintenanceCheckpoint.objects.create(name=CHECKPOINT_NAME, last_id=self.ids[1], processed=2, changed=2)
+
+        out = self.rotate()
+
+        self.assertIn(f"Resuming after id {self.ids[1]}", out)
+        # Rows before the checkpoint were (supposedly) done already and aren't touched again
+        self.assertIsNone(self.readable_with_new_key_only(self.ids[0]))
+        for pk in self.ids[2:]:
+            self.assertIsNotNone(self.readable_with_new_key_only(pk))
+        self.assertEqual(MaintenanceCheckpoint.objects.get(name=CHECKPOINT_NAME).processed, 5)
+
+    def test_unreadable_row_is_skipped_and_reported(self):
+        bad = self.ids[2]
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE accounts_education SET degree = %s WHERE id = %s", ["plain text", bad])
+
+        out = self.rotate()
+
+        self.assertIn(f"ids: {bad}", out)
+        self.assertEqual(self.raw_tokens(bad)[0], "plain text")
+        # The readable field of the bad row and every other row still rotate
+        with use_keys([self.new_key]):
+            self.assertEqual(encryption.decrypt_token(self.raw_tokens(bad)[1]), "University 2")
+        for pk in self.ids[3:]:
+            self.assertIsNotNone(self.readable_with_new_key_only(pk))
+        self.assertIsNotNone(MaintenanceCheckpoint.objects.get(name=CHECKPOINT_NAME).finished_at)
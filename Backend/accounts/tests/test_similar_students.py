@@ -0,0 +1,95 @@
+import os
+import tempfile
+from unittest import mock
+
+import numpy as np
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User, ProfileFeatureVector
+from accounts.services import similar_students
+from accounts.services.ml_predictor import load_model
+
+ROLES = ["Data Analyst", "Backend Developer", "Designer"]
+
+
+class SimilarStudentsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        models = load_model()
+        cls.version = models["version"]
+        cls.width = len(models["feature_columns"])
+
+        # Three well separated clusters of synthetic profiles, one role each
+        rng = np.random.default_rng(7)
+        cls.centres = rng.normal(scale=10, size=(len(ROLES), cls.width))
+        cls.users = []
+        for i in range(30):
+            cluster = i % len(ROLES)
+            user = User.objects.create_user(email=f"s{i}@example.com")
+            vector = cls.centres[cluster] + rng.normal(scale=0.1, size=cls.width)
+            similar_students.store_feature_vector(user, vector, cls.version, ROLES[cluster])
+            cls.users.append(user)
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        for patcher in (
+            mock.patch.object(similar_students, "INDEX_PATH", os.path.join(tmp.name, "index.joblib")),
+            mock.patch.dict(similar_students._cache, {"mtime": None, "index": None}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def store(self, user, cluster):
+        similar_students.store_feature_vector(user, self.centres[cluster], self.version, ROLES[cluster])
+
+    def test_full_build_finds_the_closest_cluster(self):
+        index, mode = similar_students.build_index()
+
+        self.assertEqual(mode, "full")
+        self.assertEqual(index.size, 30)
+        result = similar_students.similar_students(self.centres[1], k=5)
+        self.assertEqual(result["neighbours"], 5)
+        self.assertEqual(result["roles"], [{"job_role": "Backend Developer", "count": 5, "share": 1.0}])
+
+    def test_incremental_refresh_moves_and_drops_profiles(self):
+        similar_students.build_index()
+        moved, removed = self.users[0], self.users[2]
+        self.store(moved, 1)
+        ProfileFeatureVector.objects.filter(user=removed).delete()
+
+        index, mode = similar_students.build_index()
+
+        self.assertEqual(mode, "incremental")
+        self.assertEqual(index.size, 29)
+        nearest = [user_id for user_id, _, _ in index.query(self.centres[1], k=11)]
+        self.assertIn(moved.pk, nearest)
+        self.assertEqual(nearest.count(moved.pk), 1)
+        self.assertNotIn(removed.pk, [u for u, _, _ in index.query(self.centres[2], k=29)])
+
+        # A full rebuild agrees with the patched index
+        rebuilt, _ = similar_students.build_index(full=True)
+        self.assertEqual(rebuilt.size, 29)
+        self.assertEqual(
+            {u for u, _, _ in rebuilt.query(self.centres[1], k=11)},
+            set(nearest),
+        )
+
+    def test_endpoint_excludes_the_requesting_user(self):
+        client = APIClient()
+        user = self.users[1]
+        client.force_authenticate(user)
+
+        self.assertEqual(client.get("/api/predictions/similar-students/").status_code, 503)
+
+        similar_students.build_index()
+        response = client.get("/api/predictions/similar-students/", {"k": 3})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["roles"], [{"job_role": "Backend Developer", "count": 3, "share": 1.0}])
+        with mock.patch.object(similar_students.SimilarityIndex, "query", autospec=True,
+                               side_effect=similar_students.SimilarityIndex.query) as query:
+            client.get("/api/predictions/similar-students/")
+        self.assertEqual(query.call_args.kwargs["exclude_user"], user.pk)
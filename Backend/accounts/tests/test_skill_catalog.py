@@ -0,0 +1,74 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import User, AdminLog, JobRole, SkillCatalogVersion
+from accounts.services import skill_index
+from accounts.services.job_skill_map import JOB_REQUIRED_SKILLS
+
+
+@override_settings(SKILL_CATALOG_CHECK_SECONDS=0, AUDIT_LOG_MODE="sync")
+class SkillCatalogTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+
+    def setUp(self):
+        # Every test starts from the seed index, like a fresh worker
+        seed = {"index": skill_index.SkillIndex(JOB_REQUIRED_SKILLS, version=0), "checked_at": None}
+        patcher = mock.patch.dict(skill_index._state, seed)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_catalog_is_seeded_from_the_static_map(self):
+        response = self.client.get("/api/admin/skill-catalog/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["version"], 1)
+        self.assertEqual(len(response.data["roles"]), len(JOB_REQUIRED_SKILLS))
+
+    def test_writes_bump_the_version_and_reload_the_index(self):
+        self.assertNotIn("Prompt Engineer", skill_index.get_skill_index().roles)
+
+        response = self.client.post(
+            "/api/admin/skill-catalog/",
+            {"name": "  Prompt   Engineer ", "required_skills": ["Python", " python", "", "LLMs"]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["name"], "Prompt Engineer")
+        self.assertEqual(response.data["required_skills"], ["Python", "LLMs"])
+        self.assertEqual(SkillCatalogVersion.current(), 2)
+        index = skill_index.get_skill_index()
+        self.assertEqual(index.version, 2)
+        self.assertEqual(index.required("Prompt Engineer"), ["Python", "LLMs"])
+
+        role = JobRole.objects.get(name="Prompt Engineer")
+        self.client.patch(f"/api/admin/skill-catalog/{role.pk}/", {"required_skills": ["LLMs"]}, format="json")
+        self.assertEqual(skill_index.get_skill_index().required("Prompt Engineer"), ["LLMs"])
+
+        self.client.delete(f"/api/admin/skill-catalog/{role.pk}/")
+        self.assertEqual(SkillCatalogVersion.current(), 4)
+        self.assertNotIn("Prompt Engineer", skill_index.get_skill_index().roles)
+        self.assertEqual(AdminLog.objects.filter(action_type="SKILL_CATALOG_UPDATED").count(), 3)
+
+    def test_unchanged_version_does_not_reread_the_catalog(self):
+        index = skill_index.get_skill_index()
+
+        with self.assertNumQueries(1):
+            self.assertIs(skill_index.get_skill_index(), index)
+
+    def test_rejects_bad_skills_and_non_admins(self):
+        response = self.client.post(
+            "/api/admin/skill-catalog/", {"name": "X", "required_skills": "Python"}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+        student = User.objects.create_user(email="student@example.com", password="pass12345")
+        self.client.force_authenticate(student)
+        self.assertEqual(self.client.get("/api/admin/skill-catalog/").status_code, 403)
@@ -0,0 +1,86 @@
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from accounts.services.skill_index import SkillIndex
+
+CATALOG = {
+    "Backend Developer": ["Python", "Django", "SQL", "python"],
+    "Data Analyst": ["SQL", "Excel", "Power BI"],
+    "Designer": ["Figma"],
+    "Intern": [],
+}
+
+
+class SkillIndexTests(SimpleTestCase):
+
+    def setUp(self):
+        self.index = SkillIndex(CATALOG)
+
+    def test_skills_are_matched_case_and_space_insensitively(self):
+        self.assertEqual(self.index.required("Backend Developer"), ["Python", "Django", "SQL"])
+        self.assertEqual(self.index.skill_id("  sql "), self.index.skill_id("SQL"))
+
+        mask = self.index.mask_for(["PYTHON", "sql", "Rust"])
+        self.assertEqual(self.index.missing("Backend Developer", mask), ["Django"])
+        self.assertEqual(self.index.missing("Unknown", mask), [])
+
+    def test_match_counts(self):
+        mask = self.index.mask_for(["python", "sql"])
+        required, matched = self.index.match_counts(["Data Analyst", "Backend Developer", "Unknown"], mask)
+
+        self.assertEqual(required.tolist(), [3, 3, 0])
+        self.assertEqual(matched.tolist(), [1, 2, 0])
+
+    def test_candidates_only_touch_overlapping_roles(self):
+        counts = self.index.candidate_roles(self.index.mask_for(["SQL", "Excel"]))
+
+        self.assertEqual(
+            {self.index.roles[i]: c for i, c in counts.items()},
+            {"Backend Developer": 1, "Data Analyst": 2},
+        )
+
+    def test_rank_by_jaccard(self):
+        ranked = self.index.rank_roles(["sql", "excel", "Rust"])
+
+        self.assertEqual(
+            [r["job_role"] for r in ranked],
+            ["Data Analyst", "Backend Developer", "Designer", "Intern"],
+        )
+        analyst = ranked[0]
+        # 2 shared out of {SQL, Excel, Power BI, Rust}
+        self.assertEqual(analyst["jaccard"], 0.5)
+        self.assertEqual(analyst["coverage"], round(2 / 3, 4))
+        self.assertEqual(analyst["missing_skills"], ["Power BI"])
+
+        filtered = self.index.rank_roles(["sql"], min_overlap=1, limit=1)
+        self.assertEqual([r["job_role"] for r in filtered], ["Backend Developer"])
+
+
+class ClosestRolesViewTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="student@example.com", password="pass12345", skills=["HTML", "CSS", "JavaScript", "React"])
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_uses_profile_skills_by_default(self):
+        response = self.client.get("/api/predictions/closest-roles/", {"limit": 2})
+
+        self.assertEqual(response.status_code, 200)
+        top = response.data["roles"][0]
+        self.assertEqual(top["job_role"], "Frontend Developer")
+        self.assertEqual(top["jaccard"], 1.0)
+        self.assertEqual(len(response.data["roles"]), 2)
+
+    def test_skills_override(self):
+        response = self.client.get("/api/predictions/closest-roles/", {"skills": "Python, Django,REST APIs,SQL"})
+
+        self.assertEqual(response.data["skills"], ["Python", "Django", "REST APIs", "SQL"])
+        self.assertEqual(response.data["roles"][0]["job_role"], "Backend Developer")
+
+    def test_limit_must_be_positive(self):
+        for limit in ("-2", "0", "two"):
+            response = self.client.get("/api/predictions/closest-roles/", {"limit": limit})
+            self.assertEqual(response.status_code, 400, limit)
@@ -0,0 +1,69 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User, Education
+from accounts.services.ml_predictor import predict_jobs, prediction_input_for_user
+from accounts.views import SkillWhatIfView
+
+
+class SkillWhatIfTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="student@example.com", password="pass12345", skills=["Python", "sql"])
+        Education.objects.create(
+            user=cls.user, degree="B.Tech", specialization="Computer Science",
+            university="DTU Delhi", cgpa="8.10", year_of_completion=2024)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_ranks_missing_skills_by_gain_for_the_top_role(self):
+        response = self.client.get("/api/predictions/what-if/")
+
+        self.assertEqual(response.status_code, 200)
+        data = prediction_input_for_user(self.user)
+        top = predict_jobs(data)[0]
+        self.assertEqual(response.data["job_role"], top["job_role"])
+        self.assertEqual(response.data["confidence"], top["confidence"])
+
+        skills = response.data["skills"]
+        gains = [s["gain"] for s in skills]
+        self.assertEqual(gains, sorted(gains, reverse=True))
+        # Skills the user already has are never suggested, whatever the case
+        names = {s["skill"].lower() for s in skills}
+        self.assertNotIn("python", names)
+        self.assertNotIn("sql", names)
+
+    def test_batched_scores_match_a_fresh_prediction(self):
+        response = self.client.get("/api/predictions/what-if/", {"limit": 1})
+        self.assertEqual(len(response.data["skills"]), 1)
+        best = response.data["skills"][0]
+
+        data = prediction_input_for_user(self.user)
+        data["skills"] = data["skills"] + [best["skill"]]
+        rescored = {p["job_role"]: p["confidence"] for p in predict_jobs(data)}
+
+        self.assertAlmostEqual(rescored[response.data["job_role"]], best["confidence"], places=2)
+
+    def test_explicit_role_and_bad_input(self):
+        response = self.client.get("/api/predictions/what-if/", {"role": "Data Analyst"})
+        self.assertEqual(response.data["job_role"], "Data Analyst")
+
+        self.assertEqual(self.client.get("/api/predictions/what-if/", {"role": "Astronaut"}).status_code, 400)
+        for limit in ("x", "0", "-2"):
+            self.assertEqual(self.client.get("/api/predictions/what-if/", {"limit": limit}).status_code, 400)
+
+    def test_limit_is_capped(self):
+        response = self.client.get("/api/predictions/what-if/", {"limit": 10_000})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["skills"]), SkillWhatIfView.MAX_LIMIT)
+
+    def test_requires_education(self):
+        other = User.objects.create_user(email="other@example.com", password="pass12345")
+        self.client.force_authenticate(other)
+
+        self.assertEqual(self.client.get("/api/predictions/what-if/").status_code, 400)
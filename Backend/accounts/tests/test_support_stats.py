@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User, SupportTicket
+
+
+class SupportStatsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+        now = timezone.now()
+
+        # Resolved tickets answered after 1..10 hours
+        for hours in range(1, 11):
+            ticket = SupportTicket.objects.create(type="bug", subject="s", message="m", status="resolved")
+            created = now - timedelta(days=10)
+            SupportTicket.objects.filter(pk=ticket.pk).update(
+                created_at=created, replied_at=created + timedelta(hours=hours))
+
+        # Open backlog aged 2 hours, 2 days and 10 days
+        for age in (timedelta(hours=2), timedelta(days=2), timedelta(days=10)):
+            ticket = SupportTicket.objects.create(type="query", subject="s", message="m")
+            SupportTicket.objects.filter(pk=ticket.pk).update(created_at=now - age)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_stats(self):
+        with self.assertNumQueries(3):
+            data = self.client.get("/api/admin/support/stats/").data
+
+        self.assertEqual(data["total"], 13)
+        self.assertEqual(data["by_status"], {"resolved": 10, "open": 3})
+        self.assertEqual(data["by_type"], {"bug": 10, "query": 3})
+        self.assertEqual(data["backlog"], {
+            "total": 3,
+            "age": {"under_1d": 1, "1d_to_3d": 1, "3d_to_7d": 0, "over_7d": 1},
+        })
+        self.assertEqual(data["time_to_reply_seconds"], {"replied": 10, "median": 5 * 3600, "p90": 9 * 3600})
+
+    def test_cached_until_a_ticket_changes(self):
+        self.client.get("/api/admin/support/stats/")
+        with self.assertNumQueries(0):
+            self.client.get("/api/admin/support/stats/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SupportTicket.objects.create(type="bug", subject="s", message="m")
+        self.assertEqual(self.client.get("/api/admin/support/stats/").data["total"], 14)
@@ -0,0 +1,48 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User, SupportTicket
+
+
+class SupportTicketSearchTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+        student = User.objects.create_user(email="student@example.com", password="pass12345")
+
+        cls.subject_hit = SupportTicket.objects.create(
+            user=student, type="bug", subject="Password reset broken", message="The link expired")
+        cls.message_hit = SupportTicket.objects.create(
+            user=student, type="query", subject="Login", message="Cannot reset my password")
+        SupportTicket.objects.create(user=student, type="bug", subject="Dark mode", message="Colors are off")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def search(self, **params):
+        response = self.client.get("/api/admin/support/search/", params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_ranked_prefix_search(self):
+        data = self.search(q="passw reset")
+        self.assertEqual([t["id"] for t in data["results"]], [self.subject_hit.id, self.message_hit.id])
+
+    def test_filters_and_pagination(self):
+        self.assertEqual([t["id"] for t in self.search(q="password", type="query")["results"]], [self.message_hit.id])
+
+        first = self.search(q="password", limit=1)
+        second = self.search(q="password", limit=1, cursor=first["next"])
+        self.assertEqual(len(first["results"]), 1)
+        self.assertIsNone(second["next"])
+        self.assertNotEqual(first["results"][0]["id"], second["results"][0]["id"])
+
+    def test_index_follows_edits_and_deletes(self):
+        self.subject_hit.admin_reply = "Fixed the mailer"
+        self.subject_hit.save()
+        self.assertEqual([t["id"] for t in self.search(q="mailer")["results"]], [self.subject_hit.id])
+
+        self.subject_hit.delete()
+        self.assertEqual(self.search(q="mailer")["results"], [])
@@ -0,0 +1,100 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import (
+    User, Education, PredictionHistory, PredictionRole, PredictionFeedback, SupportTicket, AdminLog,
+    DailyPredictionStat, DailyRoleStat, MonthlyActiveUser, MonthlyActivityStat, MaintenanceCheckpoint,
+)
+from accounts.services.analytics_rollup import rebuild_rollups, record_activity
+
+
+def rollup_state():
+    return {
+        "days": sorted(DailyPredictionStat.objects.filter(predictions__gt=0).values_list("day", "predictions", "confidence_count")),
+        "roles": sorted(DailyRoleStat.objects.filter(count__gt=0).values_list("day", "job_role", "count")),
+        "active": sorted(MonthlyActivityStat.objects.filter(active_users__gt=0).values_list("month", "active_users")),
+    }
+
+
+@override_settings(AUDIT_LOG_MODE="sync")
+class UserPurgeTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="pass12345", role="admin")
+        cls.student = User.objects.create_user(email="student@example.com", password="pass12345")
+        cls.other = User.objects.create_user(email="other@example.com", password="pass12345")
+
+        for user in (cls.student, cls.other):
+            prediction = PredictionHistory.objects.create(
+                user=user, predicted_roles=["Data Scientist", "ML Engineer"], confidence_scores=[70.0, 30.0])
+            PredictionFeedback.objects.create(user=user, prediction=prediction, rating=4)
+            record_activity(user.pk)
+        for _ in range(4):
+            PredictionHistory.objects.create(
+                user=cls.student, predicted_roles=["Data Analyst"], confidence_scores=[55.0])
+        Education.objects.create(user=cls.student, degree="B.Tech")
+        SupportTicket.objects.create(user=cls.student, type="bug", subject="s", message="m")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def purge(self, **options):
+        out = StringIO()
+        call_command("purge_deleted_users", batch_size=2, rate=0, stdout=out, **options)
+        return out.getvalue()
+
+    def test_delete_is_a_soft_delete(self):
+        response = self.client.delete(f"/api/admin/users/{self.student.pk}/")
+
+        self.assertEqual(response.status_code, 204)
+        student = User.objects.get(pk=self.student.pk)
+        self.assertFalse(student.is_active)
+        self.assertIsNotNone(student.deleted_at)
+        self.assertEqual(PredictionHistory.objects.filter(user=student).count(), 5)
+        listed = [u["id"] for u in self.client.get("/api/admin/users/").data["results"]]
+        self.assertNotIn(student.pk, listed)
+        login = APIClient().post("/api/auth/login/", {"email": "student@example.com", "password": "pass12345"})
+        self.assertEqual(login.status_code, 400)
+
+    def test_purge_removes_dependents_and_keeps_rollups_consistent(self):
+        self.client.delete(f"/api/admin/users/{self.student.pk}/")
+
+        self.purge()
+
+        self.assertFalse(User.objects.filter(pk=self.student.pk).exists())
+        self.assertFalse(PredictionHistory.objects.filter(user_id=self.student.pk).exists())
+        self.assertEqual(PredictionRole.objects.count(), 2)
+        self.assertEqual(PredictionFeedback.objects.count(), 1)
+        self.assertFalse(Education.objects.exists())
+        self.assertFalse(MonthlyActiveUser.objects.filter(user_id=self.student.pk).exists())
+        self.assertIsNone(SupportTicket.objects.get().user_id)
+        # The audit trail survives, detached from the purged row
+        log = AdminLog.objects.get(action_type="USER_DELETED")
+        self.assertIsNone(log.target_user_id)
+        self.assertIn("student@example.com", log.details)
+
+        incremental = rollup_state()
+        rebuild_rollups()
+        self.assertEqual(incremental, rollup_state())
+        self.assertEqual(incremental["active"], [(timezone.localdate().replace(day=1), 1)])
+
+    def test_interrupted_purge_is_picked_up_again(self):
+        self.client.delete(f"/api/admin/users/{self.student.pk}/")
+        MaintenanceCheckpoint.objects.create(name="purge_deleted_users", last_id=self.student.pk)
+        # A previous run got as far as the feedback
+        PredictionFeedback.objects.filter(user=self.student).delete()
+
+        out = self.purge()
+
+        self.assertIn(f"Resuming at user {self.student.pk}", out)
+        self.assertFalse(User.objects.filter(pk=self.student.pk).exists())
+        checkpoint = MaintenanceCheckpoint.objects.get(name="purge_deleted_users")
+        self.assertEqual(checkpoint.processed, 1)
+        self.assertIsNotNone(checkpoint.finished_at)
+        self.assertEqual(self.client.get("/api/admin/users/purge/").data["pending_users"], 0)
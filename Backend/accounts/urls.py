@@ -2,6 +2,8 @@
 from django.urls import path
 from .views import (
     AdminSupportTicketListView,
+    AdminSupportTicketSearchView,
+    AdminSupportStatsView,
     MySupportTicketsView,
     RegisterView,
     LoginView,
@@ -11,18 +13,32 @@ from .views import (
     CertificationDetailView,
     PredictionHistoryListCreateView,
     PredictionHistoryDetailView,
+    PredictionExplanationView,
+    SkillWhatIfView,
+    ClosestRolesView,
+    SimilarStudentsView,
     SupportTicketDeleteView,
     TestEncryptionView,
     JobPredictionView,
     AdminAnalyticsView,
     AdminUserListView,
+    AdminBulkUserActionView,
+    AdminPurgeStatusView,
     AdminUpdateUserRoleView,
     AdminDeleteUserView,
     AdminModelStatusView,
+    AdminEncryptionCacheView,
+    AdminAnalyticsCacheView,
+    AdminAnalyticsTimeSeriesView,
+    AdminPredictionLogsExportView,
+    AdminLogsExportView,
+    AdminSkillCatalogView,
+    AdminSkillCatalogDetailView,
     AdminRetrainModelView,
     AdminPredictionLogsView,
     PredictionFeedbackCreateView,
     AdminPredictionFeedbackView,
+    AdminFeedbackStatsView,
     AdminLogsView,
     AdminFlagUserView,
     SupportTicketCreateView,
@@ -63,6 +79,26 @@ urlpatterns = [
         PredictionHistoryDetailView.as_view(),
         name="prediction-history-detail",
     ),
+    path(
+        "predictions/history/<int:pk>/explanation/",
+        PredictionExplanationView.as_view(),
+        name="prediction-explanation",
+    ),
+    path(
+        "predictions/what-if/",
+        SkillWhatIfView.as_view(),
+        name="prediction-what-if",
+    ),
+    path(
+        "predictions/closest-roles/",
+        ClosestRolesView.as_view(),
+        name="prediction-closest-roles",
+    ),
+    path(
+        "predictions/similar-students/",
+        SimilarStudentsView.as_view(),
+        name="prediction-similar-students",
+    ),
     path(
     "predictions/predict/",
     JobPredictionView.as_view(),
@@ -72,12 +108,20 @@ urlpatterns = [
     path("test-encryption/", TestEncryptionView.as_view(), name="test-encryption"),
     # ADMIN
     path("admin/analytics/", AdminAnalyticsView.as_view()),
+    path("admin/analytics/cache/", AdminAnalyticsCacheView.as_view()),
+    path("admin/analytics/timeseries/", AdminAnalyticsTimeSeriesView.as_view()),
     path("admin/users/", AdminUserListView.as_view()),
+    path("admin/users/bulk/", AdminBulkUserActionView.as_view()),
+    path("admin/users/purge/", AdminPurgeStatusView.as_view()),
     path("admin/users/<int:user_id>/role/", AdminUpdateUserRoleView.as_view()),
     path("admin/users/<int:user_id>/", AdminDeleteUserView.as_view()),
     path("admin/model/status/", AdminModelStatusView.as_view()),
+    path("admin/encryption/cache/", AdminEncryptionCacheView.as_view()),
+    path("admin/skill-catalog/", AdminSkillCatalogView.as_view()),
+    path("admin/skill-catalog/<int:pk>/", AdminSkillCatalogDetailView.as_view()),
     path("admin/model/retrain/", AdminRetrainModelView.as_view()),
     path("admin/predictions/", AdminPredictionLogsView.as_view()),
+    path("admin/predictions/export/", AdminPredictionLogsExportView.as_view()),
     path(
     "predictions/feedback/",
     PredictionFeedbackCreateView.as_view(),
@@ -89,7 +133,9 @@ path(
     AdminPredictionFeedbackView.as_view(),
     name="admin-feedback",
 ),
+path("admin/feedback/stats/", AdminFeedbackStatsView.as_view()),
 path("admin/logs/", AdminLogsView.as_view()),
+path("admin/logs/export/", AdminLogsExportView.as_view()),
 path(
     "admin/users/<int:user_id>/flag/",
     AdminFlagUserView.as_view(),
@@ -98,8 +144,10 @@ path("admin/users/<int:user_id>/role/", AdminUpdateUserRoleView.as_view()),
 path("admin/model/retrain/", AdminRetrainModelView.as_view()),
 path("support/tickets/", SupportTicketCreateView.as_view()),
 path("admin/support/status/", AdminSupportStatusView.as_view()),
+path("admin/support/stats/", AdminSupportStatsView.as_view()),
 path("admin/support/<int:pk>/reply/", AdminSupportReplyView.as_view()),
 path("admin/support/", AdminSupportTicketListView.as_view()),
+path("admin/support/search/", AdminSupportTicketSearchView.as_view()),
 path("support/my-tickets/", MySupportTicketsView.as_view()),
 path("support/tickets/<int:pk>/delete/", SupportTicketDeleteView.as_view()),
 path("admin/users/<int:user_id>/flag/", FlagUserView.as_view()),
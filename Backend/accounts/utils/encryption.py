@@ -1,50 +1,343 @@
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, MultiFernet, InvalidToken
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import base64
+import hashlib
+import hmac
+import logging
 import os
+import sys
+import threading
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 
-# Get FERNET_KEY from settings
-FERNET_KEY = getattr(settings, 'FERNET_KEY', None)
+logger = logging.getLogger(__name__)
 
-if not FERNET_KEY:
-    print("⚠️ WARNING: FERNET_KEY not set in Django settings")
-    # Generate a temporary key for development
-    from cryptography.fernet import Fernet
-    FERNET_KEY = Fernet.generate_key().decode()
-    print(f"⚠️ Generated temporary FERNET_KEY: {FERNET_KEY[:20]}...")
+# Ordered key list from settings: the first key encrypts, all keys decrypt
+FERNET_KEYS = list(getattr(settings, 'FERNET_KEYS', None) or [])
+if not FERNET_KEYS and getattr(settings, 'FERNET_KEY', None):
+    FERNET_KEYS = [settings.FERNET_KEY]
+
+if not FERNET_KEYS:
+    raise ImproperlyConfigured("FERNET_KEYS is not set in Django settings")
 
 try:
-    # Ensure FERNET_KEY is bytes
-    if isinstance(FERNET_KEY, str):
-        fernet = Fernet(FERNET_KEY.encode())
-    else:
-        fernet = Fernet(FERNET_KEY)
-    print("✅ Fernet encryption initialized successfully")
+    # Ensure keys are bytes
+    _fernets = [
+        Fernet(key.encode() if isinstance(key, str) else key)
+        for key in FERNET_KEYS
+    ]
+    primary_fernet = _fernets[0]
+    fernet = MultiFernet(_fernets)
+    print(f"✅ Fernet encryption initialized successfully ({len(_fernets)} key(s))")
 except Exception as e:
     print(f"❌ Error initializing Fernet: {e}")
     raise
 
+# ---------------- COMPACT FORMAT ----------------
+
+# "g1:" + base64url(nonce | AES-256-GCM ciphertext | tag), unpadded.
+# About half the size of a Fernet token and a single AEAD pass to verify.
+# Legacy Fernet tokens never start with the prefix, so both formats can
+# live in the same column; ENCRYPTION_FORMAT picks the one new writes use.
+GCM_PREFIX = "g1:"
+GCM_NONCE_BYTES = 12
+
+ENCRYPTION_FORMAT = getattr(settings, "ENCRYPTION_FORMAT", "fernet")
+if ENCRYPTION_FORMAT not in ("fernet", "gcm"):
+    raise ImproperlyConfigured(f"Unknown ENCRYPTION_FORMAT: {ENCRYPTION_FORMAT}")
+
+
+def _gcm_key(fernet_key) -> bytes:
+    """Per-key AES-256 key, HKDF-derived so the Fernet key is never reused as-is"""
+    raw = base64.urlsafe_b64decode(fernet_key.encode() if isinstance(fernet_key, str) else fernet_key)
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b"edu2job-aesgcm-v1",
+    ).derive(raw)
+
+
+# Same order as FERNET_KEYS: the first key encrypts
+_gcm_ciphers = [AESGCM(_gcm_key(key)) for key in FERNET_KEYS]
+
+
+def _gcm_encrypt(data: bytes) -> str:
+    nonce = os.urandom(GCM_NONCE_BYTES)
+    sealed = _gcm_ciphers[0].encrypt(nonce, data, None)
+    return GCM_PREFIX + base64.urlsafe_b64encode(nonce + sealed).rstrip(b"=").decode()
+
+
+def _gcm_decrypt(token: str, ciphers=None) -> bytes:
+    body = token[len(GCM_PREFIX):]
+    try:
+        raw = base64.urlsafe_b64decode(body + "=" * (-len(body) % 4))
+    except (ValueError, TypeError):
+        raise InvalidToken
+    nonce, sealed = raw[:GCM_NONCE_BYTES], raw[GCM_NONCE_BYTES:]
+    for cipher in ciphers or _gcm_ciphers:
+        try:
+            return cipher.decrypt(nonce, sealed, None)
+        except InvalidTag:
+            continue
+    raise InvalidToken
+
+
+def is_compact(value: str) -> bool:
+    return bool(value) and value.startswith(GCM_PREFIX)
+
+
+def encrypt_as(value: str, fmt: str) -> str:
+    """Encrypt with an explicit format ("fernet" or "gcm"), no fallback"""
+    if fmt == "gcm":
+        return _gcm_encrypt(value.encode())
+    return fernet.encrypt(value.encode()).decode()
+
+
+def _encrypt(value: str) -> str:
+    return encrypt_as(value, ENCRYPTION_FORMAT)
+
+
+def decrypt_token(value: str) -> str:
+    """Decrypt either format, uncached; raises InvalidToken when no key can read it"""
+    if is_compact(value):
+        return _gcm_decrypt(value).decode()
+    return fernet.decrypt(value.encode()).decode()
+
+
 def encrypt_value(value: str) -> str:
     """Encrypt a string value"""
     if not value:
         return ""
     try:
-        # Ensure value is bytes
-        encrypted_bytes = fernet.encrypt(value.encode())
-        return encrypted_bytes.decode()
+        return _encrypt(value)
     except Exception as e:
-        print(f"⚠️ Encryption error for value '{value}': {e}")
+        logger.warning("Encryption failed (%s); storing value unencrypted", type(e).__name__)
         # Return original value as fallback
         return value
 
+# ---------------- PLAINTEXT CACHE ----------------
+
+class PlaintextCache:
+    """
+    Thread-safe LRU of ciphertext -> plaintext, bounded by an approximate
+    memory ceiling (bytes of both strings plus per-entry overhead).
+    """
+    ENTRY_OVERHEAD = 100  # OrderedDict node + tuple, roughly
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def _entry_size(cls, token, plaintext):
+        return sys.getsizeof(token) + sys.getsizeof(plaintext) + cls.ENTRY_OVERHEAD
+
+    def get(self, token):
+        with self._lock:
+            entry = self._data.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(token)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, token, plaintext):
+        size = self._entry_size(token, plaintext)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(token, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[token] = (plaintext, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+plaintext_cache = PlaintextCache(
+    getattr(settings, "DECRYPT_CACHE_MAX_BYTES", 8 * 1024 * 1024)
+)
+
+
+def decrypt_cache_stats():
+    return plaintext_cache.stats()
+
+
+# ---------------- DECRYPTION ----------------
+
+def _decrypt_uncached(value: str) -> str:
+    try:
+        plaintext = decrypt_token(value)
+    except Exception as e:
+        logger.warning("Decryption failed (%s); returning stored value as-is", type(e).__name__)
+        # Return original value if decryption fails
+        plaintext = value
+    plaintext_cache.put(value, plaintext)
+    return plaintext
+
+
 def decrypt_value(value: str) -> str:
     """Decrypt a string value"""
     if not value:
         return ""
+    cached = plaintext_cache.get(value)
+    if cached is not None:
+        return cached
+    return _decrypt_uncached(value)
+
+
+# Below this many cache misses the thread pool costs more than it saves
+DECRYPT_PARALLEL_THRESHOLD = 32
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "DECRYPT_WORKERS", min(8, os.cpu_count() or 1)),
+                    thread_name_prefix="decrypt",
+                )
+    return _executor
+
+
+def decrypt_many(values) -> list:
+    """
+    Decrypt a batch of values, returned in input order.
+    Identical ciphertexts are decrypted once, cached plaintexts are reused
+    and large batches of misses are spread over a thread pool
+    (the cryptography backend releases the GIL).
+    """
+    values = list(values)
+    results = {}
+    pending = []
+
+    for value in dict.fromkeys(values):
+        if not value:
+            results[value] = ""
+            continue
+        cached = plaintext_cache.get(value)
+        if cached is not None:
+            results[value] = cached
+        else:
+            pending.append(value)
+
+    if len(pending) < DECRYPT_PARALLEL_THRESHOLD:
+        decrypted = map(_decrypt_uncached, pending)
+    else:
+        decrypted = _get_executor().map(_decrypt_uncached, pending, chunksize=16)
+
+    results.update(zip(pending, decrypted))
+    return [results[value] for value in values]
+
+
+# ---------------- KEY ROTATION ----------------
+
+def needs_rotation(value: str) -> bool:
+    """
+    True when a stored token is in the other format than ENCRYPTION_FORMAT
+    or not encrypted with the primary key.
+    """
+    if not value:
+        return False
+    if is_compact(value) != (ENCRYPTION_FORMAT == "gcm"):
+        return True
+    if len(FERNET_KEYS) == 1:
+        return False
     try:
-        # Ensure value is bytes
-        decrypted_bytes = fernet.decrypt(value.encode())
-        return decrypted_bytes.decode()
-    except Exception as e:
-        print(f"⚠️ Decryption error for value '{value}': {e}")
-        # Return original value if decryption fails
-        return value
\ No newline at end of file
+        if is_compact(value):
+            _gcm_decrypt(value, ciphers=_gcm_ciphers[:1])
+        else:
+            primary_fernet.decrypt(value.encode())
+        return False
+    except InvalidToken:
+        return True
+
+
+def rotate_value(value: str) -> str:
+    """
+    Re-encrypt a token under the primary key and current format (plaintext
+    never leaves this function). Raises InvalidToken if no configured key
+    can read it.
+    """
+    if not value:
+        return value
+    return _encrypt(decrypt_token(value))
+
+
+# ---------------- BLIND INDEX ----------------
+
+# Deterministic HMAC of the normalized plaintext, so encrypted columns can be
+# matched and grouped in SQL. Uses the dedicated BLIND_INDEX_KEY; a
+# single-key setup may fall back to one derived from its Fernet key (never
+# the key itself).
+
+def _blind_index_key_for(keys, configured) -> bytes:
+    """
+    Raises ImproperlyConfigured during a rotation without a dedicated key:
+    the derived key would silently change once the old Fernet key is dropped,
+    and every stored *_bidx would stop matching.
+    """
+    if configured:
+        return configured.encode() if isinstance(configured, str) else configured
+    if len(keys) > 1:
+        raise ImproperlyConfigured(
+            "BLIND_INDEX_KEY must be set when FERNET_KEYS holds more than one key; "
+            "set it, then run manage.py backfill_blind_indexes --all"
+        )
+    key = keys[0]
+    return hmac.new(
+        key.encode() if isinstance(key, str) else key,
+        b"edu2job-blind-index",
+        hashlib.sha256,
+    ).hexdigest().encode()
+
+
+_blind_index_key = _blind_index_key_for(FERNET_KEYS, getattr(settings, "BLIND_INDEX_KEY", ""))
+
+
+def blind_index(value: str) -> str:
+    """HMAC-SHA256 of a plaintext value, case and whitespace insensitive"""
+    if not value:
+        return ""
+    normalized = " ".join(str(value).split()).lower()
+    if not normalized:
+        return ""
+    return hmac.new(_blind_index_key, normalized.encode(), hashlib.sha256).hexdigest()
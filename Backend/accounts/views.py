@@ -5,8 +5,10 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.permissions import IsAdminUser
-from django.db.models import Count
-from .models import User, Education, Certification, PredictionHistory, AdminLog, PredictionFeedback, SupportTicket
+from django.db import transaction
+from django.db.models import Count, F, Min, Prefetch, Q, Sum, Value, prefetch_related_objects
+from django.contrib.auth.signals import user_logged_in
+from .models import User, Education, Certification, PredictionHistory, AdminLog, PredictionFeedback, SupportTicket, JobRole, SkillCatalogVersion, ProfileFeatureVector, DailyPredictionStat, DailyRoleStat, MonthlyActivityStat, PredictionRole, MaintenanceCheckpoint
 from .serializers import (
     UserSerializer,
     RegisterSerializer,
@@ -16,16 +18,46 @@ from .serializers import (
     PredictionHistorySerializer,
     PredictionFeedbackSerializer,
     SupportTicketSerializer,
+    JobRoleSerializer,
+)
+from accounts.services.ml_predictor import (
+    predict_jobs,
+    load_model,
+    build_feature_frame,
+    feature_fingerprint,
+    prediction_input_for_user,
+)
+from accounts.services.ml_whatif import rank_skills_by_gain
+from accounts.services.skill_index import get_skill_index
+from accounts.services.similar_students import (
+    decode_vectors,
+    similar_students,
+    store_feature_vector,
+)
+from accounts.services.analytics_cache import cached_section, cache_stats as analytics_cache_stats, invalidate as invalidate_analytics
+from accounts.services.user_purge import soft_delete_users
+from accounts.services.audit_log import audit_buffer, log_admin_action, log_admin_actions
+from accounts.services.ticket_search import search_tickets
+from accounts.services.support_stats import support_stats
+from accounts.services.feedback_stats import feedback_stats
+from accounts.services.ml_explainer import (
+    explanation_for_prediction,
+    get_cached_explanation,
+    schedule_explanation,
 )
-from accounts.services.ml_predictor import predict_jobs
 import requests
 from .services.ml_predictor import retrain_model_from_csv
 from django.utils import timezone
 from django.db.models import Count
-from datetime import timedelta
+from datetime import date, datetime, time, timedelta
+from django.db.models.functions import Coalesce, TruncDay, TruncMonth, TruncWeek
 from calendar import month_abbr
-from .utils.encryption import decrypt_value
+from .utils.encryption import decrypt_many, decrypt_cache_stats
+from .utils.exports import EXPORT_FORMATS, date_range_filter, stream_export
+from .utils.pagination import KeysetPaginator, paginated
 from django.utils.timezone import now
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 
 def get_tokens_for_user(user):
     refresh = RefreshToken.for_user(user)
@@ -69,6 +101,8 @@ class LoginView(APIView):
             
         user = serializer.validated_data["user"]
         tokens = get_tokens_for_user(user)
+        # Updates last_login and the monthly activity rollup
+        user_logged_in.send(sender=user.__class__, request=request, user=user)
         
         # Ensure all user data is serialized
         user_data = UserSerializer(user).data
@@ -122,8 +156,14 @@ class GoogleLoginView(APIView):
             email=email,
             defaults={"name": name or email.split("@")[0]},
         )
+        if not user.is_active:
+            return Response(
+                {"detail": "This account has been deleted."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
 
         tokens = get_tokens_for_user(user)
+        user_logged_in.send(sender=user.__class__, request=request, user=user)
 
         return Response(
             {"user": UserSerializer(user).data, "tokens": tokens},
@@ -141,22 +181,40 @@ class ProfileView(APIView):
 
     def get(self, request):
         user = request.user
-    
+
+        # Revalidation is answered from the authenticated user row alone:
+        # no profile queries, decryption or serialization
+        etag = f'"profile-{user.pk}-{user.profile_version}"'
+        last_modified = int(user.profile_updated_at.timestamp())
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
     # Debug logging
         print(f"DEBUG ProfileView: User {user.email} is_flagged = {user.is_flagged}")
-    
-        education = Education.objects.filter(user=user).first()
-        certs = Certification.objects.filter(user=user)
-    
+
+        prefetch_related_objects(
+            [user],
+            Prefetch("educations", queryset=Education.objects.order_by("id")),
+            "certifications",
+        )
+        educations = user.educations.all()
+        education = educations[0] if educations else None
+
         education_data = EducationSerializer(education).data if education else None
-    
-        return Response(
+
+        response = Response(
             {
                 "user": UserSerializer(user).data,  # Use serializer here
                 "education": education_data,
-                "certifications": CertificationSerializer(certs, many=True).data,
+                "certifications": CertificationSerializer(user.certifications.all(), many=True).data,
             }
         )
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        # Browsers keep the copy but revalidate it on every load
+        response["Cache-Control"] = "private, no-cache"
+        return response
 
     def put(self, request):
         user = request.user
@@ -279,52 +337,179 @@ class JobPredictionView(APIView):
 
     def post(self, request):
         user = request.user
-        education = Education.objects.filter(user=user).first()
+        data = prediction_input_for_user(user)
 
-        if not education:
+        if data is None:
             return Response(
                 {"error": "Education details not found"},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        data = {
-            "degree": education.degree,
-            "specialization": education.specialization,
-            "course": education.specialization,
-            "college": education.university,
-            "year_of_completion": education.year_of_completion,
-            "cgpa": float(education.cgpa),
-            "skills": user.skills or [],
-
-            "certifications": list(
-                Certification.objects.filter(user=user)
-                .values_list("cert_name", flat=True)
-            ),
-        }
-
-        predictions = predict_jobs(data)
+        models = load_model()
+        features = build_feature_frame(data, models)
+        fingerprint = feature_fingerprint(features)
 
-        # ✅ SAVE HISTORY (THIS WAS MISSING)
-        top_roles = [p["job_role"] for p in predictions[:3]]
-        confidences = [float(p["confidence"]) for p in predictions[:3]]
+        predictions = predict_jobs(data, features=features)
 
-        # PredictionHistory.objects.create(
-        #     user=user,
-        #     predicted_roles=top_roles,
-        #     confidence_scores=confidences,
-        # )
-        
         PredictionHistory.objects.create(
             user=user,
             predicted_roles=[p["job_role"] for p in predictions],
             confidence_scores=[p["confidence"] for p in predictions],
-            missing_skills=[p["missing_skills"] for p in predictions]
+            missing_skills=[p["missing_skills"] for p in predictions],
+            feature_fingerprint=fingerprint,
+            model_version=models["version"],
+        )
+
+        store_feature_vector(
+            user, features, models["version"],
+            predictions[0]["job_role"] if predictions else "",
         )
+
+        # Warm the SHAP cache off the request path
+        if get_cached_explanation(fingerprint, models["version"]) is None:
+            schedule_explanation(features, fingerprint, models["version"])
+
         return Response(
             {"predictions": predictions},
             status=status.HTTP_200_OK
         )
 
+
+class PredictionExplanationView(APIView):
+    """
+    GET: TreeSHAP explanation for one of the user's saved predictions.
+    Returns 202 while the explanation is still being computed.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, pk):
+        try:
+            prediction = PredictionHistory.objects.select_related("user").get(
+                pk=pk, user=request.user
+            )
+        except PredictionHistory.DoesNotExist:
+            return Response({"detail": "Not found"}, status=404)
+
+        state, explanations = explanation_for_prediction(prediction)
+
+        if state == "unavailable":
+            return Response(
+                {"error": "Education details not found"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if state == "stale":
+            return Response(
+                {"detail": "Profile changed since this prediction. Run a new prediction to explain it."},
+                status=status.HTTP_409_CONFLICT
+            )
+        if state == "pending":
+            return Response({"status": "pending"}, status=status.HTTP_202_ACCEPTED)
+
+        return Response({
+            "status": "ready",
+            "prediction_id": prediction.id,
+            "explanations": explanations,
+        })
+
+class SkillWhatIfView(APIView):
+    """
+    GET: rank the user's missing skills by how much each one would raise
+    the confidence of their top role (or ?role=<job role>), at most
+    ?limit= (MAX_LIMIT) skills.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    MAX_LIMIT = 100
+
+    def get(self, request):
+        data = prediction_input_for_user(request.user)
+        if data is None:
+            return Response(
+                {"error": "Education details not found"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = min(int(request.query_params.get("limit", self.MAX_LIMIT)), self.MAX_LIMIT)
+            if limit < 1:
+                raise ValueError
+        except ValueError:
+            return Response({"detail": "limit must be a positive integer"}, status=400)
+
+        try:
+            result = rank_skills_by_gain(
+                data,
+                target_role=request.query_params.get("role") or None,
+                limit=limit,
+            )
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=400)
+
+        return Response(result)
+
+class ClosestRolesView(APIView):
+    """
+    GET: rank every job role by skill overlap with the user (Jaccard),
+    without running the ML model. ?skills=a,b,c overrides the profile skills,
+    ?limit= caps the list (at most MAX_LIMIT).
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    MAX_LIMIT = 100
+
+    def get(self, request):
+        skills_param = request.query_params.get("skills")
+        if skills_param is not None:
+            skills = [s.strip() for s in skills_param.split(",") if s.strip()]
+        else:
+            skills = request.user.skills or []
+
+        try:
+            limit = min(int(request.query_params.get("limit", self.MAX_LIMIT)), self.MAX_LIMIT)
+            if limit < 1:
+                raise ValueError
+        except ValueError:
+            return Response({"detail": "limit must be a positive integer"}, status=400)
+
+        roles = get_skill_index().rank_roles(skills, limit=limit)
+        return Response({"skills": skills, "roles": roles})
+
+class SimilarStudentsView(APIView):
+    """
+    GET: what students with profiles like yours were predicted as
+    (role distribution over the ?k nearest encoded profiles).
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        try:
+            k = min(max(int(request.query_params.get("k", 10)), 1), 50)
+        except ValueError:
+            return Response({"detail": "k must be an integer"}, status=400)
+
+        models = load_model()
+        stored = ProfileFeatureVector.objects.filter(
+            user=request.user, model_version=models["version"]
+        ).values_list("vector", flat=True).first()
+
+        if stored is not None:
+            vector = decode_vectors([stored], len(models["feature_columns"]))
+        else:
+            data = prediction_input_for_user(request.user)
+            if data is None:
+                return Response(
+                    {"error": "Education details not found"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            vector = build_feature_frame(data, models)
+
+        result = similar_students(vector, k, exclude_user=request.user.id)
+        if result is None:
+            return Response(
+                {"detail": "Similar students index is not built yet"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        return Response(result)
+
 # -------------- TEST ENCRYPTION ----------------
 
 class TestEncryptionView(APIView):
@@ -354,111 +539,320 @@ class TestEncryptionView(APIView):
             
 # -------------- ADMIN ANALYTICS ----------------           
 class AdminAnalyticsView(APIView):
+    """
+    Dashboard numbers. Each section is cached separately (see
+    services/analytics_cache.py) and recomputed only after a relevant write.
+    """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         if request.user.role != "admin":
             return Response({"detail": "Unauthorized"}, status=403)
 
-        now = timezone.now()
+        today = timezone.localdate()
 
-        # ---------------- USERS ----------------
-        total_users = User.objects.count()
-        students = User.objects.filter(role="student").count()
-        admins = User.objects.filter(role="admin").count()
+        users = cached_section("users", self.users_section)
+        predictions = cached_section("predictions", lambda: self.predictions_section(today), today)
+        universities = cached_section("universities", self.universities_section)
+        user_growth = cached_section("growth", lambda: self.growth_section(today), today)
 
-        # ---------------- PREDICTIONS ----------------
-        predictions = PredictionHistory.objects.all()
-        total_predictions = predictions.count()
+        return Response({
+            **users,
+            **predictions,
+            "accuracy": 82,  # static for now (can be ML based later)
+            "universities": universities,
+            "user_growth": user_growth,
+        })
 
-        monthly_predictions = predictions.filter(
-            timestamp__month=now.month,
-            timestamp__year=now.year
-        ).count()
+    # ---------------- USERS ----------------
+    @staticmethod
+    def users_section():
+        user_counts = User.objects.filter(deleted_at__isnull=True).aggregate(
+            total=Count("id"),
+            students=Count("id", filter=Q(role="student")),
+            admins=Count("id", filter=Q(role="admin")),
+        )
+        return {
+            "total_users": user_counts["total"],
+            "students": user_counts["students"],
+            "admins": user_counts["admins"],
+        }
 
-        # ---------------- AVG CONFIDENCE ----------------
-        confidences = []
-        for p in predictions:
-            confidences.extend(p.confidence_scores or [])
+    # ---------------- PREDICTIONS ----------------
+    @staticmethod
+    def predictions_section(today):
+        # Read from the daily rollups, never from PredictionHistory itself
+        month_start = today.replace(day=1)
+        prediction_totals = DailyPredictionStat.objects.aggregate(
+            total=Sum("predictions"),
+            monthly=Sum("predictions", filter=Q(day__gte=month_start)),
+            confidence_sum=Sum("confidence_sum"),
+            confidence_count=Sum("confidence_count"),
+        )
 
         avg_confidence = round(
-            sum(confidences) / len(confidences), 2
-        ) if confidences else 0
-
-        # ---------------- UNIVERSITIES ----------------
-        universities_map = {}
-        for edu in Education.objects.all():
-            uni = decrypt_value(edu.university) if edu.university else "Unknown"
-            universities_map[uni] = universities_map.get(uni, 0) + 1
-
-        universities = [
-            {"name": k, "count": v}
-            for k, v in universities_map.items()
+            prediction_totals["confidence_sum"] / prediction_totals["confidence_count"], 2
+        ) if prediction_totals["confidence_count"] else 0
+
+        top_jobs = [
+            {"job": row["job_role"], "count": row["count"]}
+            for row in DailyRoleStat.objects.values("job_role")
+            .annotate(count=Sum("count"))
+            .order_by("-count", "job_role")[:5]
         ]
 
-        # ---------------- TOP JOBS ----------------
-        job_counter = {}
-        for p in predictions:
-            for job in p.predicted_roles:
-                job_counter[job] = job_counter.get(job, 0) + 1
-
-        top_jobs = sorted(
-            [{"job": k, "count": v} for k, v in job_counter.items()],
-            key=lambda x: x["count"],
-            reverse=True
-        )[:5]
-
-        # ---------------- DAILY PREDICTIONS (7 days) ----------------
+        # Last 7 days
+        week_start = today - timedelta(days=6)
+        per_day = dict(
+            DailyPredictionStat.objects.filter(day__gte=week_start)
+            .values_list("day", "predictions")
+        )
         daily_predictions = []
-        for i in range(6, -1, -1):
-            day = now - timedelta(days=i)
-            count = predictions.filter(
-                timestamp__date=day.date()
-            ).count()
-
+        for i in range(7):
+            day = week_start + timedelta(days=i)
             daily_predictions.append({
                 "day": day.strftime("%a"),
-                "predictions": count
+                "predictions": per_day.get(day, 0)
             })
 
-        # ---------------- USER GROWTH ----------------
+        return {
+            "total_predictions": prediction_totals["total"] or 0,
+            "monthly_predictions": prediction_totals["monthly"] or 0,
+            "avg_confidence": avg_confidence,
+            "top_jobs": top_jobs,
+            "daily_predictions": daily_predictions,
+        }
+
+    # ---------------- UNIVERSITIES ----------------
+    @staticmethod
+    def universities_section():
+        # Group on the blind index in SQL, decrypt one sample per group
+        university_groups = list(
+            Education.objects.values("university_bidx")
+            .annotate(count=Count("id"), sample=Min("university"))
+            .order_by("-count")
+        )
+        names = decrypt_many(g["sample"] for g in university_groups)
+
+        return [
+            {
+                "name": name if g["university_bidx"] else "Unknown",
+                "count": g["count"],
+            }
+            for g, name in zip(university_groups, names)
+        ]
+
+    # ---------------- USER GROWTH ----------------
+    @staticmethod
+    def growth_section(today):
+        # Users active (login or prediction) per month of the current year
+        per_month = dict(
+            MonthlyActivityStat.objects.filter(month__year=today.year)
+            .values_list("month", "active_users")
+        )
         user_growth = []
-        for m in range(1, now.month + 1):
-            month_users = User.objects.filter(
-                last_login__month=m
-            ).count()
+        for m in range(1, today.month + 1):
+            month_users = per_month.get(today.replace(month=m, day=1), 0)
 
             user_growth.append({
                 "month": month_abbr[m],
                 "users": month_users,
                 "active": month_users  # can improve later
             })
+        return user_growth
+
+
+class AdminAnalyticsTimeSeriesView(APIView):
+    """
+    GET ?start=YYYY-MM-DD&end=YYYY-MM-DD&bucket=day|week|month&series=predictions,signups
+
+    One grouped Trunc + Count query per series whatever the range length;
+    empty buckets are filled in with zeros.
+    """
+    permission_classes = [IsAuthenticated]
+
+    BUCKETS = {"day": TruncDay, "week": TruncWeek, "month": TruncMonth}
+    SERIES = {
+        "predictions": (PredictionHistory, "timestamp"),
+        "signups": (User, "date_joined"),
+    }
+    MAX_BUCKETS = 1000
+
+    def get(self, request):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        today = timezone.localdate()
+        try:
+            end = date.fromisoformat(request.query_params.get("end", today.isoformat()))
+            start = date.fromisoformat(
+                request.query_params.get("start", (end - timedelta(days=29)).isoformat())
+            )
+        except ValueError:
+            return Response({"error": "start and end must be YYYY-MM-DD dates"}, status=400)
+
+        bucket = request.query_params.get("bucket", "day")
+        if bucket not in self.BUCKETS:
+            return Response({"error": f"bucket must be one of: {', '.join(self.BUCKETS)}"}, status=400)
+
+        names = request.query_params.get("series", ",".join(self.SERIES)).split(",")
+        unknown = [n for n in names if n not in self.SERIES]
+        if unknown:
+            return Response({"error": f"Unknown series: {', '.join(unknown)}"}, status=400)
+
+        if start > end:
+            return Response({"error": "start must not be after end"}, status=400)
+
+        periods = self.bucket_starts(start, end, bucket)
+        if len(periods) > self.MAX_BUCKETS:
+            return Response({"error": f"Range spans more than {self.MAX_BUCKETS} buckets"}, status=400)
+
+        # Local-midnight bounds so the range matches the Trunc* buckets
+        tz = timezone.get_current_timezone()
+        range_start = datetime.combine(start, time.min, tzinfo=tz)
+        range_end = datetime.combine(end + timedelta(days=1), time.min, tzinfo=tz)
+        trunc = self.BUCKETS[bucket]
+
+        series = {}
+        for name in names:
+            model, field = self.SERIES[name]
+            counts = {
+                timezone.localtime(row["period"]).date(): row["count"]
+                for row in model.objects.filter(**{
+                    f"{field}__gte": range_start,
+                    f"{field}__lt": range_end,
+                })
+                .annotate(period=trunc(field))
+                .values("period")
+                .annotate(count=Count("id"))
+                .order_by()
+            }
+            series[name] = [
+                {"period": period.isoformat(), "count": counts.get(period, 0)}
+                for period in periods
+            ]
 
         return Response({
-            "total_users": total_users,
-            "students": students,
-            "admins": admins,
-            "total_predictions": total_predictions,
-            "monthly_predictions": monthly_predictions,
-            "avg_confidence": avg_confidence,
-            "accuracy": 82,  # static for now (can be ML based later)
-            "universities": universities,
-            "top_jobs": top_jobs,
-            "daily_predictions": daily_predictions,
-            "user_growth": user_growth,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "bucket": bucket,
+            "series": series,
         })
-                
+
+    @staticmethod
+    def bucket_starts(start, end, bucket):
+        """First day of every bucket overlapping [start, end]"""
+        if bucket == "week":
+            current = start - timedelta(days=start.weekday())
+        elif bucket == "month":
+            current = start.replace(day=1)
+        else:
+            current = start
+
+        periods = []
+        while current <= end:
+            periods.append(current)
+            if bucket == "day":
+                current += timedelta(days=1)
+            elif bucket == "week":
+                current += timedelta(weeks=1)
+            else:
+                current = (current.replace(day=28) + timedelta(days=4)).replace(day=1)
+        return periods
+
+
+class AdminAnalyticsCacheView(APIView):
+    """GET: hit/miss counters of the analytics section cache"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        return Response(analytics_cache_stats())
+
+
+def admin_user_filters(params):
+    """
+    (base queryset, facet Q) for the admin user filters: the base applies
+    the q/joined_from/joined_to search, the Q the role/is_flagged facets.
+    Raises ValueError with a user-facing message on bad input.
+    """
+    try:
+        base = User.objects.filter(deleted_at__isnull=True, **date_range_filter(
+            {"start": params.get("joined_from"), "end": params.get("joined_to")},
+            "date_joined",
+        ))
+    except ValueError:
+        raise ValueError("joined_from and joined_to must be YYYY-MM-DD dates")
+
+    q = str(params.get("q") or "").strip()
+    if q:
+        base = base.filter(Q(email__istartswith=q) | Q(name__istartswith=q))
+
+    facet_filter = Q()
+    role = params.get("role")
+    if role:
+        facet_filter &= Q(role=role)
+    is_flagged = params.get("is_flagged")
+    if is_flagged is not None and is_flagged != "":
+        is_flagged = str(is_flagged).lower()
+        if is_flagged not in ("true", "false"):
+            raise ValueError("is_flagged must be true or false")
+        facet_filter &= Q(is_flagged=is_flagged == "true")
+
+    return base, facet_filter
+
+
 class AdminUserListView(APIView):
+    """
+    GET ?role=&is_flagged=true|false&joined_from=&joined_to=&q=&limit=&cursor=
+
+    Users newest first, keyset paginated. q is a case-insensitive prefix of
+    email or name. The first page also carries facet counts (per role and
+    flag status, under the search/date filters) from a single aggregate.
+    """
     permission_classes = [IsAuthenticated]
+    paginator = KeysetPaginator(("-id",))
 
     def get(self, request):
         if request.user.role != "admin":
             return Response({"detail": "Unauthorized"}, status=403)
 
-        users = User.objects.all().values(
+        params = request.query_params
+        try:
+            base, facet_filter = admin_user_filters(params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+
+        users = base.filter(facet_filter).values(
             "id", "name", "email", "role", "date_joined", "is_flagged", "flag_reason",
         )
-        return Response(users)
+        try:
+            rows, next_cursor = self.paginator.paginate(users, params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+
+        body = paginated(rows, next_cursor)
+        if not params.get("cursor"):
+            body.update(self.facets(base, facet_filter))
+        return Response(body)
+
+    @staticmethod
+    def facets(base, facet_filter):
+        counts = base.aggregate(
+            count=Count("id", filter=facet_filter),
+            flagged=Count("id", filter=Q(is_flagged=True)),
+            unflagged=Count("id", filter=Q(is_flagged=False)),
+            **{f"role_{r}": Count("id", filter=Q(role=r)) for r in User.ROLES},
+        )
+        return {
+            "count": counts["count"],
+            "facets": {
+                "role": {r: counts[f"role_{r}"] for r in User.ROLES},
+                "is_flagged": {"true": counts["flagged"], "false": counts["unflagged"]},
+            },
+        }
 
 
 class AdminUpdateUserRoleView(APIView):
@@ -473,7 +867,7 @@ class AdminUpdateUserRoleView(APIView):
         user.role = request.data.get("role")
         user.save()
 
-        AdminLog.objects.create(
+        log_admin_action(
             admin=request.user,
             action_type=f"ROLE_UPDATED_{old_role.upper()}_TO_{user.role.upper()}",
             target_user=user
@@ -491,16 +885,256 @@ class AdminDeleteUserView(APIView):
 
         user = User.objects.get(id=user_id)
 
-        AdminLog.objects.create(
+        # Soft delete; purge_deleted_users removes the rows in batches later
+        soft_delete_users([user])
+
+        log_admin_action(
             admin=request.user,
             action_type="USER_DELETED",
-            target_user=user
+            target_user=user,
+            details=f"User {user.email} (id {user.id}) deleted",
+        )
+        return Response(status=204)
+
+
+class AdminPurgeStatusView(APIView):
+    """Soft-deleted users still waiting for purge_deleted_users, and its progress"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        checkpoint = MaintenanceCheckpoint.objects.filter(name="purge_deleted_users").first()
+        return Response({
+            "pending_users": User.objects.filter(deleted_at__isnull=False).count(),
+            "last_run": checkpoint and {
+                "current_user": None if checkpoint.finished_at else checkpoint.last_id,
+                "users_purged": checkpoint.processed,
+                "rows_deleted": checkpoint.changed,
+                "started_at": checkpoint.started_at,
+                "updated_at": checkpoint.updated_at,
+                "finished_at": checkpoint.finished_at,
+            },
+        })
+
+
+class AdminBulkUserActionView(APIView):
+    """
+    POST {"action": "flag"|"unflag"|"set_role"|"delete",
+          "ids": [...] or "filter": {same keys as the user list filters},
+          "reason": "...", "role": "..."}
+
+    Applies the change to every target in one transaction with a single
+    bulk_update and records all AdminLog rows as one batch ("delete"
+    is a soft delete, see purge_deleted_users). Returns a status per user id.
+    """
+    permission_classes = [IsAuthenticated]
+
+    ACTIONS = ("flag", "unflag", "set_role", "delete")
+    MAX_USERS = 5000
+
+    def post(self, request):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        action = request.data.get("action")
+        if action not in self.ACTIONS:
+            return Response({"error": f"action must be one of: {', '.join(self.ACTIONS)}"}, status=400)
+
+        new_role = request.data.get("role")
+        if action == "set_role" and new_role not in User.ROLES:
+            return Response({"error": f"role must be one of: {', '.join(User.ROLES)}"}, status=400)
+
+        ids = request.data.get("ids")
+        filters = request.data.get("filter")
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+                return Response({"error": "ids must be a list of integers"}, status=400)
+            # Accounts waiting to be purged are gone as far as admins are concerned
+            targets = User.objects.filter(id__in=ids, deleted_at__isnull=True)
+        elif isinstance(filters, dict):
+            try:
+                base, facet_filter = admin_user_filters(filters)
+            except ValueError as e:
+                return Response({"error": str(e)}, status=400)
+            targets = base.filter(facet_filter)
+        else:
+            return Response({"error": "Provide ids or filter"}, status=400)
+
+        with transaction.atomic():
+            users = list(targets.select_for_update().order_by("id")[:self.MAX_USERS + 1])
+            if len(users) > self.MAX_USERS:
+                return Response({"error": f"At most {self.MAX_USERS} users per request"}, status=400)
+
+            results = {}
+            if ids is not None:
+                found = {u.id for u in users}
+                results.update({i: "not_found" for i in ids if i not in found})
+
+            # Never let an admin flag, demote or delete themselves in bulk
+            changed = []
+            for user in users:
+                if user.id == request.user.id:
+                    results[user.id] = "skipped"
+                elif self.apply(action, user, request.data):
+                    changed.append(user)
+                else:
+                    results[user.id] = "unchanged"
+
+            if action == "delete":
+                soft_delete_users(changed)
+            elif changed:
+                User.objects.bulk_update(changed, self.FIELDS[action], batch_size=500)
+                # bulk_update sends no post_save
+                User.bump_profile_version(*(u.id for u in changed))
+            log_admin_actions(
+                self.log_entry(action, request.user, user, request.data) for user in changed
+            )
+
+        # bulk_update doesn't send post_save
+        invalidate_analytics("users", "growth")
+
+        results.update({u.id: "deleted" if action == "delete" else "updated" for u in changed})
+        return Response({
+            "action": action,
+            "updated": len(changed),
+            "results": [{"id": i, "status": results[i]} for i in sorted(results)],
+        })
+
+    FIELDS = {
+        "flag": ["is_flagged", "flag_reason"],
+        "unflag": ["is_flagged", "flag_reason"],
+        "set_role": ["role"],
+    }
+
+    @staticmethod
+    def apply(action, user, data):
+        """Change the in-memory user; False when there's nothing to do"""
+        if action == "flag":
+            reason = str(data.get("reason") or "").strip()
+            if user.is_flagged and user.flag_reason == reason:
+                return False
+            user.is_flagged, user.flag_reason = True, reason
+        elif action == "unflag":
+            if not user.is_flagged:
+                return False
+            user.is_flagged, user.flag_reason = False, ""
+        elif action == "set_role":
+            if user.role == data["role"]:
+                return False
+            user._old_role, user.role = user.role, data["role"]
+        return True
+
+    @staticmethod
+    def log_entry(action, admin, user, data):
+        if action == "flag":
+            return AdminLog(admin=admin, target_user=user, action_type="USER_FLAGGED",
+                            details=user.flag_reason or "No reason provided")
+        if action == "unflag":
+            return AdminLog(admin=admin, target_user=user, action_type="USER_UNFLAGGED",
+                            details=f"User {user.email} unflagged")
+        if action == "set_role":
+            return AdminLog(admin=admin, target_user=user, action_type="ROLE_UPDATED",
+                            details=f"Role changed from {user._old_role} to {user.role}")
+        return AdminLog(admin=admin, target_user=user, action_type="USER_DELETED",
+                        details=f"User {user.email} (id {user.id}) deleted")
+
+
+class AdminSkillCatalogView(APIView):
+    """
+    GET: list the job skill catalog with its current version
+    POST: add a job role with its required skills
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        roles = JobRole.objects.all()
+        return Response({
+            "version": SkillCatalogVersion.current(),
+            "roles": JobRoleSerializer(roles, many=True).data,
+        })
+
+    def post(self, request):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        serializer = JobRoleSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        job_role = serializer.save()
+
+        log_admin_action(
+            admin=request.user,
+            action_type="SKILL_CATALOG_UPDATED",
+            details=f"Added role {job_role.name}"
+        )
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class AdminSkillCatalogDetailView(APIView):
+    """
+    PATCH: rename a role or replace its required skills
+    DELETE: remove a role from the catalog
+    """
+    permission_classes = [IsAuthenticated]
+
+    def patch(self, request, pk):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        try:
+            job_role = JobRole.objects.get(pk=pk)
+        except JobRole.DoesNotExist:
+            return Response({"detail": "Not found"}, status=404)
+
+        serializer = JobRoleSerializer(job_role, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        log_admin_action(
+            admin=request.user,
+            action_type="SKILL_CATALOG_UPDATED",
+            details=f"Updated role {job_role.name}"
+        )
+
+        return Response(serializer.data)
+
+    def delete(self, request, pk):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        try:
+            job_role = JobRole.objects.get(pk=pk)
+        except JobRole.DoesNotExist:
+            return Response({"detail": "Not found"}, status=404)
+
+        name = job_role.name
+        job_role.delete()
+
+        log_admin_action(
+            admin=request.user,
+            action_type="SKILL_CATALOG_UPDATED",
+            details=f"Removed role {name}"
         )
 
-        user.delete()
         return Response(status=204)
 
 
+class AdminEncryptionCacheView(APIView):
+    """GET: hit-rate and memory metrics of the decrypted-value cache"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        return Response(decrypt_cache_stats())
+
+
 class AdminModelStatusView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -525,13 +1159,13 @@ class AdminRetrainModelView(APIView):
         if request.user.role != "admin":
             return Response({"detail": "Unauthorized"}, status=403)
 
-        AdminLog.objects.create(
+        log_admin_action(
             admin=request.user,
             action_type="TRAINING_STARTED"
         )
 
         retrain_model_from_csv()
-        AdminLog.objects.create(
+        log_admin_action(
             admin=request.user,
             action_type="TRAINING_COMPLETED"
         )
@@ -540,26 +1174,66 @@ class AdminRetrainModelView(APIView):
 
 
 class AdminPredictionLogsView(APIView):
+    """GET ?limit=&cursor= : one row per predicted role, newest first"""
     permission_classes = [IsAuthenticated]
+    paginator = KeysetPaginator(("-created", "-prediction_id", "rank"))
 
     def get(self, request):
         if request.user.role != "admin":
             return Response({"detail": "Unauthorized"}, status=403)
 
-        logs = PredictionHistory.objects.select_related("user").order_by("-timestamp")
+        logs = PredictionRole.objects.values(
+            "prediction_id", "rank", "job_role", "confidence", "created",
+            user_email=F("prediction__user__email"),
+        )
+        try:
+            rows, next_cursor = self.paginator.paginate(logs, request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
 
-        data = []
-        for p in logs:
-            for job, conf in zip(p.predicted_roles, p.confidence_scores):
-                data.append({
-                    "user": p.user.email,
-                    "predicted_job": job,
-                    "confidence": conf,
-                    "status": "success",
-                    "timestamp": p.timestamp
-                })
+        data = [
+            {
+                "user": row["user_email"],
+                "predicted_job": row["job_role"],
+                "confidence": row["confidence"],
+                "status": "success",
+                "timestamp": row["created"]
+            }
+            for row in rows
+        ]
 
-        return Response(data)
+        return Response(paginated(data, next_cursor))
+
+
+class AdminPredictionLogsExportView(APIView):
+    """
+    GET ?output=csv|ndjson&start=YYYY-MM-DD&end=YYYY-MM-DD
+    Streams one line per predicted role, oldest first.
+    """
+    permission_classes = [IsAuthenticated]
+
+    COLUMNS = ["prediction_id", "rank", "user", "predicted_job", "confidence", "missing_skill_count", "timestamp"]
+
+    def get(self, request):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        output = request.query_params.get("output", "csv")
+        if output not in EXPORT_FORMATS:
+            return Response({"error": f"output must be one of: {', '.join(EXPORT_FORMATS)}"}, status=400)
+        try:
+            filters = date_range_filter(request.query_params, "created")
+        except ValueError:
+            return Response({"error": "start and end must be YYYY-MM-DD dates"}, status=400)
+
+        rows = PredictionRole.objects.filter(**filters).values(
+            "prediction_id", "rank", "confidence", "missing_skill_count",
+            user=F("prediction__user__email"),
+            predicted_job=F("job_role"),
+            timestamp=F("created"),
+        ).order_by("created", "prediction_id", "rank")
+
+        return stream_export(rows, self.COLUMNS, output, "prediction_logs")
 
 
 class PredictionFeedbackCreateView(generics.CreateAPIView):
@@ -570,15 +1244,19 @@ class PredictionFeedbackCreateView(generics.CreateAPIView):
         serializer.save(user=self.request.user)
 
 class AdminPredictionFeedbackView(APIView):
+    """GET ?limit=&cursor= : feedback, newest first"""
     permission_classes = [IsAuthenticated]
+    paginator = KeysetPaginator(("-created_at", "-id"))
 
     def get(self, request):
         if request.user.role != "admin":
             return Response({"detail": "Unauthorized"}, status=403)
 
-        feedbacks = PredictionFeedback.objects.select_related(
-            "user", "prediction"
-        ).order_by("-created_at")
+        feedbacks = PredictionFeedback.objects.select_related("user", "prediction")
+        try:
+            feedbacks, next_cursor = self.paginator.paginate(feedbacks, request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
 
         data = []
         for f in feedbacks:
@@ -590,19 +1268,38 @@ class AdminPredictionFeedbackView(APIView):
                 "predicted_roles": f.prediction.predicted_roles,
             })
 
-        return Response(data)
+        return Response(paginated(data, next_cursor))
+
+class AdminFeedbackStatsView(APIView):
+    """Feedback ratings per role, per model version and over the last 30 days (cached)"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        today = timezone.localdate()
+        return Response(cached_section("feedback", lambda: feedback_stats(today), today))
+
 
 class AdminLogsView(APIView):
+    """GET ?limit=&cursor= : admin actions, newest first"""
     permission_classes = [IsAuthenticated]
+    paginator = KeysetPaginator(("-timestamp", "-id"))
 
     def get(self, request):
         # Only admins can see system logs
         if request.user.role != "admin":
             return Response({"detail": "Unauthorized"}, status=403)
 
-        logs = AdminLog.objects.select_related(
-            "admin", "target_user"
-        ).order_by("-timestamp")
+        # Show this worker's buffered entries too
+        audit_buffer.flush()
+
+        logs = AdminLog.objects.select_related("admin", "target_user")
+        try:
+            logs, next_cursor = self.paginator.paginate(logs, request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
 
         data = []
         for log in logs:
@@ -616,7 +1313,43 @@ class AdminLogsView(APIView):
                 "is_flagged": log.is_flagged,
             })
 
-        return Response(data)
+        return Response(paginated(data, next_cursor))
+
+class AdminLogsExportView(APIView):
+    """GET ?output=csv|ndjson&start=YYYY-MM-DD&end=YYYY-MM-DD, oldest first"""
+    permission_classes = [IsAuthenticated]
+
+    COLUMNS = ["id", "time", "admin", "action", "target", "details", "is_flagged"]
+
+    def get(self, request):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        # Show this worker's buffered entries too
+        audit_buffer.flush()
+
+        output = request.query_params.get("output", "csv")
+        if output not in EXPORT_FORMATS:
+            return Response({"error": f"output must be one of: {', '.join(EXPORT_FORMATS)}"}, status=400)
+        try:
+            filters = date_range_filter(request.query_params, "timestamp")
+        except ValueError:
+            return Response({"error": "start and end must be YYYY-MM-DD dates"}, status=400)
+
+        # Buffered audit entries get their ids at flush time, so order by when
+        # the action happened (adminlog_keyset_idx, scanned backwards)
+        rows = AdminLog.objects.filter(**filters).values(
+            "id", "details", "is_flagged",
+            time=F("timestamp"),
+            admin_email=F("admin__email"),
+            action=F("action_type"),
+            target=Coalesce(F("target_user__email"), Value("System")),
+        ).order_by("timestamp", "id")
+
+        # "admin" clashes with the FK name inside values(), so rename on output
+        columns = [c if c != "admin" else "admin_email" for c in self.COLUMNS]
+        return stream_export(rows, columns, output, "admin_logs", headers=self.COLUMNS)
+
 
 class AdminFlagUserView(APIView):
     permission_classes = [IsAuthenticated]
@@ -638,7 +1371,7 @@ class AdminFlagUserView(APIView):
         target_user.save()
 
         # Create log entry
-        AdminLog.objects.create(
+        log_admin_action(
             admin=request.user,
             target_user=target_user,
             action_type="USER_FLAGGED",
@@ -672,7 +1405,7 @@ class AdminUpdateUserRoleView(APIView):
         user.save()
 
         # ✅ LOG WITH DETAILS (THIS FIXES YOUR ISSUE)
-        AdminLog.objects.create(
+        log_admin_action(
             admin=request.user,
             target_user=user,
             action_type="ROLE_UPDATED",
@@ -697,7 +1430,7 @@ class AdminRetrainModelView(APIView):
         try:
             retrain_model_from_csv(csv_file)
 
-            AdminLog.objects.create(
+            log_admin_action(
                 admin=request.user,
                 action_type="MODEL_RETRAINED",
                 details="Model retrained using CSV upload"
@@ -730,6 +1463,17 @@ class AdminSupportStatusView(APIView):
         return Response({"open_tickets": open_count})
 
 
+class AdminSupportStatsView(APIView):
+    """Support queue counts, backlog ages and reply-time percentiles (cached)"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        return Response(cached_section("support", support_stats))
+
+
 class AdminSupportReplyView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -747,15 +1491,56 @@ class AdminSupportReplyView(APIView):
 
 
 class AdminSupportTicketListView(APIView):
+    """GET ?limit=&cursor= : tickets, newest first"""
     permission_classes = [IsAuthenticated]
+    paginator = KeysetPaginator(("-created_at", "-id"))
 
     def get(self, request):
         if request.user.role != "admin":
             return Response({"detail": "Unauthorized"}, status=403)
 
-        tickets = SupportTicket.objects.all().order_by("-created_at")
+        try:
+            tickets, next_cursor = self.paginator.paginate(SupportTicket.objects.all(), request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
         serializer = SupportTicketSerializer(tickets, many=True)
-        return Response(serializer.data)
+        return Response(paginated(serializer.data, next_cursor))
+
+class AdminSupportTicketSearchView(APIView):
+    """
+    GET ?q=&status=&type=&limit=&cursor= : tickets whose subject, message or
+    reply contain every word of q (prefix match), best match first.
+    """
+    permission_classes = [IsAuthenticated]
+
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+    FILTERS = ("status", "type")
+
+    def get(self, request):
+        if request.user.role != "admin":
+            return Response({"detail": "Unauthorized"}, status=403)
+
+        params = request.query_params
+        query = params.get("q", "").strip()
+        if not query:
+            return Response({"error": "q is required"}, status=400)
+        try:
+            limit = min(int(params.get("limit", self.DEFAULT_LIMIT)), self.MAX_LIMIT)
+            # Ranked results can't be keyset-paginated; the cursor is an offset
+            offset = int(params.get("cursor") or 0)
+            if limit < 1 or offset < 0:
+                raise ValueError
+        except ValueError:
+            return Response({"error": "limit and cursor must be non-negative integers"}, status=400)
+
+        filters = {f: params[f] for f in self.FILTERS if params.get(f)}
+        ids, has_more = search_tickets(query, filters, limit=limit, offset=offset)
+
+        tickets = SupportTicket.objects.in_bulk(ids)
+        serializer = SupportTicketSerializer([tickets[i] for i in ids if i in tickets], many=True)
+        return Response(paginated(serializer.data, str(offset + limit) if has_more else None))
+
 
 class MySupportTicketsView(APIView):
     permission_classes = [IsAuthenticated]
@@ -835,7 +1620,7 @@ class UnflagUserView(APIView):
         user.save()
 
         # Create log entry
-        AdminLog.objects.create(
+        log_admin_action(
             admin=request.user,
             target_user=user,
             action_type="USER_UNFLAGGED",
@@ -5,6 +5,7 @@ import os
 from dotenv import load_dotenv
 from cryptography.fernet import Fernet  # Import Fernet here
 import dj_database_url  # Import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 
 # Load environment variables from .env file
 load_dotenv()
@@ -19,14 +20,35 @@ if not SECRET_KEY:
     print("⚠️ WARNING: SECRET_KEY not found in .env file!")
     SECRET_KEY = "django-insecure-change-this-in-production"
 
-# Get FERNET_KEY from .env, generate one if not found
-FERNET_KEY = os.getenv("FERNET_KEY")
-if not FERNET_KEY:
-    print("⚠️ WARNING: FERNET_KEY not found in .env file! Generating a new one...")
-    FERNET_KEY = Fernet.generate_key().decode()
-
 DEBUG = os.getenv("DEBUG", "False") == "True"
 
+# Encryption keys, newest first: FERNET_KEYS="new,old" during a rotation.
+# New values are encrypted with the first key, every listed key can decrypt.
+# FERNET_KEY alone is still accepted as a single-key list.
+FERNET_KEYS = [k.strip() for k in os.getenv("FERNET_KEYS", "").split(",") if k.strip()]
+if not FERNET_KEYS and os.getenv("FERNET_KEY"):
+    FERNET_KEYS = [os.getenv("FERNET_KEY")]
+if not FERNET_KEYS:
+    if not DEBUG:
+        # A random key would make every stored value unreadable on next restart
+        raise ImproperlyConfigured("FERNET_KEYS (or FERNET_KEY) must be set when DEBUG is off")
+    print("⚠️ WARNING: FERNET_KEY not found in .env file! Generating a temporary one (DEBUG only)...")
+    FERNET_KEYS = [Fernet.generate_key().decode()]
+FERNET_KEY = FERNET_KEYS[0]
+
+# Token format for new writes: "fernet" (legacy) or "gcm" (compact AES-GCM,
+# prefixed "g1:"). Both are always readable; stale tokens upgrade on write
+# or in bulk via rotate_encryption_keys
+ENCRYPTION_FORMAT = os.getenv("ENCRYPTION_FORMAT", "fernet")
+
+# Key for HMAC blind indexes on encrypted columns. Required once FERNET_KEYS
+# holds more than one key; a single-key setup falls back to a key derived
+# from FERNET_KEY. Changing it requires backfill_blind_indexes --all
+BLIND_INDEX_KEY = os.getenv("BLIND_INDEX_KEY", "")
+
+# Memory ceiling of the in-process decrypted value cache (bytes)
+DECRYPT_CACHE_MAX_BYTES = int(os.getenv("DECRYPT_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+
 ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
 # Add Render's internal host (optional but good for health checks)
 allowed_hosts_env = os.getenv("RENDER_EXTERNAL_HOSTNAME")
@@ -98,6 +120,29 @@ if database_url:
     DATABASES["default"] = dj_database_url.parse(database_url, conn_max_age=600)
 
 
+# Cache
+# Per-process memory cache locally; set REDIS_URL to share it between workers
+# (needs the redis package)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "edu2job",
+    }
+}
+
+redis_url = os.getenv("REDIS_URL")
+if redis_url:
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": redis_url,
+    }
+
+# Upper bound (seconds) on how stale a cached analytics section can get when a
+# write isn't seen by the invalidation signals (bulk updates, other workers
+# with a per-process cache)
+ANALYTICS_CACHE_TTL = int(os.getenv("ANALYTICS_CACHE_TTL", "60"))
+
+
 # Password validation
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -154,6 +199,23 @@ REST_FRAMEWORK = {
     ),
 }
 
+# AdminLog writes: "sync" inserts on the request path (tests, debugging),
+# "buffered" collects entries per process and bulk-inserts them after the
+# response, every AUDIT_LOG_BUFFER_SIZE entries or AUDIT_LOG_FLUSH_SECONDS,
+# and at shutdown (a hard kill loses what is still buffered)
+AUDIT_LOG_MODE = os.getenv("AUDIT_LOG_MODE", "sync" if DEBUG else "buffered")
+AUDIT_LOG_BUFFER_SIZE = int(os.getenv("AUDIT_LOG_BUFFER_SIZE", "100"))
+AUDIT_LOG_FLUSH_SECONDS = float(os.getenv("AUDIT_LOG_FLUSH_SECONDS", "5"))
+
+# archive_admin_logs moves entries older than this many days into gzipped
+# NDJSON files under AUDIT_LOG_ARCHIVE_DIR (one file per month)
+AUDIT_LOG_RETENTION_DAYS = int(os.getenv("AUDIT_LOG_RETENTION_DAYS", "365"))
+AUDIT_LOG_ARCHIVE_DIR = os.getenv("AUDIT_LOG_ARCHIVE_DIR", os.path.join(BASE_DIR, "archives", "adminlog"))
+
+# Seconds a worker trusts its compiled job skill index before re-checking
+# the catalog version (0 = check on every request)
+SKILL_CATALOG_CHECK_SECONDS = int(os.getenv("SKILL_CATALOG_CHECK_SECONDS", "0"))
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
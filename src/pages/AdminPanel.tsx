@@ -95,6 +95,20 @@ interface AdminUser {
   flag_reason?: string;
 }
 
+type ListKey = "users" | "logs" | "predictions" | "feedback" | "support";
+
+interface Page<T> {
+  results: T[];
+  next: string | null;
+  count?: number;
+  facets?: UserFacets;
+}
+
+interface UserFacets {
+  role: Record<string, number>;
+  is_flagged: { true: number; false: number };
+}
+
 const AdminPanel: React.FC = () => {
   const { user, token, logout } = useAuth();
   const { showToast } = useToast();
@@ -111,6 +125,10 @@ const AdminPanel: React.FC = () => {
   const [csvFile, setCsvFile] = useState<File | null>(null);
   const [supportTickets, setSupportTickets] = useState<any[]>([]);
   const [replies, setReplies] = useState<Record<number, string>>({});
+  // Next-page cursors of the paginated admin lists (null = last page)
+  const [nextCursors, setNextCursors] = useState<Record<ListKey, string | null>>({
+    users: null, logs: null, predictions: null, feedback: null, support: null,
+  });
   const toggleTheme = () => {
     const current = document.documentElement.getAttribute("data-theme");
     const next = current === "light" ? "dark" : "light";
@@ -118,6 +136,12 @@ const AdminPanel: React.FC = () => {
     localStorage.setItem("theme", next);
   };
   const [showFlagHistory, setShowFlagHistory] = useState(false);
+  // Server-side user filters; facet counts come back with the first page
+  const [userFilters, setUserFilters] = useState({ q: "", role: "", is_flagged: "" });
+  const [userFacets, setUserFacets] = useState<{ count: number; facets: UserFacets } | null>(null);
+  const [flaggedUsers, setFlaggedUsers] = useState<AdminUser[]>([]);
+  // Ticket search switches the support list to ranked full-text results
+  const [ticketFilters, setTicketFilters] = useState({ q: "", status: "" });
   const { refreshUserData } = useAuth();
 
   useEffect(() => {
@@ -205,18 +229,48 @@ const AdminPanel: React.FC = () => {
       setLoading(false);
     }
   };
-  const fetchSupportTickets = async () => {
-    try {
-      const res = await fetch(`${API}/admin/support/`, {
-        headers: {
-          Authorization: `Bearer ${token}`,
-        },
-      });
+  // Admin lists are cursor-paginated: pass the previous page's `next` to load more
+  const fetchPage = async <T,>(
+    key: ListKey,
+    path: string,
+    cursor?: string | null,
+    filters: Record<string, string> = {},
+  ): Promise<Page<T> | null> => {
+    const params = new URLSearchParams(
+      Object.entries(filters).filter(([, value]) => value !== "")
+    );
+    if (cursor) params.set("cursor", cursor);
+    const query = params.toString() ? `?${params}` : "";
+    const res = await fetch(`${API}${path}${query}`, {
+      headers: { Authorization: `Bearer ${token}` },
+    });
+    if (!res.ok) return null;
 
-      const data = await res.json();
-      console.log("Support tickets:", data); // 👈 DEBUG
+    const page: Page<T> = await res.json();
+    setNextCursors(prev => ({ ...prev, [key]: page.next }));
+    return page;
+  };
+
+  const renderLoadMore = (key: ListKey, load: (cursor: string) => void) => {
+    const cursor = nextCursors[key];
+    if (!cursor) return null;
+    return (
+      <div style={{ textAlign: "center", marginTop: 16 }}>
+        <button className="signup-submit-btn" onClick={() => load(cursor)}>
+          Load more
+        </button>
+      </div>
+    );
+  };
+
+  const fetchSupportTickets = async (cursor?: string | null) => {
+    try {
+      const page = ticketFilters.q.trim()
+        ? await fetchPage<any>("support", "/admin/support/search/", cursor, ticketFilters)
+        : await fetchPage<any>("support", "/admin/support/", cursor);
+      if (!page) return;
 
-      setSupportTickets(data);
+      setSupportTickets(prev => (cursor ? [...prev, ...page.results] : page.results));
     } catch (err) {
       console.error("Failed to fetch support tickets", err);
     }
@@ -224,13 +278,14 @@ const AdminPanel: React.FC = () => {
 
 
 
-  const fetchUsers = async () => {
+  const fetchUsers = async (cursor?: string | null) => {
     try {
-      const res = await fetch(`${API}/admin/users/`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      if (res.ok) {
-        setUsers(await res.json());
+      const page = await fetchPage<AdminUser>("users", "/admin/users/", cursor, userFilters);
+      if (page) {
+        setUsers(prev => (cursor ? [...prev, ...page.results] : page.results));
+        if (page.facets && page.count !== undefined) {
+          setUserFacets({ count: page.count, facets: page.facets });
+        }
       }
     } catch (error) {
       console.error("Error fetching users:", error);
@@ -246,13 +301,37 @@ const AdminPanel: React.FC = () => {
   // };
 
 
-  const fetchPredictions = async () => {
+  const fetchFlaggedUsers = async () => {
     try {
-      const res = await fetch(`${API}/admin/predictions/`, {
+      const res = await fetch(`${API}/admin/users/?is_flagged=true&limit=500`, {
         headers: { Authorization: `Bearer ${token}` },
       });
       if (res.ok) {
-        setPredictions(await res.json());
+        const page: Page<AdminUser> = await res.json();
+        setFlaggedUsers(page.results);
+      }
+    } catch (error) {
+      console.error("Error fetching flagged users:", error);
+    }
+  };
+
+  useEffect(() => {
+    if (tab === "users") fetchUsers();
+  }, [userFilters]);
+
+  useEffect(() => {
+    if (tab === "support") fetchSupportTickets();
+  }, [ticketFilters]);
+
+  useEffect(() => {
+    if (showFlagHistory) fetchFlaggedUsers();
+  }, [showFlagHistory]);
+
+  const fetchPredictions = async (cursor?: string | null) => {
+    try {
+      const page = await fetchPage<any>("predictions", "/admin/predictions/", cursor);
+      if (page) {
+        setPredictions(prev => (cursor ? [...prev, ...page.results] : page.results));
       }
     } catch (error) {
       console.error("Error fetching predictions:", error);
@@ -260,21 +339,15 @@ const AdminPanel: React.FC = () => {
     }
   };
 
-  const fetchSystemLogs = async () => {
+  const fetchSystemLogs = async (cursor?: string | null) => {
     try {
-      const res = await fetch(`${API}/admin/logs/`, {
-        headers: {
-          Authorization: `Bearer ${token}`,
-        },
-      });
-
-      if (!res.ok) {
+      const page = await fetchPage<any>("logs", "/admin/logs/", cursor);
+      if (!page) {
         console.error("Failed to fetch system logs");
         return;
       }
 
-      const data = await res.json();
-      setLogs(data);
+      setLogs(prev => (cursor ? [...prev, ...page.results] : page.results));
     } catch (err) {
       console.error("System logs fetch error", err);
     }
@@ -287,13 +360,11 @@ const AdminPanel: React.FC = () => {
     if (tab === "predictions") fetchPredictions();
   }, [tab]);
 
-  const fetchFeedbacks = async () => {
+  const fetchFeedbacks = async (cursor?: string | null) => {
     try {
-      const res = await fetch(`${API}/admin/feedback/`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      if (res.ok) {
-        setFeedbacks(await res.json());
+      const page = await fetchPage<any>("feedback", "/admin/feedback/", cursor);
+      if (page) {
+        setFeedbacks(prev => (cursor ? [...prev, ...page.results] : page.results));
       }
     } catch (e) {
       console.error("Failed to fetch feedback");
@@ -317,6 +388,7 @@ const AdminPanel: React.FC = () => {
     if (res.ok) {
       showToast("User flagged successfully", "success");
       fetchUsers();
+      if (showFlagHistory) fetchFlaggedUsers();
 
       // ⭐ REQUIRED
       refreshUserData();
@@ -335,6 +407,7 @@ const AdminPanel: React.FC = () => {
     if (res.ok) {
       showToast("User unflagged successfully", "success");
       fetchUsers();
+      if (showFlagHistory) fetchFlaggedUsers();
 
       // ⭐ REQUIRED
       refreshUserData();
@@ -869,6 +942,39 @@ const AdminPanel: React.FC = () => {
 
                 </div>
                 <div className="dashboard-card-content">
+                  <div style={{ display: "flex", gap: 12, flexWrap: "wrap", marginBottom: 16 }}>
+                    <input
+                      type="search"
+                      placeholder="Search email or name..."
+                      value={userFilters.q}
+                      onChange={(e) => setUserFilters({ ...userFilters, q: e.target.value })}
+                    />
+                    <select
+                      value={userFilters.role}
+                      onChange={(e) => setUserFilters({ ...userFilters, role: e.target.value })}
+                    >
+                      <option value="">
+                        All roles{userFacets ? ` (${userFacets.count})` : ""}
+                      </option>
+                      {Object.entries(userFacets?.facets.role ?? { student: 0, admin: 0 }).map(([role, count]) => (
+                        <option key={role} value={role}>
+                          {role}{userFacets ? ` (${count})` : ""}
+                        </option>
+                      ))}
+                    </select>
+                    <select
+                      value={userFilters.is_flagged}
+                      onChange={(e) => setUserFilters({ ...userFilters, is_flagged: e.target.value })}
+                    >
+                      <option value="">Any status</option>
+                      <option value="true">
+                        Flagged{userFacets ? ` (${userFacets.facets.is_flagged.true})` : ""}
+                      </option>
+                      <option value="false">
+                        Active{userFacets ? ` (${userFacets.facets.is_flagged.false})` : ""}
+                      </option>
+                    </select>
+                  </div>
                   {users.length > 0 ? (
                     <table className="dashboard-table">
                       <thead>
@@ -946,11 +1052,12 @@ const AdminPanel: React.FC = () => {
                   ) : (
                     <div style={{ textAlign: 'center', padding: '50px' }}>
                       <p>No user data available</p>
-                      <button className="signup-submit-btn" onClick={fetchUsers}>
+                      <button className="signup-submit-btn" onClick={() => fetchUsers()}>
                         Load Users
                       </button>
                     </div>
                   )}
+                  {renderLoadMore("users", fetchUsers)}
                 </div>
               </div>
             )}
@@ -962,11 +1069,10 @@ const AdminPanel: React.FC = () => {
                 </div>
 
                 <div className="dashboard-card-content">
-                  {users.filter(u => u.is_flagged).length === 0 ? (
+                  {flaggedUsers.length === 0 ? (
                     <p style={{ color: "#9ca3af" }}>No flagged users found.</p>
                   ) : (
-                    users
-                      .filter(u => u.is_flagged)
+                    flaggedUsers
                       .map((u) => (
                         <div
                           key={u.id}
@@ -1127,6 +1233,7 @@ const AdminPanel: React.FC = () => {
                       <p>No system logs available</p>
                     </div>
                   )}
+                  {renderLoadMore("logs", fetchSystemLogs)}
                 </div>
               </div>
             )}
@@ -1197,6 +1304,7 @@ const AdminPanel: React.FC = () => {
                       <p>No prediction logs available</p>
                     </div>
                   )}
+                  {renderLoadMore("predictions", fetchPredictions)}
                 </div>
               </div>
             )}
@@ -1208,6 +1316,23 @@ const AdminPanel: React.FC = () => {
                 </div>
 
                 <div className="dashboard-card-content">
+                  <div style={{ display: "flex", gap: 12, flexWrap: "wrap", marginBottom: 16 }}>
+                    <input
+                      type="search"
+                      placeholder="Search tickets..."
+                      value={ticketFilters.q}
+                      onChange={(e) => setTicketFilters({ ...ticketFilters, q: e.target.value })}
+                    />
+                    <select
+                      value={ticketFilters.status}
+                      disabled={!ticketFilters.q.trim()}
+                      onChange={(e) => setTicketFilters({ ...ticketFilters, status: e.target.value })}
+                    >
+                      <option value="">All statuses</option>
+                      <option value="open">Open</option>
+                      <option value="resolved">Resolved</option>
+                    </select>
+                  </div>
                   {supportTickets.length === 0 ? (
                     <p style={{ color: "#777" }}>No support tickets found.</p>
                   ) : (
@@ -1273,6 +1398,7 @@ const AdminPanel: React.FC = () => {
                       </div>
                     ))
                   )}
+                  {renderLoadMore("support", fetchSupportTickets)}
                 </div>
               </div>
             )}
@@ -1311,6 +1437,7 @@ const AdminPanel: React.FC = () => {
                         </tbody>
                       </table>
                     )}
+                    {renderLoadMore("feedback", fetchFeedbacks)}
                   </div>
                 </div>
               )